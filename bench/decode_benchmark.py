@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+응답 디코딩 벤치마크 - 응답 바이트 -> 파싱 결과까지 매물 1건당 CPU 시간과 메모리 할당 비교
+  json  : response.json()과 같은 json.loads + dict 추출 (기존 경로)
+  orjson: orjson.loads + dict 추출
+  typed : msgspec Struct 디코딩 + 속성 추출 (명세에 없는 키/섹션은 객체를 만들지 않음)
+
+사용법:
+  python bench/decode_benchmark.py [--articles 300] [--repeat 5]
+  python bench/decode_benchmark.py --responses "test/api_response_*.json"   # 저장된 실제 응답 사용
+"""
+
+import argparse
+import glob
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from parsers.article_parser import ArticleParser
+from parsers.field_spec import SECTION_EXTRACTORS
+from parsers.response_decoder import DECODERS, HAS_MSGSPEC, HAS_ORJSON, decode_response
+from bench.synthetic import make_article_detail, make_list_page
+
+
+def load_detail_bodies(pattern: str, articles: int):
+    """(article_no, 응답 바이트) 목록 - 저장된 응답 파일이 없으면 합성 응답"""
+    bodies = []
+    for path in sorted(glob.glob(pattern)) if pattern else []:
+        raw = Path(path).read_bytes()
+        article_no = str(json.loads(raw).get('articleDetail', {}).get('articleNo', Path(path).stem))
+        bodies.append((article_no, raw))
+    if not bodies:
+        for i in range(articles):
+            article_no = str(2500000000 + i)
+            bodies.append((article_no, json.dumps(make_article_detail(article_no), ensure_ascii=False).encode('utf-8')))
+    return bodies
+
+
+def known_sections(parsed):
+    """명세에 있는 섹션만 (dict 경로는 모르는 섹션을 그대로 보관, typed 경로는 버림)"""
+    return {name: section for name, section in parsed['sections'].items() if name in SECTION_EXTRACTORS}
+
+
+def available_decoders():
+    return [name for name in DECODERS
+            if name == 'json' or (name == 'orjson' and HAS_ORJSON) or (name == 'typed' and HAS_MSGSPEC)]
+
+
+def run_details(decoder: str, bodies, parser: ArticleParser):
+    return [parser.parse_article_detail(decode_response(body, 'detail', decoder), article_no)
+            for article_no, body in bodies]
+
+
+def run_lists(decoder: str, bodies):
+    rows = 0
+    for body in bodies:
+        response = decode_response(body, 'list', decoder)
+        rows += len([row for row in response['articleList'] if row.get('articleNo')])
+    return rows
+
+
+def measure(func, repeat: int):
+    """(최소 CPU 시간, tracemalloc 기준 최대 메모리, 할당 블록 수)"""
+    best_cpu = float('inf')
+    for _ in range(repeat):
+        start = time.process_time()
+        func()
+        best_cpu = min(best_cpu, time.process_time() - start)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = func()  # 결과를 유지한 상태의 메모리 (배치 저장 전까지 들고 있는 것과 같음)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename') if stat.count_diff > 0)
+    del result
+    return best_cpu, peak, blocks
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='응답 디코딩 경로별 CPU/할당 비교')
+    arg_parser.add_argument('--articles', type=int, default=300)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    arg_parser.add_argument('--responses', help='저장된 상세 응답 JSON 파일 glob')
+    args = arg_parser.parse_args()
+
+    bodies = load_detail_bodies(args.responses, args.articles)
+    list_bodies = [
+        json.dumps(make_list_page('1168010100', page, [str(2500000000 + page * 20 + i) for i in range(20)]),
+                   ensure_ascii=False).encode('utf-8')
+        for page in range(max(1, len(bodies) // 20))
+    ]
+    decoders = available_decoders()
+    parser = ArticleParser()
+
+    # 알고 있는 섹션의 파싱 결과가 디코더와 무관하게 같은지 먼저 확인
+    baseline = run_details('json', bodies[:20], parser)
+    for decoder in decoders[1:]:
+        for expected, actual in zip(baseline, run_details(decoder, bodies[:20], parser)):
+            if known_sections(expected) != known_sections(actual):
+                print(f"❌ {decoder} 파싱 결과 불일치: {expected['article_no']}")
+                sys.exit(1)
+
+    print(f"📊 상세 응답 {len(bodies)}건 (평균 {sum(len(b) for _, b in bodies) // len(bodies):,} bytes), "
+          f"목록 {len(list_bodies)}페이지, {args.repeat}회 중 최솟값")
+    if len(decoders) < len(DECODERS):
+        print(f"   (설치되지 않은 디코더 제외: {', '.join(set(DECODERS) - set(decoders))})")
+
+    print("\n   [상세: 디코딩+파싱]   CPU µs/매물   최대 메모리 KB/매물   할당 블록/매물")
+    for decoder in decoders:
+        cpu, peak, blocks = measure(lambda: run_details(decoder, bodies, parser), args.repeat)
+        print(f"   {decoder:8s}              {cpu / len(bodies) * 1e6:10.1f}   "
+              f"{peak / len(bodies) / 1024:18.1f}   {blocks / len(bodies):14.0f}")
+
+    print("\n   [목록: 디코딩]        CPU µs/행")
+    total_rows = len(list_bodies) * 20
+    for decoder in decoders:
+        cpu, _, _ = measure(lambda: run_lists(decoder, list_bodies), args.repeat)
+        print(f"   {decoder:8s}              {cpu / total_rows * 1e6:10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+로컬 모의 네이버 부동산 서버 - 부하/장애 테스트용
+new.land.naver.com/api/articles(목록)와 /api/articles/<번호>(상세)를 합성 응답으로 제공하고
+응답 지연 분포, 429 속도 제한, 토큰 만료(401), 깨진 섹션을 옵션으로 재현
+
+사용법:
+  python bench/mock_naver_server.py --port 8765 --rate-limit 5 --token-ttl 60 --malformed-rate 0.02
+  NAVER_API_BASE_URL=http://127.0.0.1:8765/api NAVER_TOKEN_SOURCE=mock NAVER_REQUEST_DELAY_MIN=0 NAVER_REQUEST_DELAY_MAX=0 \\
+      python main.py --area 1168010100
+
+모의 서버 전용 경로:
+  /api/regions/list?cortarNo=  지역 트리 (서울시 -> 강남구/서초구 -> 동, 목록은 --cortars 지역만 제공)
+  /api/mock/token              토큰 발급 (collectors/mock_token_collector.py가 사용)
+  /api/mock/stats              요청/상태코드 통계
+  /api/mock/mutate?fraction=   매물 일부의 가격을 바꿈 (변경 감지 테스트)
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import settings
+from bench.synthetic import make_article_detail, make_list_page, make_list_row
+from services.list_filter import parse_list_price
+
+MALFORMED_MODES = ('null_section', 'wrong_type', 'missing_section', 'truncated')
+
+# 목록 쿼리 범위 필터 (행 값: 면적 area1 ㎡, 가격 dealOrWarrantPrc 만원)
+RANGE_FILTERS = {'area': ('areaMin', 'areaMax'), 'price': ('priceMin', 'priceMax')}
+
+# 매물 유형 코드 -> 이름 (합성 매물 중 sg_fraction 비율은 상가)
+REAL_ESTATE_TYPE_NAMES = {'SMS': '사무실', 'SG': '상가'}
+
+# 지역 트리: 상위 코드 -> [(코드, 이름, 종류)], 강남구 동은 설정의 동 코드
+SEOCHO_DONGS = {'방배동': '1165010100', '양재동': '1165010200', '우면동': '1165010300',
+                '잠원동': '1165010600', '반포동': '1165010700', '서초동': '1165010800'}
+REGION_TREE = {
+    '0000000000': [('1100000000', '서울시', 'city')],
+    '1100000000': [('1168000000', '강남구', 'dvsn'), ('1165000000', '서초구', 'dvsn')],
+    '1168000000': [(code, name, 'sec') for name, code in settings.gangnam_districts.items()],
+    '1165000000': [(code, name, 'sec') for name, code in SEOCHO_DONGS.items()]
+}
+
+
+def region_list(cortar_no: str) -> Dict:
+    return {'regionList': [{'cortarNo': code, 'cortarName': name, 'cortarType': cortar_type,
+                            'centerLat': 37.5, 'centerLon': 127.04}
+                           for code, name, cortar_type in REGION_TREE.get(cortar_no, [])]}
+
+
+def parse_latency_spec(spec: str) -> Callable[[random.Random], float]:
+    """
+    지연 분포 문자열 -> (rng -> 초) 함수
+    none | fixed:0.1 | uniform:0.05,0.3 | lognormal:중앙값,sigma (긴 꼬리 - 실제 API와 비슷)
+    """
+    if spec in (None, '', 'none'):
+        return lambda rng: 0.0
+    kind, _, args = spec.partition(':')
+    values = [float(value) for value in args.split(',') if value]
+    if kind == 'fixed' and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == 'uniform' and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == 'lognormal' and len(values) == 2:
+        mu = math.log(values[0])
+        return lambda rng: rng.lognormvariate(mu, values[1])
+    raise ValueError(f"알 수 없는 지연 분포: {spec} (none / fixed:s / uniform:a,b / lognormal:median,sigma)")
+
+
+class TokenBucket:
+    """초당 rate개, 최대 burst개까지 허용하는 속도 제한"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class MockNaverState:
+    """모의 서버 상태 - 지역별 매물, 매물 버전(가격 변경), 발급 토큰, 통계 (핸들러 스레드 공용)"""
+
+    def __init__(self, config: Dict):
+        self.config = config
+        self.rng = random.Random(config['seed'])
+        self.latency = parse_latency_spec(config['latency'])
+        self.bucket = TokenBucket(config['rate_limit_rps'], config['rate_limit_burst']) \
+            if config['rate_limit_rps'] > 0 else None
+        self.articles: Dict[str, List[str]] = {
+            cortar_no: [str(2600000000 + index * 100000 + i) for i in range(config['articles_per_cortar'])]
+            for index, cortar_no in enumerate(config['cortars'])
+        }
+        self.known_articles = {no for article_nos in self.articles.values() for no in article_nos}
+        # 동일주소 묶음: same_addr_rate 비율의 매물은 바로 앞 매물과 같은 주소(좌표) -> 대표 매물 번호
+        self.representatives: Dict[str, str] = {}
+        for article_nos in self.articles.values():
+            for index, no in enumerate(article_nos):
+                same_as_previous = index and random.Random(f"{config['seed']}:addr:{no}").random() < config['same_addr_rate']
+                self.representatives[no] = self.representatives[article_nos[index - 1]] if same_as_previous else no
+        self._coords: Dict[str, tuple] = {}
+        self.article_types = {no: 'SG' if random.Random(f"{config['seed']}:type:{no}").random() < config['sg_fraction']
+                              else 'SMS' for no in self.known_articles}
+        self.versions: Dict[str, int] = {}
+        self.tokens: Dict[str, float] = {}
+        self.stats = Counter()
+        self._row_facts: Dict[tuple, Dict] = {}
+        self._lock = threading.Lock()
+
+    def random(self) -> float:
+        with self._lock:
+            return self.rng.random()
+
+    def sample_latency(self) -> float:
+        with self._lock:
+            return self.latency(self.rng)
+
+    def count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def issue_token(self) -> Dict:
+        token = uuid.uuid4().hex
+        ttl = self.config['token_ttl']
+        with self._lock:
+            self.tokens[token] = time.monotonic() + ttl if ttl > 0 else math.inf
+            self.stats['tokens_issued'] += 1
+        return {'token': token, 'expires_in': ttl or None}
+
+    def is_authorized(self, authorization: Optional[str]) -> bool:
+        if self.config['token_ttl'] <= 0:
+            return True
+        if not authorization or not authorization.startswith('Bearer '):
+            return False
+        with self._lock:
+            expires_at = self.tokens.get(authorization[len('Bearer '):])
+        return expires_at is not None and time.monotonic() < expires_at
+
+    def mutate(self, fraction: float) -> int:
+        """매물 중 fraction 비율의 버전을 올림 (목록/상세 가격이 바뀜)"""
+        with self._lock:
+            article_nos = sorted(self.known_articles)
+            changed = self.rng.sample(article_nos, int(len(article_nos) * fraction))
+            for article_no in changed:
+                self.versions[article_no] = self.versions.get(article_no, 0) + 1
+        return len(changed)
+
+    def coords(self, article_no: str) -> tuple:
+        """목록/상세의 위경도 문자열 (동일주소 묶음은 대표 매물 좌표)"""
+        representative = self.representatives.get(article_no, article_no)
+        with self._lock:
+            if representative not in self._coords:
+                row = make_list_row(representative, random.Random(f"{self.config['seed']}:{representative}"))
+                self._coords[representative] = (row['latitude'], row['longitude'])
+            return self._coords[representative]
+
+    def row_facts(self, article_no: str) -> Dict:
+        """목록 행의 위경도/면적/가격(만원) - 합성 행과 같은 시드로 계산해 범위/구간 조회에 사용"""
+        with self._lock:
+            version = self.versions.get(article_no, 0)
+            key = (article_no, version)
+            cached = self._row_facts.get(key)
+        if cached:
+            return cached
+        latitude, longitude = self.coords(article_no)
+        row = make_list_row(article_no, random.Random(f"{self.config['seed']}:{article_no}"), version)
+        with self._lock:
+            if key not in self._row_facts:
+                self._row_facts[key] = {
+                    'lat': float(latitude),
+                    'lon': float(longitude),
+                    'area': row['area1'],
+                    'price': parse_list_price(row['dealOrWarrantPrc']) // 10_000
+                }
+            return self._row_facts[key]
+
+    def list_page(self, cortar_no: str, page: int, order: str, bounds: Optional[tuple] = None,
+                  filters: Optional[Dict] = None) -> Dict:
+        """
+        bounds: (남, 서, 북, 동) - 지도 범위 조회처럼 범위 안 매물만 (경계는 남/서쪽 포함)
+        filters: areaMin/areaMax/priceMin/priceMax (상하한 포함), realEstateType (SMS:SG처럼 ':'로 여러 유형),
+                 sameAddressGroup (true면 동일주소 묶음마다 첫 매물만, sameAddrCnt = 조건에 맞는 묶음 매물 수)
+        """
+        article_nos = self.articles.get(cortar_no, [])
+        types = set((filters or {}).get('realEstateType', 'SMS').split(':'))
+        article_nos = [no for no in article_nos if self.article_types[no] in types]
+        if bounds:
+            south, west, north, east = bounds
+            article_nos = [no for no in article_nos
+                           if south <= self.row_facts(no)['lat'] < north and west <= self.row_facts(no)['lon'] < east]
+        for field, (min_param, max_param) in RANGE_FILTERS.items():
+            if filters and (min_param in filters or max_param in filters):
+                low = float(filters.get(min_param, 0))
+                high = float(filters.get(max_param, math.inf))
+                article_nos = [no for no in article_nos if low <= self.row_facts(no)[field] <= high]
+        group_counts = Counter(self.representatives[no] for no in article_nos)
+        if str((filters or {}).get('sameAddressGroup', '')).lower() == 'true':
+            firsts = {}
+            for no in article_nos:
+                firsts.setdefault(self.representatives[no], no)
+            article_nos = [no for no in article_nos if firsts[self.representatives[no]] == no]
+        if order == 'dateDesc':
+            article_nos = article_nos[::-1]
+        page_size = self.config['page_size']
+        start = (page - 1) * page_size
+        page_nos = article_nos[start:start + page_size]
+        with self._lock:
+            versions = {no: self.versions[no] for no in page_nos if no in self.versions}
+        body = make_list_page(cortar_no, page, page_nos, seed=self.config['seed'],
+                              is_more_data=start + page_size < len(article_nos), versions=versions)
+        body['mapExposedCount'] = len(article_nos)
+        for row in body['articleList']:
+            type_code = self.article_types[row['articleNo']]
+            latitude, longitude = self.coords(row['articleNo'])
+            row.update(realEstateTypeCode=type_code, realEstateTypeName=REAL_ESTATE_TYPE_NAMES[type_code],
+                       latitude=latitude, longitude=longitude)
+            if self.config['same_addr_rate']:
+                row['sameAddrCnt'] = group_counts[self.representatives[row['articleNo']]]
+        return body
+
+    def article_detail(self, article_no: str) -> Optional[Dict]:
+        if article_no not in self.known_articles:
+            return None
+        with self._lock:
+            version = self.versions.get(article_no, 0)
+        body = make_article_detail(article_no, seed=self.config['seed'], version=version)
+        type_code = self.article_types[article_no]
+        latitude, longitude = self.coords(article_no)
+        body['articleDetail'].update(realestateTypeCode=type_code, realestateTypeName=REAL_ESTATE_TYPE_NAMES[type_code],
+                                     latitude=latitude, longitude=longitude)
+        body['articleAddition']['sameAddrHash'] = f"hash{self.representatives[article_no]}"
+        if self.config['same_addr_rate']:
+            # 같은 주소 매물은 같은 건물 (건축물대장 PK도 대표 매물 기준)
+            body['articleBuildingRegister']['mgmBldrgstPk'] = f"11680-{int(self.representatives[article_no]) % 300:06d}"
+        return body
+
+    def malform(self, body: Dict) -> bytes:
+        """상세 응답 1건을 무작위 방식으로 깨뜨림"""
+        with self._lock:
+            mode = self.rng.choice(MALFORMED_MODES)
+            section = self.rng.choice(sorted(body))
+            self.stats[f"malformed_{mode}"] += 1
+        if mode == 'null_section':
+            body[section] = None
+        elif mode == 'wrong_type':
+            body[section] = 'malformed'
+        elif mode == 'missing_section':
+            del body[section]
+        encoded = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        return encoded[:len(encoded) // 2] if mode == 'truncated' else encoded
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return dict(self.stats)
+
+
+class MockNaverHandler(BaseHTTPRequestHandler):
+    state: MockNaverState = None
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 출력하지 않음 (통계는 /api/mock/stats)
+
+    def _send(self, status: int, body, content_type: str = 'application/json;charset=UTF-8'):
+        if not isinstance(body, bytes):
+            body = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.state.count(f"status_{status}")
+
+    def do_GET(self):
+        state = self.state
+        parsed = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        path = parsed.path.rstrip('/')
+
+        if path.startswith('/api/mock/'):
+            return self._handle_mock(path, params)
+
+        state.count('requests')
+        # 속도 제한/인증 실패는 실제 서버처럼 지연 없이 바로 응답
+        if state.bucket and not state.bucket.allow():
+            return self._send(429, {'code': 'TOO_MANY_REQUESTS', 'message': 'rate limited'})
+        if state.config['error_429_rate'] and state.random() < state.config['error_429_rate']:
+            return self._send(429, {'code': 'TOO_MANY_REQUESTS', 'message': 'random rate limit'})
+        if not state.is_authorized(self.headers.get('Authorization')):
+            return self._send(401, {'code': 'UNAUTHORIZED', 'message': 'token expired'})
+
+        time.sleep(state.sample_latency())
+
+        if path == '/api/articles':
+            state.count('list_requests')
+            bounds = None
+            if 'bottomLat' in params:
+                bounds = tuple(float(params[key]) for key in ('bottomLat', 'leftLon', 'topLat', 'rightLon'))
+            body = state.list_page(params.get('cortarNo', ''), int(params.get('page', 1)),
+                                   params.get('order', 'rank'), bounds, params)
+            return self._send(200, body)
+        if path == '/api/regions/list':
+            state.count('region_requests')
+            return self._send(200, region_list(params.get('cortarNo', '')))
+        if path.startswith('/api/articles/'):
+            state.count('detail_requests')
+            body = state.article_detail(path.rsplit('/', 1)[1])
+            if body is None:
+                return self._send(404, {'code': 'NOT_FOUND', 'message': 'article not found'})
+            if state.config['malformed_rate'] and state.random() < state.config['malformed_rate']:
+                return self._send(200, state.malform(body))
+            return self._send(200, body)
+        return self._send(404, {'code': 'NOT_FOUND', 'message': path})
+
+    def _handle_mock(self, path: str, params: Dict):
+        if path == '/api/mock/token':
+            return self._send(200, self.state.issue_token())
+        if path == '/api/mock/stats':
+            return self._send(200, self.state.get_stats())
+        if path == '/api/mock/mutate':
+            return self._send(200, {'changed': self.state.mutate(float(params.get('fraction', 0.1)))})
+        return self._send(404, {'code': 'NOT_FOUND', 'message': path})
+
+
+class MockNaverServer:
+    """
+    모의 서버 실행기 (백그라운드 스레드)
+    설정값은 settings.mock_server_settings, 키워드 인자로 덮어씀 (port=0이면 빈 포트 자동 선택)
+    """
+
+    def __init__(self, **overrides):
+        unknown = set(overrides) - set(settings.mock_server_settings)
+        if unknown:
+            raise ValueError(f"알 수 없는 모의 서버 설정: {', '.join(sorted(unknown))}")
+        self.config = {**settings.mock_server_settings, **overrides}
+        self.state = MockNaverState(self.config)
+        handler = type('BoundMockNaverHandler', (MockNaverHandler,), {'state': self.state})
+        self.httpd = ThreadingHTTPServer((self.config['host'], self.config['port']), handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_base_url(self) -> str:
+        """NAVER_API_BASE_URL에 넣을 주소"""
+        return f"{self.url}/api"
+
+    def start(self) -> 'MockNaverServer':
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> 'MockNaverServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    defaults = settings.mock_server_settings
+    parser = argparse.ArgumentParser(description='로컬 모의 네이버 부동산 서버')
+    parser.add_argument('--host', default=defaults['host'])
+    parser.add_argument('--port', type=int, default=defaults['port'])
+    parser.add_argument('--cortars', nargs='+', default=defaults['cortars'], help='목록을 제공할 지역 코드')
+    parser.add_argument('--articles-per-cortar', type=int, default=defaults['articles_per_cortar'])
+    parser.add_argument('--latency', default=defaults['latency'],
+                        help='none / fixed:s / uniform:a,b / lognormal:median,sigma')
+    parser.add_argument('--rate-limit', type=float, default=defaults['rate_limit_rps'], help='초당 허용 요청 수 (0=무제한)')
+    parser.add_argument('--burst', type=int, default=defaults['rate_limit_burst'])
+    parser.add_argument('--error-429-rate', type=float, default=defaults['error_429_rate'])
+    parser.add_argument('--token-ttl', type=float, default=defaults['token_ttl'], help='토큰 유효시간 초 (0=인증 없음)')
+    parser.add_argument('--malformed-rate', type=float, default=defaults['malformed_rate'])
+    parser.add_argument('--same-addr-rate', type=float, default=defaults['same_addr_rate'],
+                        help='바로 앞 매물과 같은 주소인 매물 비율 (동일주소 묶음)')
+    parser.add_argument('--sg-fraction', type=float, default=defaults['sg_fraction'], help='상가(SG) 매물 비율')
+    parser.add_argument('--seed', type=int, default=defaults['seed'])
+    args = parser.parse_args()
+
+    server = MockNaverServer(
+        host=args.host, port=args.port, cortars=args.cortars, articles_per_cortar=args.articles_per_cortar,
+        latency=args.latency, rate_limit_rps=args.rate_limit, rate_limit_burst=args.burst,
+        error_429_rate=args.error_429_rate, token_ttl=args.token_ttl, malformed_rate=args.malformed_rate,
+        sg_fraction=args.sg_fraction, same_addr_rate=args.same_addr_rate, seed=args.seed
+    )
+    print(f"🧪 모의 네이버 서버: {server.api_base_url} "
+          f"(지역 {len(args.cortars)}개 x 매물 {args.articles_per_cortar}개, 지연 {args.latency})")
+    print(f"   NAVER_API_BASE_URL={server.api_base_url} NAVER_TOKEN_SOURCE=mock 으로 수집기를 연결하세요")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n📊 {json.dumps(server.state.get_stats(), ensure_ascii=False)}")
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
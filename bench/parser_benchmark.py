@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+ArticleParser 마이크로벤치마크 - 매물 1건 파싱 시간 비교
+  legacy : 필드마다 _safe_extract를 호출하던 기존 ArticleParser 방식 (명세를 실행 시점에 해석)
+  compiled: field_spec에서 import 시점에 컴파일된 섹션 전용 추출 함수
+
+사용법: python bench/parser_benchmark.py [--articles 500] [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from parsers.article_parser import ArticleParser
+from parsers.field_spec import FIELD_SPECS, POST_PROCESSORS, Nested, ListOf
+from bench.synthetic import make_article_detail
+
+
+class LegacyParser(ArticleParser):
+    """필드마다 _safe_extract를 호출하는 기존 파싱 경로 재현 (비교 기준)"""
+
+    def _safe_extract(self, data, key, data_type=str, default=None):
+        try:
+            value = data.get(key, default)
+            if value is None or (isinstance(value, str) and value == ''):
+                return default
+
+            if data_type == str:
+                return str(value).strip() if value is not None else default
+            elif data_type == int:
+                if isinstance(value, (int, float)):
+                    return int(value)
+                elif isinstance(value, str) and value.replace('-', '').replace('.', '').isdigit():
+                    return int(float(value))
+                else:
+                    return default
+            elif data_type == float:
+                if isinstance(value, (int, float)):
+                    return float(value)  # 0.0도 유효한 값으로 처리
+                elif isinstance(value, str) and value.replace('-', '').replace('.', '').isdigit():
+                    return float(value)
+                else:
+                    return default
+            elif data_type == bool:
+                return bool(value)
+            elif data_type == list:
+                return list(value) if isinstance(value, list) else default
+            else:
+                return value
+
+        except (ValueError, TypeError, AttributeError):
+            return default
+
+    def _extract(self, spec_name, data):
+        section = {}
+        for key, target, kind, default in FIELD_SPECS[spec_name]:
+            if key is None:
+                section[target] = default
+            elif isinstance(kind, Nested):
+                section[target] = self._extract(kind.spec_name, data.get(key, {}) or {})
+            elif isinstance(kind, ListOf):
+                section[target] = [self._extract(kind.spec_name, item) for item in data.get(key, []) or []]
+            else:
+                section[target] = self._safe_extract(data, key, kind, default)
+        if spec_name in POST_PROCESSORS:
+            POST_PROCESSORS[spec_name](section)
+        return section
+
+    def parse_article_detail(self, raw_data, article_no):
+        parsed = {'article_no': article_no, 'sections': {}}
+        for section_name, section_data in raw_data.items():
+            if not section_data:
+                continue
+            if section_name == 'articlePhotos':
+                photos = [self._extract('photo', photo) for photo in section_data]
+                photos = [photo for photo in photos if photo['url']]
+                parsed['sections'][section_name] = {'photos': photos, 'total_count': len(photos)}
+            elif section_name in FIELD_SPECS:
+                parsed['sections'][section_name] = self._extract(section_name, section_data)
+            else:
+                parsed['sections'][section_name] = section_data
+        self._fill_cross_section_data(parsed['sections'])
+        return parsed
+
+
+def time_parser(parser, responses, repeat: int) -> float:
+    """가장 빠른 반복의 매물 1건당 파싱 시간 (마이크로초)"""
+    return time_parser_with(parser.parse_article_detail, responses, repeat)
+
+
+def time_parser_with(parse, responses, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for article_no, raw in responses:
+            parse(raw, article_no)
+        best = min(best, time.perf_counter() - start)
+    return best / len(responses) * 1_000_000
+
+
+def retained_bytes(build, responses) -> float:
+    """파싱 결과를 모두 들고 있을 때의 매물 1건당 메모리 (처리 중인 매물이 차지하는 양)"""
+    tracemalloc.start()
+    results = [build(raw, article_no) for article_no, raw in responses]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return current / len(responses)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='ArticleParser 파싱 속도 비교')
+    arg_parser.add_argument('--articles', type=int, default=500)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    responses = [(str(2500000000 + i), make_article_detail(str(2500000000 + i))) for i in range(args.articles)]
+
+    legacy, compiled = LegacyParser(), ArticleParser()
+
+    # 두 경로의 결과가 같은지 먼저 확인
+    for article_no, raw in responses[:20]:
+        expected = legacy.parse_article_detail(raw, article_no)['sections']
+        actual = compiled.parse_article_detail(raw, article_no)['sections']
+        if expected != actual:
+            print(f"❌ 파싱 결과 불일치: {article_no}")
+            sys.exit(1)
+
+    legacy_us = time_parser(legacy, responses, args.repeat)
+    compiled_us = time_parser(compiled, responses, args.repeat)
+
+    print(f"📊 매물 {args.articles}건 x {args.repeat}회 (최솟값 기준)")
+    print(f"   legacy  : {legacy_us:8.1f} µs/매물")
+    print(f"   compiled: {compiled_us:8.1f} µs/매물")
+    print(f"   개선    : {legacy_us / compiled_us:.2f}배")
+
+    record_us = time_parser_with(compiled.parse_article_record, responses, args.repeat)
+    dict_bytes = retained_bytes(compiled.parse_article_detail, responses)
+    record_bytes = retained_bytes(compiled.parse_article_record, responses)
+    print(f"\n   섹션 dict 결과 : {compiled_us:8.1f} µs/매물, {dict_bytes / 1024:6.1f} KB/매물 보유")
+    print(f"   ArticleRecord  : {record_us:8.1f} µs/매물, {record_bytes / 1024:6.1f} KB/매물 보유")
+
+
+if __name__ == '__main__':
+    main()
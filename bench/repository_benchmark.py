@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+저장소 벤치마크 - 메모리 DB(FakeSupabaseClient)로 매물 1건 저장당 DB 왕복 수/바이트/시간 측정
+  신규        : 빈 DB에 save_property
+  변경 없음   : 같은 매물을 다시 save_property (수집 주기 반복)
+  일부 변경   : --changed 비율만큼 가격을 바꿔 save_property
+  일괄 갱신   : bulk_update_properties (재파싱 백필 경로)
+
+사용법:
+  python bench/repository_benchmark.py [--articles 300] [--changed 0.1] [--latency 0.02]
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.fake_supabase import FakeSupabaseClient
+from database.optimized_repository import OptimizedPropertyRepository
+from database.property_rows import build_property_row
+from parsers.article_parser import ArticleParser
+from bench.synthetic import make_article_detail
+
+
+def build_records(article_nos, versions=None):
+    parser = ArticleParser()
+    versions = versions or {}
+    return [parser.parse_article_record(make_article_detail(no, version=versions.get(no, 0)), no)
+            for no in article_nos]
+
+
+def measure(name: str, client: FakeSupabaseClient, articles: int, run) -> dict:
+    client.reset_stats()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # 저장소의 매물별 출력 제외
+        run()
+    elapsed = time.perf_counter() - start
+    stats = client.get_stats()
+    operations = {key: value for key, value in stats.items() if '.' in key}
+    return {
+        'name': name,
+        'round_trips': stats.get('round_trips', 0) / articles,
+        'request_kb': stats.get('request_bytes', 0) / articles / 1024,
+        'response_kb': stats.get('response_bytes', 0) / articles / 1024,
+        'ms': elapsed / articles * 1000,
+        'operations': operations,
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='저장소 DB 왕복/바이트 벤치마크 (메모리 DB)')
+    arg_parser.add_argument('--articles', type=int, default=300)
+    arg_parser.add_argument('--changed', type=float, default=0.1, help='일부 변경 단계에서 가격을 바꿀 비율')
+    arg_parser.add_argument('--latency', type=float, default=0.0, help='DB 요청 1회당 지연 (초)')
+    args = arg_parser.parse_args()
+
+    article_nos = [str(2500000000 + i) for i in range(args.articles)]
+    changed = set(article_nos[::max(1, round(1 / args.changed))]) if args.changed else set()
+
+    client = FakeSupabaseClient(latency=args.latency)
+    repository = OptimizedPropertyRepository(client=client)
+    records = build_records(article_nos)
+    unchanged_records = build_records(article_nos)  # 저장 시 change_detected가 기록되므로 별도 레코드
+    changed_records = build_records(article_nos, {no: 1 for no in changed})
+
+    results = [
+        measure('신규', client, args.articles,
+                lambda: [repository.save_property(record) for record in records]),
+        measure('변경 없음', client, args.articles,
+                lambda: [repository.save_property(record) for record in unchanged_records]),
+        measure(f"일부 변경 ({len(changed)}건)", client, args.articles,
+                lambda: [repository.save_property(record) for record in changed_records]),
+        measure('일괄 갱신', client, args.articles,
+                lambda: repository.bulk_update_properties([build_property_row(r) for r in records])),
+    ]
+
+    print(f"📊 매물 {args.articles}건, DB 요청당 지연 {args.latency}초 (매물 1건당)")
+    print(f"   {'단계':<16}{'왕복':>8}{'요청 KB':>10}{'응답 KB':>10}{'ms':>9}")
+    for result in results:
+        print(f"   {result['name']:<16}{result['round_trips']:8.2f}{result['request_kb']:10.2f}"
+              f"{result['response_kb']:10.2f}{result['ms']:9.2f}")
+    for result in results:
+        top = sorted(result['operations'].items(), key=lambda item: -item[1])[:6]
+        print(f"\n   {result['name']}: " + ', '.join(f"{op} {count / args.articles:.2f}" for op, count in top))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+벤치마크용 합성 네이버 부동산 응답 생성기
+실제 API 응답과 같은 섹션/키 구조(사용하지 않는 키와 섹션 포함)를 결정적으로 생성
+"""
+
+import random
+from typing import Dict, List, Any, Tuple
+
+TRADE_TYPES = [('B2', '월세'), ('B1', '전세'), ('A1', '매매')]
+BUILDING_TYPES = ['중소형사무실', '대형사무실', '지식산업센터']
+STATIONS = [('2호선', '역삼역'), ('2호선', '강남역'), ('9호선', '언주역'), ('분당선', '선릉역')]
+
+
+def _price_text(man_won: int) -> str:
+    """만원 단위 금액을 목록 API 문자열로 ("1억 5,000", "3,000")"""
+    eok, rest = divmod(man_won, 10000)
+    if eok and rest:
+        return f"{eok}억 {rest:,}"
+    if eok:
+        return f"{eok}억"
+    return f"{rest:,}"
+
+
+def _list_prices(rng: random.Random, version: int) -> Tuple[int, int]:
+    """보증금, 월세 (만원 단위 - 목록/상세 API 모두 만원 단위)"""
+    deposit = rng.choice([1000, 3000, 5000, 10000, 20000]) + version * 500
+    rent = rng.choice([150, 300, 500, 800, 1200]) + version * 10
+    return deposit, rent
+
+
+def make_list_row(article_no: str, rng: random.Random, version: int = 0) -> Dict[str, Any]:
+    """목록 API articleList 항목 1개"""
+    trade_code, trade_name = rng.choice(TRADE_TYPES)
+    deposit, rent = _list_prices(rng, version)
+    floor = rng.randint(1, 20)
+    return {
+        'articleNo': article_no,
+        'articleName': f"합성빌딩{int(article_no) % 300}",
+        'articleStatus': 'R0',
+        'realEstateTypeCode': 'SMS',
+        'realEstateTypeName': '사무실',
+        'tradeTypeCode': trade_code,
+        'tradeTypeName': trade_name,
+        'verificationTypeCode': 'OWNER',
+        'floorInfo': f"{floor}/{floor + rng.randint(0, 10)}",
+        'dealOrWarrantPrc': _price_text(deposit),
+        'rentPrc': str(rent) if trade_code == 'B2' else '',
+        'area1': rng.randint(50, 900),
+        'area2': rng.randint(30, 600),
+        'direction': rng.choice(['남향', '동향', '서향', '북향']),
+        'articleConfirmYmd': f"202609{rng.randint(1, 28):02d}",
+        'articleFeatureDesc': rng.choice(['역세권 사무실', '대로변 코너', '인테리어 완비', '']),
+        'tagList': rng.sample(['역세권', '주차가능', '신축', '대로변', '즉시입주'], 2),
+        'buildingName': f"합성빌딩{int(article_no) % 300}",
+        'sameAddrCnt': rng.randint(1, 5),
+        'sameAddrDirectCnt': 0,
+        'sameAddrMaxPrc': _price_text(deposit + 1000),
+        'sameAddrMinPrc': _price_text(deposit),
+        'cpid': 'bizmk',
+        'realtorName': f"합성공인중개사{rng.randint(1, 50)}",
+        'latitude': f"{37.49 + rng.random() * 0.02:.7f}",
+        'longitude': f"{127.02 + rng.random() * 0.03:.7f}",
+        'isPriceModification': False,
+        'detailAddress': '',
+    }
+
+
+def make_list_page(cortar_no: str, page: int, article_nos: List[str], seed: int = 0,
+                   is_more_data: bool = True, versions: Dict[str, int] = None) -> Dict[str, Any]:
+    """목록 API 응답 1페이지"""
+    versions = versions or {}
+    rows = [make_list_row(no, random.Random(f"{seed}:{no}"), versions.get(no, 0)) for no in article_nos]
+    return {
+        'isMoreData': is_more_data,
+        'mapExposedCount': len(article_nos),
+        'nonMapExposedIncluded': False,
+        'articleList': rows,
+    }
+
+
+def make_article_detail(article_no: str, seed: int = 0, version: int = 0, photo_count: int = 10) -> Dict[str, Any]:
+    """상세 API 응답 (사용하지 않는 키/섹션 포함)"""
+    rng = random.Random(f"{seed}:{article_no}")
+    row = make_list_row(article_no, random.Random(f"{seed}:{article_no}"), version)
+    floor, total_floor = row['floorInfo'].split('/')
+    building_pk = f"11680-{int(article_no) % 300:06d}"
+    # 상세 가격은 목록 행과 같은 값 (같은 시드로 목록 행과 같은 순서로 뽑음)
+    price_rng = random.Random(f"{seed}:{article_no}")
+    price_rng.choice(TRADE_TYPES)
+    deposit, rent = _list_prices(price_rng, version)
+    if row['tradeTypeCode'] != 'B2':
+        rent = 0
+
+    return {
+        'articleDetail': {
+            'articleNo': article_no,
+            'articleName': row['articleName'],
+            'realestateTypeCode': 'SMS',
+            'realestateTypeName': '사무실',
+            'tradeTypeCode': row['tradeTypeCode'],
+            'tradeTypeName': row['tradeTypeName'],
+            'floorLayerName': '일반',
+            'buildingTypeName': rng.choice(BUILDING_TYPES),
+            'moveInPossibleYmd': 'NOW',
+            'monthlyManagementCost': rng.randint(10, 200) * 10000,
+            'tagList': row['tagList'],
+            'latitude': row['latitude'],
+            'longitude': row['longitude'],
+            'lawUsage': '업무시설',
+            'exposureAddress': '서울시 강남구 역삼동',
+            'detailAddress': '',
+            'detailDescription': '합성 매물 설명입니다. ' * rng.randint(3, 20),
+            'parkingCount': rng.randint(0, 200),
+            'parkingPossibleYN': rng.choice(['Y', 'N']),
+            'walkingTimeToNearSubway': rng.randint(1, 15),
+            'moveInTypeName': '즉시입주',
+            'bathroomCount': str(rng.randint(1, 4)),
+            'householdCount': str(rng.randint(1, 10)),
+            'articleConfirmYMD': row['articleConfirmYmd'],
+            'exposeStartYMD': '20260901',
+            'exposeEndYMD': '20261201',
+            'cortarNo': '1168010100',
+            'isInterest': False,
+            'roomCount': '0',
+            'principalUse': '사무소',
+            'isDirectTrade': False,
+            'aptName': None,
+            'cpName': '매경부동산',
+        },
+        'articleAddition': {
+            'sameAddrDirectCnt': 0,
+            'sameAddrHash': f"hash{int(article_no) % 300}",
+            'prcPerSpace': f"{rng.randint(5, 50)}만",
+            'prcInfo': {'lowerPrcCnt': rng.randint(0, 9), 'samePrcCnt': rng.randint(0, 9), 'higherPrcCnt': rng.randint(0, 9)},
+            'articleConfirmYmd': row['articleConfirmYmd'],
+            'representativeImgUrl': f"/{article_no}/rep.jpg",
+            'sameAddrCnt': row['sameAddrCnt'],
+        },
+        'articleFacility': {
+            'subwayList': [
+                {'subwayName': line, 'stationName': station, 'distance': rng.randint(100, 900),
+                 'walkingTime': rng.randint(1, 15), 'subwayCode': '2'}
+                for line, station in rng.sample(STATIONS, 2)
+            ],
+            'airconFacilities': ['개별냉방'],
+            'securityFacilities': ['CCTV', '경비실'],
+            'etcFacilities': ['엘리베이터'] if rng.random() < 0.9 else [],
+            'directionTypeName': row['direction'],
+            'heatMethodTypeName': '개별난방',
+            'buildingUseAprvYmd': '20050315',
+            'lifeFacilities': ['편의점', '은행'],
+        },
+        'articleFloor': {
+            'totalFloorCount': int(total_floor),
+            'correspondingFloorCount': floor,
+            'undergroundFloorCount': '3',
+            'uppergroundFloorCount': total_floor,
+        },
+        'articlePrice': {
+            'dealPrice': 0,
+            'warrantPrice': deposit,
+            'rentPrice': rent,
+            'priceBySpace': rng.randint(10, 80) * 1000.0,
+            'allWarrantPrice': deposit,
+            'allRentPrice': rent,
+            'financePrice': 0,
+            'premiumPrice': 0,
+            'isalePrice': 0,
+        },
+        'articleRealtor': {
+            'realtorId': f"realtor{rng.randint(1, 50)}",
+            'realtorName': row['realtorName'],
+            'address': '서울시 강남구 테헤란로',
+            'representativeTelNo': '02-000-0000',
+            'cellPhoneNo': '010-0000-0000',
+            'establishRegistrationNo': '11680-2020-00000',
+        },
+        'articleSpace': {
+            'supplySpace': float(row['area1']),
+            'exclusiveSpace': float(row['area2']),
+            'groundShareSpace': 0.0,
+            'totalSpace': float(row['area1']),
+            'buildingSpace': 0.0,
+            'groundSpace': 0.0,
+            'expectSpace': 0.0,
+            'exclusiveRate': '65',
+        },
+        'articleTax': {
+            'acquisitionTax': 0,
+            'brokerFee': rent * 0.009,
+            'registFee': 0.0,
+            'registTax': 0.0,
+            'totalPrice': deposit,
+            'maxBrokerFee': rent * 0.009,
+        },
+        'articlePhotos': [
+            {'imageSrc': f"/{article_no}/{index}.jpg", 'thumbnailUrl': f"/{article_no}/{index}_t.jpg",
+             'smallCategoryName': '내부', 'imageOrder': index, 'imageType': 'IMAGE',
+             'imageId': f"{article_no}-{index}", 'registYmdt': '20260901120000', 'imageKey': f"k{index}"}
+            for index in range(photo_count)
+        ],
+        'articleBuildingRegister': {
+            'mgmBldrgstPk': building_pk,
+            'regstrKindCdNm': '일반건축물',
+            'platArea': 1200.5,
+            'archArea': 700.2,
+            'bcRat': 58.3,
+            'totArea': 15000.0,
+            'vlRat': 799.5,
+            'strctCdNm': '철근콘크리트구조',
+            'mainPurpsCdNm': '업무시설',
+            'grndFlrCnt': int(total_floor),
+            'ugrndFlrCnt': 3,
+            'totalElvtCnt': rng.randint(0, 8),
+            'elvtInfo': '승용 4대',
+            'indrAutoUtcnt': rng.randint(0, 150),
+            'oudrAutoUtcnt': rng.randint(0, 10),
+            'etcParkInfo': '',
+            'useAprDay': '20050315',
+        },
+        'articleOneroom': None,
+        'landPrice': {'landPriceList': [{'year': 2025, 'price': 50000000}]},
+        'articleBrokerage': {'brokerageFee': 0, 'note': '합성'},
+    }
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+수집 처리량 벤치마크 - CollectionService.collect_and_save_area 전체 경로를 로컬에서 실행
+  네이버: 모의 서버(bench/mock_naver_server.py, 합성 목록/상세 응답)
+  카카오: 고정 지연의 스텁 지오코더 (좌표마다 합성 주소)
+  DB    : 메모리 DB (database/fake_supabase.py), 매물 상태는 임시 SQLite
+
+워크로드 (같은 DB/상태를 이어서 사용):
+  cold       : 빈 DB에 전체 수집
+  no_change  : 변경 없이 다시 전체 수집
+  changed_10 : 매물 10% 가격 변경 후 다시 전체 수집
+
+지표 (워크로드별): 초당 매물 수, 매물당 네이버/카카오 요청 수, 매물당 DB 왕복 수, 매물 1건 처리 p95(ms), 최대 RSS(MB)
+기준값보다 허용 오차 이상 나빠지면 종료 코드 1 (요청/왕복 수는 결정적이라 오차를 작게, 시간 지표는 크게)
+
+사용법:
+  python bench/throughput_benchmark.py                      # 기준값(bench/baselines/throughput.json)과 비교
+  python bench/throughput_benchmark.py --save-baseline      # 현재 결과를 기준값으로 저장
+  python bench/throughput_benchmark.py --articles 400 --workers 4 --naver-latency lognormal:0.05,0.5
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench.mock_naver_server import MockNaverServer
+from collectors.cassette import CassetteResponse
+from database.fake_supabase import FakeSupabaseClient
+
+BASELINE_PATH = Path(__file__).parent / 'baselines' / 'throughput.json'
+WORKLOADS = ('cold', 'no_change', 'changed_10')
+
+# 지표: (좋은 방향, 오차 종류) - count 지표는 --count-tolerance, time 지표는 --tolerance 적용
+METRICS = {
+    'articles_per_sec': ('higher', 'time'),
+    'naver_requests_per_article': ('lower', 'count'),
+    'kakao_requests_per_article': ('lower', 'count'),
+    'db_round_trips_per_article': ('lower', 'count'),
+    'p95_article_ms': ('lower', 'time'),
+    'peak_rss_mb': ('lower', 'time'),
+}
+
+
+class StubGeocoderSession:
+    """카카오 coord2address 스텁 - AddressService.session 대체 (요청 수 집계)"""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    def get(self, url: str, params: Dict = None, **kwargs) -> CassetteResponse:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        number = int(float(params['x']) * 10000) % 900 + 1
+        document = {
+            'road_address': {'address_name': f"서울 강남구 테헤란로 {number}", 'road_name': '테헤란로',
+                             'main_building_no': str(number), 'building_name': f"합성빌딩{number}", 'zone_no': '06234'},
+            'address': {'address_name': f"서울 강남구 역삼동 {number}", 'region_1depth_name': '서울',
+                        'region_2depth_name': '강남구', 'region_3depth_name': '역삼동',
+                        'main_address_no': str(number), 'sub_address_no': ''},
+        }
+        return CassetteResponse(200, json.dumps({'documents': [document]}, ensure_ascii=False), url)
+
+
+def peak_rss_mb() -> float:
+    # 리눅스 ru_maxrss 단위는 KB (모의 서버가 같은 프로세스에서 돌므로 포함됨)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def build_service(server: MockNaverServer, db: FakeSupabaseClient, geocoder: StubGeocoderSession, state_dir: str):
+    from collectors.naver_api_client import NaverAPIClient
+    from database.listing_state import ListingStateStore
+    from database.optimized_repository import OptimizedPropertyRepository
+    from services.address_service import AddressService
+    from services.collection_service import CollectionService
+
+    address_service = AddressService()
+    address_service.session = geocoder
+    return CollectionService(
+        api_client=NaverAPIClient(api_base_url=server.api_base_url, token_source='mock'),
+        repository=OptimizedPropertyRepository(client=db),
+        address_service=address_service,
+        listing_state=ListingStateStore(os.path.join(state_dir, 'listing_state.db'))
+    )
+
+
+def run_workload(service, server: MockNaverServer, db: FakeSupabaseClient, geocoder: StubGeocoderSession,
+                 cortars: List[str]) -> Dict[str, float]:
+    latencies = []
+    collect_single_article = service.collect_single_article
+
+    def timed_collect(article_no: str, quiet: bool = False) -> bool:
+        start = time.perf_counter()
+        try:
+            return collect_single_article(article_no, quiet)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    service.collect_single_article = timed_collect
+    naver_before = server.state.get_stats().get('requests', 0)
+    kakao_before = geocoder.calls
+    db_before = db.get_stats().get('round_trips', 0)
+
+    start = time.perf_counter()
+    processed = 0
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            for cortar_no in cortars:
+                processed += service.collect_and_save_area(cortar_no)['total_found']
+    finally:
+        service.collect_single_article = collect_single_article
+    elapsed = time.perf_counter() - start
+
+    articles = max(processed, 1)
+    return {
+        'articles': processed,
+        'articles_per_sec': processed / elapsed,
+        'naver_requests_per_article': (server.state.get_stats().get('requests', 0) - naver_before) / articles,
+        'kakao_requests_per_article': (geocoder.calls - kakao_before) / articles,
+        'db_round_trips_per_article': (db.get_stats().get('round_trips', 0) - db_before) / articles,
+        'p95_article_ms': (statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1
+                           else sum(latencies)) * 1000,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def run_suite(args, cortars: List[str]) -> Dict[str, Dict[str, float]]:
+    """새 모의 서버/DB/상태로 워크로드를 순서대로 1회 실행"""
+    db = FakeSupabaseClient(latency=args.db_latency)
+    geocoder = StubGeocoderSession(latency=args.kakao_latency)
+    results = {}
+    with MockNaverServer(port=0, cortars=cortars, articles_per_cortar=args.articles // args.cortars,
+                         latency=args.naver_latency) as server, tempfile.TemporaryDirectory() as state_dir:
+        service = build_service(server, db, geocoder, state_dir)
+        for workload in WORKLOADS:
+            if workload == 'changed_10':
+                server.state.mutate(0.1)
+            results[workload] = run_workload(service, server, db, geocoder, cortars)
+    return results
+
+
+def best_of(previous: Dict, current: Dict) -> Dict:
+    """반복 실행 중 지표별 최고값 (시간 지표의 잡음 완화)"""
+    if not previous:
+        return current
+    merged = {}
+    for workload, metrics in current.items():
+        merged[workload] = dict(metrics)
+        for metric, (direction, _) in METRICS.items():
+            pick = max if direction == 'higher' else min
+            merged[workload][metric] = pick(previous[workload][metric], metrics[metric])
+    return merged
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float, count_tolerance: float) -> List[str]:
+    """기준값 대비 허용 오차를 넘게 나빠진 지표 목록"""
+    regressions = []
+    for workload, metrics in results.items():
+        expected = baseline.get(workload, {})
+        for metric, (direction, kind) in METRICS.items():
+            if metric not in expected or not expected[metric]:
+                continue
+            allowed = count_tolerance if kind == 'count' else tolerance
+            change = (metrics[metric] - expected[metric]) / expected[metric]
+            if (direction == 'higher' and change < -allowed) or (direction == 'lower' and change > allowed):
+                regressions.append(f"{workload}.{metric}: {expected[metric]:.3f} -> {metrics[metric]:.3f} "
+                                   f"({change * 100:+.1f}%, 허용 {allowed * 100:.0f}%)")
+    return regressions
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='수집 처리량 벤치마크 (모의 네이버/스텁 카카오/메모리 DB)')
+    arg_parser.add_argument('--articles', type=int, default=200, help='워크로드당 매물 수 (지역별로 나눔)')
+    arg_parser.add_argument('--cortars', type=int, default=2, help='지역 수')
+    arg_parser.add_argument('--workers', type=int, default=4, help='parallel_workers')
+    arg_parser.add_argument('--naver-latency', default='fixed:0.01', help='모의 서버 지연 분포')
+    arg_parser.add_argument('--kakao-latency', type=float, default=0.002, help='스텁 지오코더 지연 (초)')
+    arg_parser.add_argument('--db-latency', type=float, default=0.002, help='DB 요청 1회당 지연 (초)')
+    arg_parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (지표별 최고값 사용)')
+    arg_parser.add_argument('--keep-delays', action='store_true', help='설정의 요청 간격/배치 휴식 유지 (기본: 0)')
+    arg_parser.add_argument('--baseline', default=str(BASELINE_PATH))
+    arg_parser.add_argument('--save-baseline', action='store_true', help='현재 결과를 기준값으로 저장')
+    arg_parser.add_argument('--tolerance', type=float, default=0.25, help='시간/메모리 지표 허용 악화 비율')
+    arg_parser.add_argument('--count-tolerance', type=float, default=0.05, help='요청/왕복 수 허용 증가 비율')
+    args = arg_parser.parse_args()
+
+    # 설정은 매번 환경변수를 읽으므로 구성요소 생성 전에 지정
+    os.environ['NAVER_PARALLEL_WORKERS'] = str(args.workers)
+    os.environ['NAVER_CASSETTE_MODE'] = 'off'
+    os.environ['NAVER_ARCHIVE_ENABLED'] = 'false'
+    os.environ.setdefault('KAKAO_REST_API_KEY', 'bench-stub')
+    if not args.keep_delays:
+        os.environ['NAVER_REQUEST_DELAY_MIN'] = '0'
+        os.environ['NAVER_REQUEST_DELAY_MAX'] = '0'
+        os.environ['NAVER_BATCH_PAUSE'] = '0'
+
+    cortars = [str(1168010100 + index * 100) for index in range(args.cortars)]
+    config = {
+        'articles': args.articles, 'cortars': args.cortars, 'workers': args.workers,
+        'naver_latency': args.naver_latency, 'kakao_latency': args.kakao_latency,
+        'db_latency': args.db_latency, 'keep_delays': args.keep_delays, 'repeat': args.repeat
+    }
+
+    results = {}
+    for _ in range(args.repeat):
+        results = best_of(results, run_suite(args, cortars))
+
+    print(f"📊 수집 처리량 ({', '.join(f'{k}={v}' for k, v in config.items())})")
+    print(f"   {'workload':<12}{'매물':>6}{'매물/초':>9}{'네이버/매물':>12}{'카카오/매물':>12}"
+          f"{'DB/매물':>9}{'p95 ms':>9}{'RSS MB':>9}")
+    for workload, metrics in results.items():
+        print(f"   {workload:<12}{metrics['articles']:>6}{metrics['articles_per_sec']:9.1f}"
+              f"{metrics['naver_requests_per_article']:12.2f}{metrics['kakao_requests_per_article']:12.2f}"
+              f"{metrics['db_round_trips_per_article']:9.2f}{metrics['p95_article_ms']:9.1f}"
+              f"{metrics['peak_rss_mb']:9.1f}")
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps({'config': config, 'results': results}, indent=2, ensure_ascii=False) + '\n',
+                                 encoding='utf-8')
+        print(f"💾 기준값 저장: {baseline_path}")
+        return
+
+    if not baseline_path.exists():
+        print(f"⚠️ 기준값 없음: {baseline_path} (--save-baseline으로 생성)")
+        return
+    baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+    if baseline.get('config') != config:
+        print(f"⚠️ 기준값과 실행 조건이 다릅니다: {baseline.get('config')}")
+
+    regressions = compare(results, baseline['results'], args.tolerance, args.count_tolerance)
+    if regressions:
+        print("❌ 성능 회귀:")
+        for line in regressions:
+            print(f"   {line}")
+        sys.exit(1)
+    print("✅ 기준값 대비 회귀 없음")
+
+
+if __name__ == '__main__':
+    main()
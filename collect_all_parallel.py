@@ -8,30 +8,28 @@ import subprocess
 import sys
 import time
 from datetime import datetime
+from pathlib import Path
 import threading
 
+# 스크립트별 출력은 파이프로 한 줄씩 중계하지 않고 각자의 로그 파일로 바로 기록
+LOG_DIR = Path("logs")
+
 def run_script(script_name, label):
     """개별 스크립트 실행 함수"""
     
     print(f"[{label}] 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    log_path = LOG_DIR / f"{Path(script_name).stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.out"
+    print(f"[{label}] 로그: {log_path} (지역별 수집 로그는 {LOG_DIR}/*.log, *.jsonl)")
+    
     try:
-        # 스크립트 실행
-        process = subprocess.Popen(
-            [sys.executable, script_name],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True
-        )
-        
-        # 실시간 출력
-        for line in process.stdout:
-            print(f"[{label}] {line}", end='')
-        
-        # 프로세스 종료 대기
-        return_code = process.wait()
+        # 스크립트 실행 (출력은 로그 파일로)
+        with open(log_path, 'a', encoding='utf-8') as log_file:
+            process = subprocess.Popen([sys.executable, script_name], stdout=log_file, stderr=subprocess.STDOUT)
+            
+            # 프로세스 종료 대기
+            return_code = process.wait()
         
         if return_code == 0:
             print(f"[{label}] 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
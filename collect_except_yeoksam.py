@@ -8,6 +8,10 @@ import subprocess
 import sys
 import time
 from datetime import datetime
+from pathlib import Path
+
+# 자식 프로세스 출력은 파이프로 한 줄씩 중계하지 않고 파일로 바로 기록
+LOG_DIR = Path("logs")
 
 # 역삼동을 제외한 강남구 전체 지역 (우선순위 순)
 AREAS_EXCEPT_YEOKSAM = [
@@ -36,30 +40,25 @@ def collect_area(area_info):
     print(f"지역 코드: {area_code}, 우선순위: {area_info['priority']}")
     print("-"*40)
     
-    # 수집 명령어
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    log_path = LOG_DIR / f"{area_code}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    
+    # 수집 명령어 (구조화 로그는 같은 이름의 .jsonl)
     cmd = [
         sys.executable, "main.py",
         "--area", area_code,
-        "--max-pages", "100"  # 모든 페이지 수집
+        "--max-pages", "100",  # 모든 페이지 수집
+        "--log-file", str(log_path.with_suffix('.jsonl'))
     ]
     
     try:
-        # 수집 프로세스 실행
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True
-        )
-        
-        # 실시간 출력
-        for line in process.stdout:
-            print(f"[{area_name}] {line}", end='')
-        
-        # 프로세스 종료 대기
-        return_code = process.wait()
+        # 수집 프로세스 실행 (출력은 로그 파일로)
+        print(f"로그: {log_path}")
+        with open(log_path, 'a', encoding='utf-8') as log_file:
+            process = subprocess.Popen(cmd, stdout=log_file, stderr=subprocess.STDOUT)
+            
+            # 프로세스 종료 대기
+            return_code = process.wait()
         
         if return_code == 0:
             print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {area_name} 수집 완료")
@@ -73,10 +73,10 @@ while true; do
     log_message "수집 사이클 #$CYCLE_COUNT 시작"
     echo -e "${YELLOW}----------------------------------------${NC}"
     
-    # 병렬 수집 실행
+    # 병렬 수집 실행 (출력은 tee로 중계하지 않고 로그 파일로 바로 기록, 진행 확인: tail -f "$LOG_FILE")
     START_TIME=$(date +%s)
     
-    if python3 collect_all_parallel.py 2>&1 | tee -a "$LOG_FILE"; then
+    if python3 collect_all_parallel.py >> "$LOG_FILE" 2>&1; then
         END_TIME=$(date +%s)
         DURATION=$((END_TIME - START_TIME))
         
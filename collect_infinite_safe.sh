@@ -18,6 +18,9 @@ LOG_FILE="$LOG_DIR/collect_infinite_$(date +%Y%m%d).log"
 
 # 수집 간격 설정 (초 단위)
 WAIT_BETWEEN_CYCLES=300  # 5분 대기
+WAIT_BETWEEN_DISCOVERY=60  # 신규 매물 탐색 사이클 후 1분 대기
+FULL_SWEEP_EVERY=6       # 6사이클마다 전체(랭킹순) 수집, 나머지는 최신순 신규 매물 탐색
+DISCOVERY_TIMEOUT=1800   # 탐색 사이클 최대 실행 시간 (30분)
 WAIT_ON_ERROR=600        # 오류 시 10분 대기
 MEMORY_CHECK_INTERVAL=5  # 5사이클마다 메모리 체크
 
@@ -138,7 +141,7 @@ echo -e "${YELLOW}   네이버 부동산 무한 반복 수집 스크립트${NC}"
 echo -e "${YELLOW}          (메모리 관리 기능 포함)${NC}"
 echo -e "${YELLOW}================================================${NC}"
 log_message "무한 반복 수집 시작 (메모리 관리 활성화)"
-log_info "수집 간격: ${WAIT_BETWEEN_CYCLES}초"
+log_info "수집 간격: ${WAIT_BETWEEN_CYCLES}초 (탐색 사이클 ${WAIT_BETWEEN_DISCOVERY}초, 전체 수집 ${FULL_SWEEP_EVERY}사이클마다)"
 log_info "오류 시 대기: ${WAIT_ON_ERROR}초"
 log_info "메모리 임계값: RAM ${MEMORY_THRESHOLD}%, Swap ${SWAP_THRESHOLD}%"
 echo ""
@@ -162,15 +165,29 @@ while true; do
         fi
     fi
     
-    # 병렬 수집 실행
+    # 사이클 종류 결정: 첫 사이클과 FULL_SWEEP_EVERY 사이클마다 전체 수집
+    if [ $(( (CYCLE_COUNT - 1) % FULL_SWEEP_EVERY )) -eq 0 ]; then
+        CYCLE_KIND="전체 수집"
+        CYCLE_TIMEOUT=7200
+        CYCLE_WAIT=$WAIT_BETWEEN_CYCLES
+        CYCLE_CMD="python3 collect_all_parallel.py"
+    else
+        CYCLE_KIND="신규 매물 탐색"
+        CYCLE_TIMEOUT=$DISCOVERY_TIMEOUT
+        CYCLE_WAIT=$WAIT_BETWEEN_DISCOVERY
+        CYCLE_CMD="python3 main.py --priority --deadline $((DISCOVERY_TIMEOUT - 60)) --log-file $LOG_DIR/discovery_$(date +%Y%m%d).jsonl"
+    fi
+    log_info "사이클 종류: $CYCLE_KIND"
+    
     START_TIME=$(date +%s)
     
-    # timeout 명령어로 최대 실행 시간 제한 (2시간)
-    if timeout 7200 python3 collect_all_parallel.py 2>&1 | tee -a "$LOG_FILE"; then
+    # timeout 명령어로 최대 실행 시간 제한 (전체 수집 2시간, 탐색 30분)
+    # 출력은 tee로 중계하지 않고 로그 파일로 바로 기록 (파이프 없이 종료 코드도 수집 명령 그대로)
+    if timeout $CYCLE_TIMEOUT $CYCLE_CMD >> "$LOG_FILE" 2>&1; then
         END_TIME=$(date +%s)
         DURATION=$((END_TIME - START_TIME))
         
-        log_message "수집 사이클 #$CYCLE_COUNT 완료 (소요시간: ${DURATION}초)"
+        log_message "수집 사이클 #$CYCLE_COUNT ($CYCLE_KIND) 완료 (소요시간: ${DURATION}초)"
         
         # 메모리 상태 확인
         if ! check_memory; then
@@ -179,21 +196,21 @@ while true; do
         fi
         
         # 정상 완료 시 대기
-        log_info "다음 사이클까지 ${WAIT_BETWEEN_CYCLES}초 대기..."
+        log_info "다음 사이클까지 ${CYCLE_WAIT}초 대기..."
         
         # 대기 중 진행률 표시
-        for ((i=WAIT_BETWEEN_CYCLES; i>0; i--)); do
+        for ((i=CYCLE_WAIT; i>0; i--)); do
             printf "\r대기 중: %3d초 남음" $i
             sleep 1
         done
         printf "\r                        \r"
         
     else
-        ERROR_COUNT=$((ERROR_COUNT + 1))
         EXIT_CODE=$?
+        ERROR_COUNT=$((ERROR_COUNT + 1))
         
         if [ $EXIT_CODE -eq 124 ]; then
-            log_error "수집 사이클 #$CYCLE_COUNT 시간 초과 (2시간)"
+            log_error "수집 사이클 #$CYCLE_COUNT ($CYCLE_KIND) 시간 초과 (${CYCLE_TIMEOUT}초)"
         else
             log_error "수집 사이클 #$CYCLE_COUNT 실패 (종료코드: $EXIT_CODE, 오류 횟수: $ERROR_COUNT)"
         fi
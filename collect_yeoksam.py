@@ -8,6 +8,10 @@ import subprocess
 import sys
 import time
 from datetime import datetime
+from pathlib import Path
+
+# 자식 프로세스 출력은 파이프로 한 줄씩 중계하지 않고 파일로 바로 기록
+LOG_DIR = Path("logs")
 
 def main():
     """역삼동 매물 수집 메인 함수"""
@@ -17,30 +21,25 @@ def main():
     print("지역 코드: 1168010100")
     print("="*60)
     
-    # 역삼동 수집 명령어
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    log_path = LOG_DIR / f"yeoksam_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    
+    # 역삼동 수집 명령어 (구조화 로그는 같은 이름의 .jsonl)
     cmd = [
         sys.executable, "main.py",
         "--area", "1168010100",
-        "--max-pages", "100"  # 모든 페이지 수집
+        "--max-pages", "100",  # 모든 페이지 수집
+        "--log-file", str(log_path.with_suffix('.jsonl'))
     ]
     
     try:
-        # 수집 프로세스 실행
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True
-        )
-        
-        # 실시간 출력
-        for line in process.stdout:
-            print(f"[역삼동] {line}", end='')
-        
-        # 프로세스 종료 대기
-        return_code = process.wait()
+        # 수집 프로세스 실행 (출력은 로그 파일로)
+        print(f"로그: {log_path}")
+        with open(log_path, 'a', encoding='utf-8') as log_file:
+            process = subprocess.Popen(cmd, stdout=log_file, stderr=subprocess.STDOUT)
+            
+            # 프로세스 종료 대기
+            return_code = process.wait()
         
         if return_code == 0:
             print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 역삼동 수집 완료")
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+HTTP 녹화/재생 (카세트)
+record: 실제 요청을 보내고 요청/응답/응답시간을 JSONL 카세트에 기록
+replay: 네트워크 없이 카세트의 응답을 돌려줌 (지연 없음 / 원래 응답시간 / 배율 적용)
+
+같은 요청이 여러 번 기록되어 있으면 기록 순서대로 돌려주고, 다 쓰면 마지막 응답을 반복
+요청 헤더(토큰, API 키)는 기록하지 않음
+"""
+
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from config.settings import settings
+
+CASSETTE_MODES = ('off', 'record', 'replay')
+
+
+class CassetteMissError(LookupError):
+    """재생 모드에서 카세트에 없는 요청"""
+
+
+class CassetteResponse:
+    """재생용 응답 - NaverAPIClient/AddressService가 쓰는 requests.Response 속성만 제공"""
+
+    def __init__(self, status_code: int, body: str, url: str):
+        self.status_code = status_code
+        self.text = body
+        self.content = body.encode('utf-8')
+        self.url = url
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+def _request_key(service: str, url: str, params: Optional[Dict]) -> str:
+    return json.dumps([service, url, sorted((str(k), str(v)) for k, v in (params or {}).items())],
+                      ensure_ascii=False)
+
+
+def parse_latency(value: str) -> Optional[float]:
+    """재생 지연 설정 -> 원래 응답시간에 곱할 배율 ('none' -> None, 'original' -> 1.0, '0.5' -> 0.5)"""
+    if value in (None, '', 'none'):
+        return None
+    if value == 'original':
+        return 1.0
+    return float(value)
+
+
+class Cassette:
+    def __init__(self, path: str, mode: str, latency_scale: Optional[float] = None):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"카세트 모드는 record 또는 replay: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        self._interactions = defaultdict(deque)
+        self._last = {}
+        self.stats = {'recorded': 0, 'replayed': 0, 'misses': 0}
+
+        if mode == 'replay':
+            self._load()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _load(self):
+        if not self.path.exists():
+            raise FileNotFoundError(f"카세트 파일이 없습니다: {self.path}")
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    interaction = json.loads(line)
+                    key = _request_key(interaction['service'], interaction['url'], interaction['params'])
+                    self._interactions[key].append(interaction)
+        print(f"📼 카세트 재생: {self.path} ({sum(len(q) for q in self._interactions.values())}건)")
+
+    def record(self, service: str, url: str, params: Optional[Dict], status_code: int, body: str, elapsed: float):
+        interaction = {
+            'service': service,
+            'url': url,
+            'params': {str(k): v for k, v in (params or {}).items()},
+            'status': status_code,
+            'elapsed': round(elapsed, 4),
+            'recorded_at': time.time(),
+            'body': body
+        }
+        line = json.dumps(interaction, ensure_ascii=False, default=str)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+            self.stats['recorded'] += 1
+
+    def next_interaction(self, service: str, url: str, params: Optional[Dict]) -> Dict:
+        key = _request_key(service, url, params)
+        with self._lock:
+            queue = self._interactions.get(key)
+            if queue:
+                interaction = queue.popleft()
+                self._last[key] = interaction
+            elif key in self._last:
+                interaction = self._last[key]
+            else:
+                self.stats['misses'] += 1
+                raise CassetteMissError(f"카세트에 없는 요청: {service} {url} {params}")
+            self.stats['replayed'] += 1
+        return interaction
+
+
+class CassetteSession:
+    """requests.Session.get 대체 - 서비스별로 하나씩 (네이버, 카카오)"""
+
+    def __init__(self, cassette: Cassette, service: str, session=None):
+        self.cassette = cassette
+        self.service = service
+        self.session = session
+
+    def get(self, url: str, params: Dict = None, **kwargs):
+        if self.cassette.mode == 'replay':
+            interaction = self.cassette.next_interaction(self.service, url, params)
+            if self.cassette.latency_scale:
+                time.sleep(interaction['elapsed'] * self.cassette.latency_scale)
+            return CassetteResponse(interaction['status'], interaction['body'], url)
+
+        start = time.perf_counter()
+        response = self.session.get(url, params=params, **kwargs)
+        elapsed = time.perf_counter() - start
+        self.cassette.record(self.service, url, params, response.status_code,
+                             response.content.decode('utf-8', errors='replace'), elapsed)
+        return response
+
+
+_cassettes: Dict[Tuple[str, str], Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_default_cassette() -> Optional[Cassette]:
+    """설정(NAVER_CASSETTE_MODE/PATH/LATENCY)에 따른 공용 카세트, off면 None"""
+    config = settings.cassette_settings
+    mode = config['mode']
+    if mode not in CASSETTE_MODES:
+        raise ValueError(f"알 수 없는 카세트 모드: {mode} (가능: {', '.join(CASSETTE_MODES)})")
+    if mode == 'off':
+        return None
+
+    key = (config['path'], mode)
+    with _cassettes_lock:
+        if key not in _cassettes:
+            _cassettes[key] = Cassette(config['path'], mode, parse_latency(config['latency']))
+        return _cassettes[key]
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+모의 서버용 토큰 수집기 (NAVER_TOKEN_SOURCE=mock)
+브라우저 없이 모의 서버(bench/mock_naver_server.py)의 /api/mock/token에서 토큰을 받음
+"""
+
+import logging
+import requests
+from typing import Dict, Optional
+from monitoring.metrics import mark_token_collected
+
+logger = logging.getLogger(__name__)
+
+
+class MockTokenCollector:
+    """NaverTokenCollector와 같은 인터페이스"""
+
+    def __init__(self, api_base_url: str):
+        self.token_url = f"{api_base_url.rstrip('/')}/mock/token"
+        self.session = requests.Session()
+        self.token = None
+        self.cookies = {}
+
+    def collect_token_from_page(self) -> Optional[Dict]:
+        try:
+            response = self.session.get(self.token_url, timeout=10)
+            if response.status_code != 200:
+                logger.error("❌ 모의 서버 토큰 발급 실패: %s", response.status_code)
+                return None
+            token_data = response.json()
+        except Exception as e:
+            logger.error("❌ 모의 서버 토큰 발급 실패: %s", e)
+            return None
+        self.token = token_data['token']
+        mark_token_collected()
+        return {'token': self.token, 'jwt_token': self.token, 'cookies': self.cookies, 'auth_type': 'mock'}
+
+    def get_headers_with_token(self) -> Dict[str, str]:
+        if not self.token:
+            self.collect_token_from_page()
+        headers = {'Accept': 'application/json, text/plain, */*'}
+        if self.token:
+            headers['Authorization'] = f"Bearer {self.token}"
+        return headers
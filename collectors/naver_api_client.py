@@ -3,20 +3,68 @@
 네이버 부동산 API 클라이언트
 """
 
+import hashlib
+import json
+import logging
 import requests
 import random
+import threading
 import time
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from config.settings import settings
 from collectors.token_collector import NaverTokenCollector
+from collectors.mock_token_collector import MockTokenCollector
+from parsers.response_decoder import resolve_decoder, decode_response
+from database.response_archive import ResponseArchive
+from collectors.cassette import Cassette, CassetteMissError, CassetteSession, get_default_cassette
+from monitoring.metrics import NAVER_CONSECUTIVE_429, NAVER_REQUEST_SECONDS, NAVER_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+# 목록 쿼리의 구간 파라미터 (면적: ㎡, 가격: 만원 - 매매가/보증금)
+BAND_PARAMS = {
+    'area': ('areaMin', 'areaMax'),
+    'price': ('priceMin', 'priceMax')
+}
+
+
+def _params_digest(params: Dict[str, Any]) -> str:
+    """목록 쿼리 파라미터 전체(정렬)의 짧은 해시 - 아카이브 키 구분용"""
+    normalized = json.dumps(sorted((str(key), str(value)) for key, value in params.items()), ensure_ascii=False)
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).hexdigest()
 
 class NaverAPIClient:
-    def __init__(self):
+    def __init__(self, decoder: str = None, archive: ResponseArchive = None, cassette: Cassette = None,
+                 api_base_url: str = None, token_source: str = None):
+        """
+        decoder: 응답 디코더 (json / orjson / typed), 기본값은 설정의 response_decoder
+        archive: 원본 응답 아카이브, 기본값은 설정의 archive_settings['enabled']에 따라 생성
+        cassette: HTTP 녹화/재생 카세트, 기본값은 설정의 cassette_settings
+        api_base_url: API 주소, 기본값은 설정의 api_base_url
+        token_source: 토큰 수집 방식 (browser / mock), 기본값은 설정의 token_source
+        """
+        self.api_base_url = (api_base_url or settings.collection_settings['api_base_url']).rstrip('/')
+        self.cassette = cassette or get_default_cassette()
+        self.replaying = bool(self.cassette and self.cassette.mode == 'replay')
         self.session = requests.Session()
-        self.token_collector = NaverTokenCollector()
+        if self.cassette:
+            self.session = CassetteSession(self.cassette, 'naver', self.session)
+        self.decoder = resolve_decoder(decoder or settings.collection_settings['response_decoder'])
+        if archive is None and settings.archive_settings['enabled']:
+            archive = ResponseArchive()
+        self.archive = archive
+        # 재생 모드에서는 토큰이 필요 없으므로 브라우저 토큰 수집기를 만들지 않음
+        if self.replaying:
+            self.token_collector = None
+        elif (token_source or settings.collection_settings['token_source']) == 'mock':
+            self.token_collector = MockTokenCollector(self.api_base_url)
+        else:
+            self.token_collector = NaverTokenCollector()
         self.request_count = 0
+        self._stats_lock = threading.Lock()  # 요청 수/429 카운터는 수집 워커 스레드들이 함께 갱신
         self.rate_limit_backoff = settings.collection_settings['base_retry_delay']
         self.consecutive_429_errors = 0
+        self.rate_limited_count = 0  # 누적 429 응답 수
         
     def _get_random_delay(self) -> float:
         return random.uniform(
@@ -24,81 +72,136 @@ class NaverAPIClient:
             settings.collection_settings['request_delay_max']
         )
     
-    def _make_request(self, url: str, params: Dict = None, retries: int = None) -> Optional[Dict]:
+    def _decode(self, response, kind: str = None) -> Any:
+        """응답 본문 디코딩 - typed/orjson 디코딩에 실패하면 기존 response.json()으로 대체"""
+        if self.decoder == 'json' or kind is None:
+            return response.json()
+        try:
+            return decode_response(response.content, kind, self.decoder)
+        except ValueError as e:
+            logger.warning("⚠️ %s 디코딩 실패, json으로 재시도: %s", self.decoder, e)
+            return response.json()
+    
+    def _archive_response(self, kind: str, archive_key: str, body: bytes):
+        """원본 응답을 아카이브에 추가 (실패해도 수집은 계속)"""
+        try:
+            self.archive.append(kind, archive_key, body)
+        except Exception as e:
+            logger.warning("⚠️ 응답 아카이브 저장 실패 (%s %s): %s", kind, archive_key, e)
+    
+    def _make_request(self, url: str, params: Dict = None, retries: int = None, kind: str = None,
+                      archive_key: str = None) -> Optional[Dict]:
+        """
+        kind: 'detail' 또는 'list' (typed 디코더가 사용할 응답 구조)
+        archive_key: 아카이브 키 (detail은 article_no, list는 cortar_no:page:order:...:쿼리 해시)
+        """
         if retries is None:
             retries = settings.collection_settings['max_retries']
             
         for attempt in range(retries):
             try:
-                time.sleep(self._get_random_delay())
+                # 재생 모드는 실제 서버가 없으므로 요청 간격 대기 생략 (응답시간은 카세트 지연 설정으로 재현)
+                if not self.replaying:
+                    time.sleep(self._get_random_delay())
                 
                 # 토큰이 포함된 헤더 사용
-                headers = self.token_collector.get_headers_with_token()
-                cookies = self.token_collector.cookies
+                headers = self.token_collector.get_headers_with_token() if self.token_collector else {}
+                cookies = self.token_collector.cookies if self.token_collector else {}
                 
-                response = self.session.get(
-                    url, 
-                    params=params,
-                    headers=headers,
-                    cookies=cookies,
-                    timeout=settings.collection_settings['timeout']
-                )
+                start = time.perf_counter()
+                try:
+                    response = self.session.get(
+                        url, 
+                        params=params,
+                        headers=headers,
+                        cookies=cookies,
+                        timeout=settings.collection_settings['timeout']
+                    )
+                except Exception:
+                    NAVER_REQUESTS.inc(kind, 'error')
+                    raise
+                NAVER_REQUEST_SECONDS.observe(kind, value=time.perf_counter() - start)
+                NAVER_REQUESTS.inc(kind, response.status_code)
                 
-                self.request_count += 1
+                with self._stats_lock:
+                    self.request_count += 1
                 
                 if response.status_code == 200:
                     # 성공시 429 에러 카운터 초기화
-                    self.consecutive_429_errors = 0
+                    with self._stats_lock:
+                        self.consecutive_429_errors = 0
+                    NAVER_CONSECUTIVE_429.set(value=0)
                     self.rate_limit_backoff = settings.collection_settings['base_retry_delay']
-                    return response.json()
+                    if self.archive and kind and archive_key:
+                        self._archive_response(kind, archive_key, response.content)
+                    return self._decode(response, kind)
                 elif response.status_code == 429:
                     # 적응형 지연 적용
-                    self.consecutive_429_errors += 1
+                    with self._stats_lock:
+                        self.consecutive_429_errors += 1
+                        self.rate_limited_count += 1
+                        consecutive_429_errors = self.consecutive_429_errors
+                    NAVER_CONSECUTIVE_429.set(value=consecutive_429_errors)
                     adaptive_delay = min(
-                        self.rate_limit_backoff * (2 ** (self.consecutive_429_errors - 1)),
+                        self.rate_limit_backoff * (2 ** (consecutive_429_errors - 1)),
                         settings.collection_settings['max_retry_delay']
                     )
-                    print(f"⚠️ Rate limit hit ({self.consecutive_429_errors}회), {adaptive_delay:.1f}초 대기...")
+                    logger.warning("⚠️ Rate limit hit (%d회), %.1f초 대기...", consecutive_429_errors, adaptive_delay,
+                                   extra={'status': 429, 'delay': adaptive_delay})
                     time.sleep(adaptive_delay)
                     continue
                 elif response.status_code == 401 or response.status_code == 403:
-                    print(f"🔑 토큰 만료 또는 인증 실패, 새 토큰 수집 중...")
+                    if not self.token_collector:
+                        logger.error("❌ HTTP %d (재생 모드에서는 토큰 재수집 안 함): %s", response.status_code, url)
+                        break
+                    logger.warning("🔑 토큰 만료 또는 인증 실패, 새 토큰 수집 중...", extra={'status': response.status_code})
                     # 새 토큰 수집 시도
                     new_token = self.token_collector.collect_token_from_page()
                     if new_token:
-                        print("✅ 새 토큰 수집 성공, 재시도 중...")
+                        logger.info("✅ 새 토큰 수집 성공, 재시도 중...")
                         continue
                     else:
-                        print("❌ 새 토큰 수집 실패")
+                        logger.error("❌ 새 토큰 수집 실패")
                         break
                 else:
-                    print(f"❌ HTTP {response.status_code}: {url}")
-                    print(f"   응답: {response.text[:200]}")
+                    logger.error("❌ HTTP %d: %s\n   응답: %s", response.status_code, url, response.text[:200],
+                                 extra={'status': response.status_code})
                     
+            except CassetteMissError as e:
+                logger.error("❌ %s", e)
+                return None
             except Exception as e:
-                print(f"❌ Request failed (attempt {attempt + 1}): {e}")
+                logger.warning("❌ Request failed (attempt %d): %s", attempt + 1, e, extra={'url': url})
                 if attempt < retries - 1:
                     time.sleep(2 ** attempt)
                     
         return None
     
     def get_article_detail(self, article_no: str) -> Optional[Dict]:
-        url = f"https://new.land.naver.com/api/articles/{article_no}"
-        return self._make_request(url)
+        url = f"{self.api_base_url}/articles/{article_no}"
+        return self._make_request(url, kind='detail', archive_key=str(article_no))
     
-    def get_area_articles(self, cortar_no: str, page: int = 1) -> Optional[Dict]:
+    def get_area_articles(self, cortar_no: str, page: int = 1, filters: Optional[Dict] = None,
+                          order: str = 'rank', bounds: Optional[Tuple[float, float, float, float]] = None,
+                          zoom: int = None, band: Optional[Tuple[str, float, float]] = None) -> Optional[Dict]:
         """
-        지역별 사무실 매물 목록 조회 - 사무실만 (상가 제외)
+        지역별 매물 목록 조회 - 기본은 사무실만, NAVER_REAL_ESTATE_TYPES=SMS:SG면 사무실+상가를 한 쿼리로
+        (웹 지도 화면처럼 유형 코드를 ':'로 이어 보내면 행마다 realEstateTypeCode가 붙어서 옴)
         네이버 랜드 웹사이트의 실제 네트워크 요청 분석을 통해 올바른 파라미터 적용
+        filters: 기본 파라미터를 덮어쓸 필터 (예: ListPrefilter.build_query_params())
+        order: 'rank'(랭킹순) 또는 'dateDesc'(최신순)
+        bounds: (남, 서, 북, 동) 위경도 - 지도 화면 범위 조회처럼 지역 안의 타일만 조회 (zoom과 함께 전송)
+        band: (구간 종류, 하한, 상한) - 면적(area) 또는 가격(price) 구간 안의 매물만 조회 (filters의 같은 범위와 교집합)
         """
-        url = "https://new.land.naver.com/api/articles"
+        url = f"{self.api_base_url}/articles"
+        real_estate_type = ':'.join(settings.collection_settings['real_estate_types'])
         
         params = {
             # 필수 파라미터
             'cortarNo': cortar_no,
             'page': page,
-            'order': 'rank',
-            'realEstateType': 'SMS',    # 사무실 필터 (핵심 파라미터)
+            'order': order,
+            'realEstateType': real_estate_type,  # 매물 유형 필터 (핵심 파라미터, SMS=사무실, SG=상가)
             'priceType': 'RETAIL',      # 가격 타입 (필수)
             'tradeType': '',            # 거래유형 전체 (빈값)
             
@@ -123,11 +226,47 @@ class NaverAPIClient:
             'directions': '',            # 방향
             'articleState': ''           # 매물상태
         }
+        
+        archive_key = f"{cortar_no}:{page}:{order}"
+        if real_estate_type != 'SMS':
+            archive_key += f":{real_estate_type}"
+        if bounds:
+            south, west, north, east = bounds
+            params.update({
+                'zoom': zoom or settings.tiling_settings['zoom'],
+                'bottomLat': south,
+                'leftLon': west,
+                'topLat': north,
+                'rightLon': east
+            })
+            archive_key += f":{south:.5f},{west:.5f},{north:.5f},{east:.5f}"
+        
+        if filters:
+            params.update(filters)
+        
+        if band:
+            dimension, band_min, band_max = band
+            min_param, max_param = BAND_PARAMS[dimension]
+            # 사전 필터의 가격 범위 등 이미 설정된 범위를 넓히지 않도록 교집합
+            params.update({min_param: max(band_min, params[min_param]), max_param: min(band_max, params[max_param])})
+            archive_key += f":{dimension}={band_min}-{band_max}"
+        
+        # 사전 필터/동일주소 묶음 등 나머지 파라미터가 다른 조회도 구분되도록 전체 쿼리 해시를 덧붙임
+        archive_key += f":{_params_digest(params)}"
             
-        return self._make_request(url, params)
+        return self._make_request(url, params, kind='list', archive_key=archive_key)
+    
+    def get_region_list(self, cortar_no: str) -> Optional[Dict]:
+        """
+        하위 지역 목록 조회 (시 -> 구 -> 동), 웹 클라이언트의 지역 선택 메뉴가 쓰는 JSON API
+        최상위(전국 시/도)는 cortarNo='0000000000', 응답: {'regionList': [{'cortarNo', 'cortarName', 'cortarType', ...}]}
+        """
+        url = f"{self.api_base_url}/regions/list"
+        return self._make_request(url, {'cortarNo': cortar_no})
     
     def get_request_stats(self) -> Dict[str, int]:
         return {
             'total_requests': self.request_count,
+            'rate_limited': self.rate_limited_count,
             'remaining_daily_limit': settings.collection_settings['daily_limit'] - self.request_count
         }
\ No newline at end of file
@@ -10,6 +10,7 @@ import json
 from typing import Dict, Optional
 from datetime import datetime, timedelta
 import re
+from monitoring.metrics import mark_token_collected
 
 try:
     from playwright.sync_api import sync_playwright
@@ -196,6 +197,7 @@ class NaverTokenCollector:
                     self.cookies = cookies
                     self.expires_at = expires_at
                     self._token_capture_logged = False  # 다음 수집 시 메시지 출력 허용
+                    mark_token_collected()
                     
                     return token_data
                 else:
@@ -269,6 +271,7 @@ class NaverTokenCollector:
                 self.token = None
                 self.cookies = cookies
                 self.expires_at = token_data['expires_at']
+                mark_token_collected()
                 
                 return token_data
             else:
@@ -49,6 +49,25 @@ AREA_CODE_MAP = {
     '도곡동': '1168011800',
 }
 
+# 동별 위경도 범위 (남, 서, 북, 동) - 타일 분할 목록 조회용
+# 목록 요청에 cortarNo도 함께 보내므로 경계보다 넉넉하게 잡음 (범위 밖 매물은 지역 총량과 비교해 순차 조회로 보충)
+AREA_BOUNDS = {
+    '1168010100': (37.490, 127.020, 37.510, 127.055),  # 역삼동
+    '1168010300': (37.470, 127.040, 37.495, 127.080),  # 개포동
+    '1168010400': (37.515, 127.035, 37.531, 127.062),  # 청담동
+    '1168010500': (37.500, 127.040, 37.522, 127.075),  # 삼성동
+    '1168010600': (37.490, 127.045, 37.512, 127.075),  # 대치동
+    '1168010700': (37.511, 127.014, 37.530, 127.036),  # 신사동
+    '1168010800': (37.501, 127.017, 37.521, 127.046),  # 논현동
+    '1168011000': (37.519, 127.019, 37.536, 127.046),  # 압구정동
+    '1168011100': (37.455, 127.085, 37.476, 127.116),  # 세곡동
+    '1168011200': (37.464, 127.089, 37.481, 127.116),  # 자곡동
+    '1168011300': (37.455, 127.104, 37.476, 127.126),  # 율현동
+    '1168011400': (37.477, 127.069, 37.496, 127.096),  # 일원동
+    '1168011500': (37.477, 127.089, 37.496, 127.111),  # 수서동
+    '1168011800': (37.479, 127.030, 37.500, 127.061),  # 도곡동
+}
+
 def get_gangnam_areas():
     """강남구 전체 지역 코드 리스트 반환 (우선순위 순서)"""
     return GANGNAM_AREAS
@@ -72,4 +91,8 @@ def get_area_priority(area_name: str) -> int:
 
 def get_all_areas():
     """전체 지역 코드 맵 반환"""
-    return AREA_CODE_MAP
\ No newline at end of file
+    return AREA_CODE_MAP
+
+def get_area_bounds(area_code: str):
+    """지역 코드의 위경도 범위 (남, 서, 북, 동), 모르는 지역은 None"""
+    return AREA_BOUNDS.get(area_code)
@@ -0,0 +1,60 @@
+-- 건물 테이블 생성 (NAVER_BUILDING_TABLE=true)
+-- 건축물대장(articleBuildingRegister) 값은 같은 건물 매물마다 같으므로 건물 1행으로 분리하고 매물은 building_id로 참조
+CREATE TABLE IF NOT EXISTS naver_buildings (
+    id BIGSERIAL PRIMARY KEY,
+
+    -- 건물 키: 'pk:' + 건축물대장 PK(mgmBldrgstPk), 없으면 'addr:' + 정규화한 카카오 변환 주소
+    building_key VARCHAR NOT NULL,
+    building_register_pk VARCHAR,
+
+    -- 위치
+    building_name VARCHAR,
+    address VARCHAR,
+    latitude NUMERIC,
+    longitude NUMERIC,
+
+    -- 건축물대장
+    register_type VARCHAR,
+    structure_type VARCHAR,
+    main_purpose VARCHAR,
+    plot_area NUMERIC,
+    building_area NUMERIC,
+    total_area NUMERIC,
+    building_coverage_ratio NUMERIC,
+    volume_ratio NUMERIC,
+    ground_floor_count INTEGER,
+    underground_floor_count INTEGER,
+    total_elevator_count INTEGER,
+    elevator_info VARCHAR,
+    indoor_parking_count INTEGER,
+    outdoor_parking_count INTEGER,
+    parking_info VARCHAR,
+
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    CONSTRAINT unique_building_key UNIQUE (building_key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_buildings_register_pk ON naver_buildings(building_register_pk);
+
+-- 매물 -> 건물 참조 (건물 테이블 사용시 building_structure/building_main_purpose/total_elevator_count는 기록하지 않음)
+ALTER TABLE naver_properties ADD COLUMN IF NOT EXISTS building_id BIGINT REFERENCES naver_buildings(id) ON DELETE SET NULL;
+CREATE INDEX IF NOT EXISTS idx_properties_building_id ON naver_properties(building_id);
+
+-- 건물별 매물 집계
+CREATE OR REPLACE VIEW naver_building_listing_stats AS
+SELECT
+    b.id AS building_id,
+    b.building_name,
+    b.address,
+    b.main_purpose,
+    b.total_elevator_count,
+    COUNT(p.id) AS listing_count,
+    COUNT(p.id) FILTER (WHERE p.is_active) AS active_listing_count,
+    AVG(p.warrant_price) AS avg_warrant_price,
+    AVG(p.rent_price) AS avg_rent_price,
+    MAX(p.last_updated) AS last_listing_update
+FROM naver_buildings b
+LEFT JOIN naver_properties p ON p.building_id = b.id
+GROUP BY b.id;
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+메모리 Supabase 클라이언트 (벤치마크/오프라인 테스트용)
+저장소가 쓰는 table().select/insert/update/upsert/delete + eq/in_/gte... + execute()와 rpc()를 흉내내고
+요청 1회(execute)마다 왕복 수, 요청/응답 바이트, 테이블/작업별 횟수를 기록
+
+NAVER_DB_BACKEND=fake 로 supabase_client가 이 클라이언트를 사용 (NAVER_FAKE_DB_LATENCY=초 로 왕복 지연 주입)
+"""
+
+import json
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+
+
+def _serialize(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, default=str).encode('utf-8')
+
+
+class FakeResponse:
+    """postgrest APIResponse와 같은 속성 (data, count)"""
+
+    def __init__(self, data: List[Dict], count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    """테이블 요청 빌더 - execute() 호출 시 1회 왕복으로 처리"""
+
+    def __init__(self, client: 'FakeSupabaseClient', table: str):
+        self.client = client
+        self.table_name = table
+        self.operation = None
+        self.columns = None
+        self.payload = None
+        self.on_conflict = 'id'
+        self.count_mode = None
+        self.filters = []
+        self.limit_count = None
+        self.order_by = None
+
+    # 작업
+    def select(self, *columns: str, count: str = None) -> 'FakeQuery':
+        self.operation = 'select'
+        joined = ','.join(columns) or '*'
+        self.columns = None if joined.strip() == '*' else [c.strip() for c in joined.split(',')]
+        self.count_mode = count
+        return self
+
+    def insert(self, rows) -> 'FakeQuery':
+        self.operation = 'insert'
+        self.payload = rows
+        return self
+
+    def update(self, values: Dict) -> 'FakeQuery':
+        self.operation = 'update'
+        self.payload = values
+        return self
+
+    def upsert(self, rows, on_conflict: str = 'id') -> 'FakeQuery':
+        self.operation = 'upsert'
+        self.payload = rows
+        self.on_conflict = on_conflict
+        return self
+
+    def delete(self) -> 'FakeQuery':
+        self.operation = 'delete'
+        return self
+
+    # 필터
+    def _filter(self, op: str, column: str, value: Any) -> 'FakeQuery':
+        self.filters.append((op, column, value))
+        return self
+
+    def eq(self, column: str, value: Any) -> 'FakeQuery':
+        return self._filter('eq', column, value)
+
+    def neq(self, column: str, value: Any) -> 'FakeQuery':
+        return self._filter('neq', column, value)
+
+    def gt(self, column: str, value: Any) -> 'FakeQuery':
+        return self._filter('gt', column, value)
+
+    def gte(self, column: str, value: Any) -> 'FakeQuery':
+        return self._filter('gte', column, value)
+
+    def lt(self, column: str, value: Any) -> 'FakeQuery':
+        return self._filter('lt', column, value)
+
+    def lte(self, column: str, value: Any) -> 'FakeQuery':
+        return self._filter('lte', column, value)
+
+    def in_(self, column: str, values) -> 'FakeQuery':
+        return self._filter('in', column, list(values))
+
+    def is_(self, column: str, value: Any) -> 'FakeQuery':
+        return self._filter('is', column, None if value in (None, 'null') else value)
+
+    def limit(self, count: int) -> 'FakeQuery':
+        self.limit_count = count
+        return self
+
+    def order(self, column: str, desc: bool = False) -> 'FakeQuery':
+        self.order_by = (column, desc)
+        return self
+
+    def execute(self) -> FakeResponse:
+        return self.client._execute(self)
+
+
+_COMPARATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    'eq': lambda actual, expected: actual == expected,
+    'neq': lambda actual, expected: actual != expected,
+    'gt': lambda actual, expected: actual is not None and actual > expected,
+    'gte': lambda actual, expected: actual is not None and actual >= expected,
+    'lt': lambda actual, expected: actual is not None and actual < expected,
+    'lte': lambda actual, expected: actual is not None and actual <= expected,
+    'in': lambda actual, expected: actual in expected,
+    'is': lambda actual, expected: actual is expected or actual == expected,
+}
+
+
+class FakeRPC:
+    def __init__(self, client: 'FakeSupabaseClient', name: str, params: Dict):
+        self.client = client
+        self.name = name
+        self.params = params or {}
+
+    def execute(self) -> FakeResponse:
+        return self.client._execute_rpc(self)
+
+
+class FakeSupabaseClient:
+    """
+    테이블별 행을 메모리에 보관 (id 자동 증가, 저장/반환 값은 JSON 왕복으로 복사 - 실제 직렬화 비용과 별칭 방지)
+    latency: execute()/rpc 1회당 지연 (초)
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.tables: Dict[str, Dict[int, Dict]] = {}
+        self._next_ids: Dict[str, int] = {}
+        self._rpc_functions: Dict[str, Callable[['FakeSupabaseClient', Dict], Any]] = {}
+        self._lock = threading.Lock()
+        self.stats = Counter()
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def rpc(self, name: str, params: Dict = None) -> FakeRPC:
+        return FakeRPC(self, name, params)
+
+    def register_rpc(self, name: str, function: Callable[['FakeSupabaseClient', Dict], Any]):
+        """
+        rpc(name, params) 처리 함수 등록 - function(client, params) -> 반환 데이터
+        함수 안에서는 client.tables를 직접 다룸 (client.table() 호출은 별도 왕복으로 집계됨)
+        """
+        self._rpc_functions[name] = function
+
+    def rows(self, table: str) -> List[Dict]:
+        """테이블 전체 행 (검증용)"""
+        with self._lock:
+            return [dict(row) for row in self.tables.get(table, {}).values()]
+
+    # 통계
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.stats)
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats.clear()
+
+    # 실행
+    def _round_trip(self, kind: str, request: Any, response: Any):
+        request_bytes = len(_serialize(request))
+        response_bytes = len(_serialize(response))
+        with self._lock:
+            self.stats['round_trips'] += 1
+            self.stats['request_bytes'] += request_bytes
+            self.stats['response_bytes'] += response_bytes
+            self.stats[kind] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _matches(self, row: Dict, filters: List) -> bool:
+        return all(_COMPARATORS[op](row.get(column), value) for op, column, value in filters)
+
+    def _insert_row(self, table: Dict[int, Dict], table_name: str, row: Dict) -> Dict:
+        row = json.loads(_serialize(row))
+        if row.get('id') is None:
+            row['id'] = self._next_ids.get(table_name, 1)
+        self._next_ids[table_name] = max(self._next_ids.get(table_name, 1), row['id'] + 1)
+        table[row['id']] = row
+        return row
+
+    def _execute(self, query: FakeQuery) -> FakeResponse:
+        name = query.table_name
+        count = None
+        with self._lock:
+            table = self.tables.setdefault(name, {})
+            matched = [row for row in table.values() if self._matches(row, query.filters)]
+
+            if query.operation == 'select':
+                if query.order_by:
+                    column, desc = query.order_by
+                    matched.sort(key=lambda row: (row.get(column) is None, row.get(column)), reverse=desc)
+                count = len(matched) if query.count_mode else None
+                if query.limit_count is not None:
+                    matched = matched[:query.limit_count]
+                data = [dict(row) if query.columns is None else {c: row.get(c) for c in query.columns}
+                        for row in matched]
+            elif query.operation == 'insert':
+                rows = query.payload if isinstance(query.payload, list) else [query.payload]
+                data = [dict(self._insert_row(table, name, row)) for row in rows]
+            elif query.operation == 'update':
+                values = json.loads(_serialize(query.payload))
+                for row in matched:
+                    row.update(values)
+                data = [dict(row) for row in matched]
+            elif query.operation == 'upsert':
+                rows = query.payload if isinstance(query.payload, list) else [query.payload]
+                data = []
+                for row in rows:
+                    key = row.get(query.on_conflict)
+                    if query.on_conflict == 'id':
+                        existing = table.get(key)
+                    else:
+                        existing = next((r for r in table.values()
+                                         if key is not None and r.get(query.on_conflict) == key), None)
+                    if existing is not None:
+                        existing.update(json.loads(_serialize(row)))
+                        data.append(dict(existing))
+                    else:
+                        data.append(dict(self._insert_row(table, name, row)))
+            elif query.operation == 'delete':
+                for row in matched:
+                    del table[row['id']]
+                data = matched
+            else:
+                raise ValueError(f"작업(select/insert/update/upsert/delete)이 지정되지 않은 요청: {name}")
+
+        request = {'table': name, 'operation': query.operation, 'filters': query.filters, 'payload': query.payload}
+        self._round_trip(f"{name}.{query.operation}", request, data)
+        return FakeResponse(data, count)
+
+    def _execute_rpc(self, rpc: FakeRPC) -> FakeResponse:
+        function = self._rpc_functions.get(rpc.name)
+        if function is None:
+            raise ValueError(f"등록되지 않은 rpc 함수: {rpc.name}")
+        data = function(self, rpc.params)
+        self._round_trip(f"rpc.{rpc.name}", {'rpc': rpc.name, 'params': rpc.params}, data)
+        return FakeResponse(data)
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+로컬 매물 상태 저장소 (SQLite)
+목록 행 fingerprint로 이미 알고 있는 매물/변경된 매물을 구분
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Iterable
+from config.settings import settings
+
+# fingerprint 계산에 쓰는 목록 행 필드 (가격/면적/층/확인일 등 상세 변경을 반영하는 값)
+FINGERPRINT_FIELDS = (
+    'tradeTypeCode', 'dealOrWarrantPrc', 'rentPrc', 'area1', 'area2',
+    'floorInfo', 'articleConfirmYmd', 'articleFeatureDesc', 'tagList',
+    'realtorName', 'sameAddrCnt', 'direction'
+)
+
+
+def compute_list_fingerprint(row: Dict) -> str:
+    """목록 행의 변경 감지용 fingerprint"""
+    payload = json.dumps([row.get(field) for field in FINGERPRINT_FIELDS], ensure_ascii=False, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=8).hexdigest()
+
+
+class ListingStateStore:
+    """article_no별 fingerprint/마지막 확인 시각을 보관하는 로컬 저장소 (스레드 안전)"""
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or settings.state_settings['listing_state_path']
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._ensure_schema()
+
+    def _ensure_schema(self):
+        with self._lock:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS listings (
+                    article_no TEXT PRIMARY KEY,
+                    cortar_no TEXT,
+                    fingerprint TEXT,
+                    first_seen_at REAL,
+                    last_seen_at REAL,
+                    last_saved_at REAL
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_listings_cortar ON listings(cortar_no)")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS area_sweeps (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    cortar_no TEXT NOT NULL,
+                    mode TEXT,
+                    started_at REAL,
+                    finished_at REAL,
+                    rows_seen INTEGER,
+                    rows_changed INTEGER,
+                    list_requests INTEGER,
+                    detail_requests INTEGER
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_area_sweeps_cortar ON area_sweeps(cortar_no, finished_at)")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS area_bands (
+                    cortar_no TEXT NOT NULL,
+                    dimension TEXT NOT NULL,
+                    band_min REAL NOT NULL,
+                    band_max REAL NOT NULL,
+                    total INTEGER,
+                    updated_at REAL,
+                    PRIMARY KEY (cortar_no, dimension, band_min)
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS address_groups (
+                    representative_no TEXT PRIMARY KEY,
+                    cortar_no TEXT,
+                    same_addr_hash TEXT,
+                    latitude TEXT,
+                    longitude TEXT,
+                    member_count INTEGER,
+                    summary TEXT,
+                    member_nos TEXT,
+                    members_checked_at REAL,
+                    updated_at REAL
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_address_groups_hash ON address_groups(same_addr_hash)")
+            self._ensure_columns('listings', {
+                'last_changed_at': 'REAL',
+                'change_count': 'INTEGER DEFAULT 0',
+                'expose_start_at': 'REAL',
+                'next_refresh_at': 'REAL'
+            })
+            self.conn.commit()
+
+    def _ensure_columns(self, table: str, columns: Dict[str, str]):
+        """기존 상태 파일에 없는 컬럼 추가 (스키마 확장용)"""
+        existing = {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})").fetchall()}
+        for name, column_type in columns.items():
+            if name not in existing:
+                self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {column_type}")
+
+    def get_fingerprints(self, article_nos: Iterable[str]) -> Dict[str, str]:
+        """알고 있는 매물의 fingerprint 조회 (모르는 매물은 결과에 없음)"""
+        article_nos = list(article_nos)
+        if not article_nos:
+            return {}
+        placeholders = ','.join('?' * len(article_nos))
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT article_no, fingerprint FROM listings WHERE article_no IN ({placeholders})",
+                article_nos
+            ).fetchall()
+        return {article_no: fingerprint for article_no, fingerprint in rows}
+
+    def mark_seen(self, article_no: str, cortar_no: str, fingerprint: str, saved: bool = False):
+        """목록에서 확인한 매물 기록 (saved=True면 상세 수집/저장 완료)"""
+        self.mark_seen_many(cortar_no, {article_no: fingerprint}, saved)
+
+    def mark_seen_many(self, cortar_no: str, fingerprints: Dict[str, str], saved: bool = False):
+        """목록에서 확인한 매물 여러 개를 한 번에 기록 (페이지 단위, 커밋 1회)"""
+        if not fingerprints:
+            return
+        now = time.time()
+        with self._lock:
+            self.conn.executemany("""
+                INSERT INTO listings (article_no, cortar_no, fingerprint, first_seen_at, last_seen_at, last_saved_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(article_no) DO UPDATE SET
+                    cortar_no = excluded.cortar_no,
+                    fingerprint = excluded.fingerprint,
+                    last_seen_at = excluded.last_seen_at,
+                    last_saved_at = COALESCE(excluded.last_saved_at, listings.last_saved_at)
+            """, [(article_no, cortar_no, fingerprint, now, now, now if saved else None)
+                  for article_no, fingerprint in fingerprints.items()])
+            self.conn.commit()
+
+    def get_area_article_nos(self, cortar_no: str) -> List[str]:
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT article_no FROM listings WHERE cortar_no = ?", (cortar_no,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_last_saved_at(self, article_no: str) -> Optional[float]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT last_saved_at FROM listings WHERE article_no = ?", (article_no,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_refresh_states(self, article_nos: Iterable[str]) -> Dict[str, Dict]:
+        """매물별 fingerprint와 다음 재수집 시각 조회 (모르는 매물은 결과에 없음)"""
+        article_nos = list(article_nos)
+        if not article_nos:
+            return {}
+        placeholders = ','.join('?' * len(article_nos))
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT article_no, fingerprint, next_refresh_at FROM listings WHERE article_no IN ({placeholders})",
+                article_nos
+            ).fetchall()
+        return {row[0]: {'fingerprint': row[1], 'next_refresh_at': row[2]} for row in rows}
+
+    def get_listing(self, article_no: str) -> Optional[Dict]:
+        with self._lock:
+            cursor = self.conn.execute("SELECT * FROM listings WHERE article_no = ?", (article_no,))
+            row = cursor.fetchone()
+            keys = [column[0] for column in cursor.description]
+        return dict(zip(keys, row)) if row else None
+
+    def set_refresh_schedule(self, article_no: str, last_changed_at: Optional[float], change_count: int,
+                             expose_start_at: Optional[float], next_refresh_at: float):
+        """상세 수집 후 변경 이력과 다음 재수집 시각 기록"""
+        now = time.time()
+        with self._lock:
+            self.conn.execute("""
+                INSERT INTO listings (article_no, first_seen_at, last_seen_at, last_changed_at,
+                                      change_count, expose_start_at, next_refresh_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(article_no) DO UPDATE SET
+                    last_changed_at = excluded.last_changed_at,
+                    change_count = excluded.change_count,
+                    expose_start_at = COALESCE(excluded.expose_start_at, listings.expose_start_at),
+                    next_refresh_at = excluded.next_refresh_at
+            """, (article_no, now, now, last_changed_at, change_count, expose_start_at, next_refresh_at))
+            self.conn.commit()
+
+    def record_area_sweep(self, cortar_no: str, mode: str, started_at: float, rows_seen: int,
+                          rows_changed: int, list_requests: int, detail_requests: int):
+        """지역 1회 수집 결과 기록 (변경률 추정용)"""
+        with self._lock:
+            self.conn.execute("""
+                INSERT INTO area_sweeps (cortar_no, mode, started_at, finished_at, rows_seen,
+                                         rows_changed, list_requests, detail_requests)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (cortar_no, mode, started_at, time.time(), rows_seen, rows_changed, list_requests, detail_requests))
+            self.conn.commit()
+
+    def get_area_sweeps(self, cortar_no: str, limit: int = 10) -> List[Dict]:
+        """최근 지역 수집 기록 (오래된 순)"""
+        with self._lock:
+            rows = self.conn.execute("""
+                SELECT mode, started_at, finished_at, rows_seen, rows_changed, list_requests, detail_requests
+                FROM area_sweeps WHERE cortar_no = ? ORDER BY finished_at DESC LIMIT ?
+            """, (cortar_no, limit)).fetchall()
+        keys = ('mode', 'started_at', 'finished_at', 'rows_seen', 'rows_changed', 'list_requests', 'detail_requests')
+        return [dict(zip(keys, row)) for row in reversed(rows)]
+
+    def get_refresh_candidates(self, cortar_nos: Iterable[str], now: float, default_ttl: float,
+                               limit: int = 5000) -> List[Dict]:
+        """재수집 시각이 지난 저장 매물 (재수집 시각이 없으면 마지막 저장 + default_ttl), 오래 밀린 순"""
+        cortar_nos = list(cortar_nos)
+        if not cortar_nos:
+            return []
+        placeholders = ','.join('?' * len(cortar_nos))
+        with self._lock:
+            rows = self.conn.execute(f"""
+                SELECT article_no, cortar_no, last_saved_at, COALESCE(next_refresh_at, last_saved_at + ?) AS due_at
+                FROM listings
+                WHERE cortar_no IN ({placeholders}) AND last_saved_at IS NOT NULL
+                  AND COALESCE(next_refresh_at, last_saved_at + ?) <= ?
+                ORDER BY due_at LIMIT ?
+            """, [default_ttl, *cortar_nos, default_ttl, now, limit]).fetchall()
+        keys = ('article_no', 'cortar_no', 'last_saved_at', 'due_at')
+        return [dict(zip(keys, row)) for row in rows]
+
+    def get_area_bands(self, cortar_no: str, dimension: str) -> List[Dict]:
+        """직전 구간 분할 조회의 구간별 매물 수 (구간 하한 순)"""
+        with self._lock:
+            rows = self.conn.execute("""
+                SELECT band_min, band_max, total FROM area_bands
+                WHERE cortar_no = ? AND dimension = ? ORDER BY band_min
+            """, (cortar_no, dimension)).fetchall()
+        return [{'min': row[0], 'max': row[1], 'total': row[2]} for row in rows]
+
+    def save_area_bands(self, cortar_no: str, dimension: str, bands: List[Dict]):
+        """구간 분할 결과로 지역 구간 목록 교체 (bands: [{'min', 'max', 'total'}])"""
+        now = time.time()
+        with self._lock:
+            self.conn.execute("DELETE FROM area_bands WHERE cortar_no = ? AND dimension = ?", (cortar_no, dimension))
+            self.conn.executemany("""
+                INSERT INTO area_bands (cortar_no, dimension, band_min, band_max, total, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, [(cortar_no, dimension, band['min'], band['max'], band['total'], now) for band in bands])
+            self.conn.commit()
+
+    def get_address_groups(self, representative_nos: Iterable[str]) -> Dict[str, Dict]:
+        """대표 매물 번호별 동일주소 묶음 (모르는 묶음은 결과에 없음)"""
+        representative_nos = list(representative_nos)
+        if not representative_nos:
+            return {}
+        placeholders = ','.join('?' * len(representative_nos))
+        with self._lock:
+            rows = self.conn.execute(f"""
+                SELECT representative_no, same_addr_hash, member_count, summary, member_nos, members_checked_at
+                FROM address_groups WHERE representative_no IN ({placeholders})
+            """, representative_nos).fetchall()
+        return {row[0]: {
+            'same_addr_hash': row[1],
+            'member_count': row[2],
+            'summary': row[3],
+            'member_nos': json.loads(row[4] or '[]'),
+            'members_checked_at': row[5]
+        } for row in rows}
+
+    def save_address_group(self, representative_no: str, cortar_no: str, latitude: str, longitude: str,
+                           member_count: int, summary: str, member_nos: List[str]):
+        """구성원을 확인한 동일주소 묶음 기록 (묶음 해시는 대표 매물 상세 저장 시 set_address_group_hash로)"""
+        now = time.time()
+        with self._lock:
+            self.conn.execute("""
+                INSERT INTO address_groups (representative_no, cortar_no, latitude, longitude, member_count, summary,
+                                            member_nos, members_checked_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(representative_no) DO UPDATE SET
+                    cortar_no = excluded.cortar_no,
+                    latitude = excluded.latitude,
+                    longitude = excluded.longitude,
+                    member_count = excluded.member_count,
+                    summary = excluded.summary,
+                    member_nos = excluded.member_nos,
+                    members_checked_at = excluded.members_checked_at,
+                    updated_at = excluded.updated_at
+            """, (representative_no, cortar_no, latitude, longitude, member_count, summary,
+                  json.dumps(member_nos), now, now))
+            self.conn.commit()
+
+    def set_address_group_hash(self, representative_no: str, same_addr_hash: str):
+        """대표 매물 상세의 sameAddrHash를 묶음에 기록 (대표 매물이 아니면 변경 없음)"""
+        with self._lock:
+            self.conn.execute("""
+                UPDATE address_groups SET same_addr_hash = ?
+                WHERE representative_no = ? AND same_addr_hash IS NOT ?
+            """, (same_addr_hash, representative_no, same_addr_hash))
+            self.conn.commit()
+
+    def get_sweep_throughput(self, mode: str, limit: int = 20) -> Optional[float]:
+        """최근 limit회 지역 수집(mode)의 목록 행 처리 속도 (행/초), 기록이 없으면 None"""
+        with self._lock:
+            row = self.conn.execute("""
+                SELECT SUM(rows_seen), SUM(finished_at - started_at) FROM (
+                    SELECT rows_seen, started_at, finished_at FROM area_sweeps
+                    WHERE mode = ? AND rows_seen > 0 ORDER BY finished_at DESC LIMIT ?
+                )
+            """, (mode, limit)).fetchone()
+        rows_seen, seconds = row
+        return rows_seen / seconds if rows_seen and seconds and seconds > 0 else None
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
@@ -3,20 +3,34 @@
 최적화된 4개 테이블 구조에 맞는 데이터 저장 Repository
 """
 
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Union
 from datetime import datetime, date
 import json
-import psycopg2
+import logging
 import os
+import threading
 from dotenv import load_dotenv
-from database.supabase_client import supabase_client
+from database.supabase_client import SupabaseClient, supabase_client
+from parsers.records import ArticleRecord
+from database.property_rows import BUILDING_COLUMNS, build_building_row, build_property_row, building_key
+from monitoring.spans import stage_spans
+from config.settings import settings
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+
+def property_table(type_code: Optional[str]) -> str:
+    """매물 유형 코드의 메인 매물 테이블 (settings.real_estate_type_settings, 모르는 유형은 naver_properties)"""
+    return settings.real_estate_type_settings.get(type_code or '', {}).get('table', 'naver_properties')
+
 class OptimizedPropertyRepository:
-    def __init__(self):
-        self.supabase_client = supabase_client  # 재시도 기능이 있는 클라이언트 래퍼
-        self.client = supabase_client.get_client()
+    def __init__(self, client=None):
+        """client: 사용할 DB 클라이언트 (벤치마크용 FakeSupabaseClient 등), 기본값은 공용 supabase_client"""
+        # 재시도 기능이 있는 클라이언트 래퍼
+        self.supabase_client = supabase_client if client is None else SupabaseClient(client)
+        self.client = self.supabase_client.get_client()
         self.pg_conn = None  # PostgreSQL 직접 연결 (UPSERT용)
         self.save_stats = {
             'total_attempts': 0,
@@ -25,233 +39,213 @@ class OptimizedPropertyRepository:
             'updates': 0,
             'inserts': 0,
             'history_records': 0,
+            'building_writes': 0,
+            'building_cache_hits': 0,
             'table_errors': {}
         }
+        self._stats_lock = threading.Lock()  # save_stats는 수집 워커 스레드들이 함께 갱신
+        
+        # 건물 테이블 (옵트인): 이번 실행에서 확인한 건물 키 -> naver_buildings.id
+        self.building_table = settings.building_settings['table'] if settings.building_settings['enabled'] else None
+        self._building_ids: Dict[str, int] = {}
+        self._building_lock = threading.Lock()
     
-    def save_property(self, parsed_data: Dict) -> bool:
-        """새로운 4개 테이블 구조에 맞춰 매물 저장"""
-        self.save_stats['total_attempts'] += 1
+    def _count(self, key: str):
+        with self._stats_lock:
+            self.save_stats[key] += 1
+    
+    def save_property(self, article: Union[ArticleRecord, Dict]) -> bool:
+        """새로운 4개 테이블 구조에 맞춰 매물 저장 (parse_article_detail의 dict도 허용)"""
+        self._count('total_attempts')
+        if isinstance(article, dict):
+            article = ArticleRecord.from_parsed(article)
         
         try:
-            # 1. 메인 매물 테이블 저장
-            property_id = self._save_main_property(parsed_data)
+            # 0. 건물 행 (건물 테이블 사용시, 이번 실행에서 이미 확인한 건물은 DB 요청 없음)
+            building_id = None
+            if self.building_table:
+                with stage_spans.span('save.building'):
+                    building_id = self._save_building(article)
+            
+            # 1. 메인 매물 테이블 저장 (변경 이력/스냅샷은 하위 단계로 따로 측정)
+            with stage_spans.span('save.main_property'):
+                property_id = self._save_main_property(article, building_id)
             if not property_id:
-                self.save_stats['failed_saves'] += 1
+                self._count('failed_saves')
                 return False
             
             # 2. 관련 테이블들 저장 (병렬 처리 아님, 순차 처리로 오류 추적)
             success_count = 0
             
             # 중개사 정보 저장
-            if self._save_realtor_info(property_id, parsed_data):
-                success_count += 1
+            with stage_spans.span('save.realtor'):
+                if self._save_realtor_info(property_id, article):
+                    success_count += 1
             
             # 편의시설/세금 정보 저장  
-            if self._save_facilities_info(property_id, parsed_data):
-                success_count += 1
+            with stage_spans.span('save.facilities'):
+                if self._save_facilities_info(property_id, article):
+                    success_count += 1
             
             # 사진 정보 저장
-            if self._save_photos_info(property_id, parsed_data):
-                success_count += 1
+            with stage_spans.span('save.photos'):
+                if self._save_photos_info(property_id, article):
+                    success_count += 1
             
-            self.save_stats['successful_saves'] += 1
-            print(f"✅ 매물 {parsed_data.get('article_no')} 저장 완료")
+            self._count('successful_saves')
+            logger.debug("✅ 매물 %s 저장 완료", article.article_no)
             return True
             
         except Exception as e:
-            print(f"❌ Failed to save property {parsed_data.get('article_no')}: {e}")
-            self.save_stats['failed_saves'] += 1
+            logger.error("❌ Failed to save property %s: %s", article.article_no, e, extra={'article_no': article.article_no})
+            self._count('failed_saves')
             return False
     
-    def _save_main_property(self, parsed_data: Dict) -> Optional[int]:
-        """naver_properties 테이블에 메인 매물 정보 저장 (UPSERT 방식)"""
+    def _save_main_property(self, article: ArticleRecord, building_id: Optional[int] = None) -> Optional[int]:
+        """
+        메인 매물 정보 저장 (UPSERT 방식, 테이블은 매물 유형별 설정 - 기본 naver_properties)
+        건물 테이블 사용시 건축물대장 컬럼 대신 building_id만 기록
+        """
+        table = property_table(article.real_estate_type_code)
         try:
-            sections = parsed_data.get('sections', {})
-            article_detail = sections.get('articleDetail', {})
-            article_price = sections.get('articlePrice', {})  
-            article_space = sections.get('articleSpace', {})
-            article_floor = sections.get('articleFloor', {})
-            
-            article_no = parsed_data.get('article_no')
-            
-            # 거래 유형에 따른 가격 분리
-            trade_type = article_detail.get('trade_type', '매매')
-            deal_price, warrant_price, rent_price = self._separate_prices_by_trade_type(
-                trade_type, article_detail, article_price
-            )
-            
-            property_data = {
-                # 기본 식별자
-                'article_no': article_no,
-                'is_active': True,
-                
-                # 거래/매물 유형
-                'trade_type_name': trade_type,
-                'real_estate_type_name': article_detail.get('real_estate_type'),
-                
-                # 건물 기본 정보 (카카오 API 건물명 우선 사용)
-                'building_name': article_detail.get('address_info', {}).get('building_name') or None,  # 카카오 API 실제 건물명만
-                'building_use': article_detail.get('building_name'),  # 네이버 API buildingTypeName (건물 유형: 중소형사무실, 대형사무실 등)
-                'law_usage': article_detail.get('law_usage'),
-                
-                # 위치 정보
-                'latitude': self._safe_decimal(article_detail.get('latitude')),
-                'longitude': self._safe_decimal(article_detail.get('longitude')),
-                'exposure_address': article_detail.get('exposure_address'),
-                # 카카오 API로 변환한 상세 주소를 detail_address에 저장 (네이버는 상세주소 제공 안함)
-                'detail_address': article_detail.get('address_info', {}).get('primary_address'),
-                
-                # 가격 정보 (거래유형별 분리)
-                'deal_price': deal_price,
-                'warrant_price': warrant_price,
-                'rent_price': rent_price,
-                'monthly_management_cost': self._safe_int(article_detail.get('manage_cost')),
-                'price_per_area': self._safe_decimal(article_price.get('price_per_area')),
-                
-                # 면적 정보
-                'supply_area': self._safe_decimal(article_space.get('supply_area')),
-                'exclusive_area': self._safe_decimal(article_space.get('exclusive_area')),
-                'common_area': self._safe_decimal(article_space.get('common_area')),
-                
-                # 층수 정보
-                'total_floor': self._safe_int(article_floor.get('total_floor')),
-                'current_floor': self._safe_int(article_floor.get('current_floor')),
-                'floor_description': article_floor.get('floor_description'),
-                
-                # 교통 및 시설
-                'walking_to_subway': self._safe_int(article_detail.get('walking_to_subway')),
-                'parking_count': self._safe_int(article_detail.get('parking_count')),
-                'parking_possible': self._safe_bool(article_detail.get('parking_possible')),
-                'elevator_count': self._safe_int(sections.get('articleFacility', {}).get('elevator_count')),
-                
-                # 새로 추가된 필드들
-                'bathroom_count': article_detail.get('bathroom_count'),
-                'office_count': article_detail.get('office_count'),
-                'heating_type': sections.get('articleFacility', {}).get('heating_type'),
-                'approval_date': sections.get('articleFacility', {}).get('approval_date'),
-                
-                # 건물등기 정보 (articleBuildingRegister)
-                'building_structure': sections.get('articleBuildingRegister', {}).get('structure_type'),
-                'building_main_purpose': sections.get('articleBuildingRegister', {}).get('main_purpose'),
-                'total_elevator_count': self._safe_int(sections.get('articleBuildingRegister', {}).get('total_elevator_count')),
-                
-                # 입주 정보
-                'move_in_type': article_detail.get('move_in_type'),
-                'move_in_discussion': self._safe_bool(article_detail.get('move_in_discussion')),
-                
-                # 새로 추가된 날짜 필드들
-                'article_confirm_date': self._parse_date_string(article_detail.get('article_confirm_date')),
-                'expose_start_date': self._parse_date_string(article_detail.get('expose_start_date')),
-                'expose_end_date': self._parse_date_string(article_detail.get('expose_end_date')),
-                'move_in_possible_date': article_detail.get('move_in_possible_date'),  # NOW, YYYYMMDD 등 다양한 형식
-                
-                # 기타
-                'detail_description': article_detail.get('detail_description'),
-                'management_office_tel': article_detail.get('management_office_tel')
-            }
+            article_no = article.article_no
+            property_data = build_property_row(article)
+            if self.building_table:
+                for column in BUILDING_COLUMNS:
+                    property_data.pop(column, None)
+                property_data['building_id'] = building_id
             
             # 기존 데이터 조회
-            existing = self.client.table('naver_properties').select('*').eq('article_no', article_no).execute()
+            existing = self.client.table(table).select('*').eq('article_no', article_no).execute()
             
             if existing.data:
                 # UPDATE: 기존 매물 업데이트
                 existing_data = existing.data[0]
                 property_id = existing_data['id']
                 
-                # 변경사항 감지 및 history 저장
-                self._save_change_history(existing_data, property_data, property_id)
+                # 변경사항 감지 및 history 저장 (매물별 재수집 주기 계산에 사용)
+                article.change_detected = self._save_change_history(existing_data, property_data, property_id)
                 
                 # 업데이트 실행
                 property_data['last_updated'] = datetime.now().isoformat()
-                result = self.client.table('naver_properties').update(property_data).eq('id', property_id).execute()
+                result = self.client.table(table).update(property_data).eq('id', property_id).execute()
                 
                 if result.data:
-                    self.save_stats['updates'] += 1
-                    print(f"🔄 매물 {article_no} 업데이트 완료")
+                    self._count('updates')
+                    logger.debug("🔄 매물 %s 업데이트 완료", article_no)
                     return property_id
             else:
                 # INSERT: 새 매물 저장
-                result = self.client.table('naver_properties').insert(property_data).execute()
+                result = self.client.table(table).insert(property_data).execute()
+                article.change_detected = False
                 if result.data:
-                    self.save_stats['inserts'] += 1
-                    print(f"✨ 새 매물 {article_no} 저장 완료")
+                    self._count('inserts')
+                    logger.info("✨ 새 매물 %s 저장 완료", article_no, extra={'article_no': article_no, 'sampled': True})
                     return result.data[0]['id']
             
         except Exception as e:
-            print(f"❌ Failed to save/update main property: {e}")
-            self._log_table_error('naver_properties', str(e))
+            logger.error("❌ Failed to save/update main property: %s", e, extra={'table': table})
+            self._log_table_error(table, str(e))
         return None
     
-    def _save_realtor_info(self, property_id: int, parsed_data: Dict) -> bool:
+    def _save_building(self, article: ArticleRecord) -> Optional[int]:
+        """
+        naver_buildings에 건물 1행 upsert(building_key 기준) 후 id 반환 (건물 키가 없으면 None)
+        실행 중 처음 보는 건물만 저장, 이후 같은 건물 매물은 캐시 사용
+        """
+        key = building_key(article)
+        if not key:
+            return None
+        with self._building_lock:
+            building_id = self._building_ids.get(key)
+        if building_id is not None:
+            self._count('building_cache_hits')
+            return building_id
+        
+        table = self.building_table
+        # 여러 워커가 같은 건물을 동시에 저장해도 building_key 유니크 제약으로 행은 하나 (값이 없는 컬럼은 기존 값 유지)
+        try:
+            building_data = {column: value for column, value in build_building_row(article, key).items()
+                             if value is not None}
+            building_data['updated_at'] = datetime.now().isoformat()
+            result = self.client.table(table).upsert(building_data, on_conflict='building_key').execute()
+            self._count('building_writes')
+            if result.data and result.data[0].get('id') is not None:
+                building_id = result.data[0]['id']
+            else:
+                existing = self.client.table(table).select('id').eq('building_key', key).execute()
+                if not existing.data:
+                    return None
+                building_id = existing.data[0]['id']
+        except Exception as e:
+            logger.warning("⚠️ Failed to save building %s: %s", key, e, extra={'table': table})
+            self._log_table_error(table, str(e))
+            return None
+        
+        with self._building_lock:
+            self._building_ids[key] = building_id
+        return building_id
+    
+    def _save_realtor_info(self, property_id: int, article: ArticleRecord) -> bool:
         """naver_realtors 테이블에 중개사 정보 저장"""
         try:
-            sections = parsed_data.get('sections', {})
-            article_realtor = sections.get('articleRealtor', {})
-            
-            if not article_realtor:
+            realtor = article.realtor
+            if not realtor:
                 return True  # 중개사 정보가 없어도 성공으로 처리
             
             realtor_data = {
                 'property_id': property_id,
-                'office_name': article_realtor.get('office_name'),
-                'agent_name': article_realtor.get('agent_name'),
-                'phone_number': article_realtor.get('phone_number'),
-                'representative_mobile': article_realtor.get('representative_mobile'),
-                'office_certified': self._safe_bool(article_realtor.get('office_certified'))
+                'office_name': realtor.office_name,
+                'agent_name': realtor.agent_name,
+                'phone_number': realtor.phone_number,
+                'representative_mobile': realtor.representative_mobile,
+                'office_certified': realtor.office_certified
             }
             
             result = self.client.table('naver_realtors').insert(realtor_data).execute()
             return result.data is not None
             
         except Exception as e:
-            print(f"❌ Failed to save realtor info: {e}")
+            logger.error("❌ Failed to save realtor info: %s", e, extra={'table': 'naver_realtors'})
             self._log_table_error('naver_realtors', str(e))
             return False
     
-    def _save_facilities_info(self, property_id: int, parsed_data: Dict) -> bool:
+    def _save_facilities_info(self, property_id: int, article: ArticleRecord) -> bool:
         """naver_facilities 테이블에 편의시설/세금 정보 저장"""
         try:
-            sections = parsed_data.get('sections', {})
-            article_facility = sections.get('articleFacility', {})
-            article_addition = sections.get('articleAddition', {})
-            article_tax = sections.get('articleTax', {})
-            
             facilities_data = {
                 'property_id': property_id,
                 
                 # 편의시설 (JSON으로 저장)
-                'near_subway': json.dumps(article_facility.get('near_subway', []), ensure_ascii=False),
-                'convenience_facilities': json.dumps(article_facility.get('convenience_facilities', []), ensure_ascii=False),
-                'security_facilities': json.dumps(article_facility.get('security_facilities', []), ensure_ascii=False),
+                'near_subway': json.dumps([subway.to_dict() for subway in article.near_subway], ensure_ascii=False),
+                'convenience_facilities': json.dumps(article.convenience_facilities, ensure_ascii=False),
+                'security_facilities': json.dumps(article.security_facilities, ensure_ascii=False),
                 
                 # 시세 비교 정보
-                'same_addr_direct_deal': self._safe_int(article_addition.get('same_address_direct_deal')),
-                'same_addr_hash': article_addition.get('same_address_hash'),
-                'nearby_sales': json.dumps(article_addition.get('nearby_sales', {}), ensure_ascii=False),
+                'same_addr_direct_deal': article.same_addr_direct_deal,
+                'same_addr_hash': article.same_addr_hash,
+                'nearby_sales': json.dumps(article.nearby_sales, ensure_ascii=False),
                 
                 # 세금 정보
-                'acquisition_tax': self._safe_int(article_tax.get('acquisition_tax')),
-                'brokerage_fee': self._safe_int(article_tax.get('brokerage_fee')),
-                'etc_cost': self._safe_int(article_tax.get('etc_cost'))
+                'acquisition_tax': article.acquisition_tax,
+                'brokerage_fee': article.brokerage_fee,
+                'etc_cost': article.etc_cost
             }
             
             result = self.client.table('naver_facilities').insert(facilities_data).execute()
             return result.data is not None
             
         except Exception as e:
-            print(f"❌ Failed to save facilities info: {e}")
+            logger.error("❌ Failed to save facilities info: %s", e, extra={'table': 'naver_facilities'})
             self._log_table_error('naver_facilities', str(e))
             return False
     
-    def _save_photos_info(self, property_id: int, parsed_data: Dict) -> bool:
+    def _save_photos_info(self, property_id: int, article: ArticleRecord) -> bool:
         """naver_photos 테이블에 사진 정보 저장 (URL 기준 중복 체크 방식)"""
         try:
-            sections = parsed_data.get('sections', {})
-            article_photos = sections.get('articlePhotos', {})
-            
-            photos = article_photos.get('photos', [])
+            photos = article.photos
             if not photos:
-                print(f"✅ 매물 {property_id} 새로운 이미지 없음")
+                logger.debug("✅ 매물 %s 새로운 이미지 없음", property_id)
                 return True
             
             # 재시도 로직 포함된 클라이언트 사용
@@ -263,141 +257,44 @@ class OptimizedPropertyRepository:
             if existing_result.data:
                 existing_urls = {row['image_url'] for row in existing_result.data}
             
-            # 2. 새로운 이미지만 필터링 (URL 기준 중복 체크)
+            # 2. 새로운 이미지만 필터링 (URL 기준 중복 체크, URL 없는 사진은 파서에서 제외됨)
             new_photos = []
             duplicate_count = 0
             
             for photo in photos:
-                image_url = photo.get('url')
-                if not image_url:  # null, None, 빈 문자열 건너뛰기
-                    continue
-                
-                if image_url in existing_urls:
+                if photo.url in existing_urls:
                     duplicate_count += 1
                     continue  # 이미 존재하는 URL은 건너뛰기
                 
-                photo_data = {
+                new_photos.append({
                     'property_id': property_id,
-                    'image_url': image_url,
-                    'thumbnail_url': photo.get('thumbnail_url'),
-                    'description': photo.get('description'),
-                    'display_order': self._safe_int(photo.get('order')),
-                    'registered_datetime': self._parse_datetime_string(photo.get('registered_datetime'))
-                }
-                new_photos.append(photo_data)
+                    'image_url': photo.url,
+                    'thumbnail_url': photo.thumbnail_url,
+                    'description': photo.description,
+                    'display_order': photo.display_order,
+                    'registered_datetime': photo.registered_datetime
+                })
             
             # 3. 새로운 이미지들만 저장
             if new_photos:
                 result = retry_client.table('naver_photos').insert(new_photos).execute()
                 if result.data:
-                    print(f"✅ 매물 {property_id} 새 이미지 {len(result.data)}개 추가 (중복 {duplicate_count}개 건너뛰기)")
+                    logger.debug("✅ 매물 %s 새 이미지 %d개 추가 (중복 %d개 건너뛰기)", property_id, len(result.data), duplicate_count)
                 else:
-                    print(f"⚠️ 매물 {property_id} 이미지 저장 실패")
+                    logger.warning("⚠️ 매물 %s 이미지 저장 실패", property_id, extra={'table': 'naver_photos'})
                     return False
             else:
-                print(f"✅ 매물 {property_id} 모든 이미지 이미 존재함 (중복 {duplicate_count}개 건너뛰기)")
+                logger.debug("✅ 매물 %s 모든 이미지 이미 존재함 (중복 %d개 건너뛰기)", property_id, duplicate_count)
             
             return True
             
         except Exception as e:
-            print(f"❌ Failed to save photos info: {e}")
+            logger.error("❌ Failed to save photos info: %s", e, extra={'table': 'naver_photos'})
             self._log_table_error('naver_photos', str(e))
             return False
     
-    def _separate_prices_by_trade_type(self, trade_type: str, article_detail: Dict, article_price: Dict) -> tuple:
-        """거래 유형에 따라 가격을 적절한 컬럼에 분리"""
-        deal_price = None
-        warrant_price = None
-        rent_price = None
-        
-        # articlePrice에서 실제 API 필드명으로 가격 정보 추출
-        deal_price_raw = article_price.get('deal_price')  # dealPrice -> deal_price (파서에서 변환됨)
-        warrant_price_raw = article_price.get('warrant_price')  # warrantPrice -> warrant_price
-        rent_price_raw = article_price.get('rent_price')  # rentPrice -> rent_price
-        
-        if trade_type == '매매':
-            # 매매는 deal_price에만 저장
-            deal_price = self._safe_int(deal_price_raw)
-        elif trade_type == '전세':
-            # 전세는 warrant_price에만 저장 (보증금)
-            warrant_price = self._safe_int(deal_price_raw or warrant_price_raw)  # 네이버 API는 전세금을 deal_price로 제공
-        elif trade_type == '월세':
-            # 월세는 warrant_price(보증금)와 rent_price(월세)에 저장
-            warrant_price = self._safe_int(warrant_price_raw or deal_price_raw)  # 보증금
-            rent_price = self._safe_int(rent_price_raw)  # 월세액
-        
-        return deal_price, warrant_price, rent_price
-    
-    def _safe_int(self, value: Any) -> Optional[int]:
-        """안전한 정수 변환"""
-        try:
-            if value is None or value == '':
-                return None
-            # 쉼표, '만', '원' 등 제거
-            str_val = str(value).replace(',', '').replace('만', '').replace('원', '').strip()
-            if str_val == '':
-                return None
-            return int(float(str_val))
-        except (ValueError, TypeError):
-            return None
-    
-    def _safe_decimal(self, value: Any) -> Optional[float]:
-        """안전한 소수점 변환 (0.0도 유효한 값으로 처리)"""
-        try:
-            if value is None or value == '':
-                return None
-            result = float(str(value).replace(',', ''))
-            return result  # 0.0도 유효한 값으로 반환
-        except (ValueError, TypeError):
-            return None
-    
-    def _safe_bool(self, value: Any) -> bool:
-        """안전한 불린 변환"""
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            return value.lower() in ('true', 'yes', 'y', '1', 'on')
-        return bool(value) if value is not None else False
-    
-    def _parse_date_string(self, date_str: str) -> Optional[str]:
-        """YYYYMMDD 형식의 날짜 문자열을 YYYY-MM-DD 형식으로 변환"""
-        if not date_str or not isinstance(date_str, str):
-            return None
-        
-        try:
-            # YYYYMMDD (8자리) 형식 확인
-            if len(date_str) == 8 and date_str.isdigit():
-                year = date_str[:4]
-                month = date_str[4:6]
-                day = date_str[6:8]
-                return f"{year}-{month}-{day}"
-            else:
-                return date_str  # 다른 형식은 그대로 저장
-        except Exception:
-            return date_str  # 파싱 실패시 원본 반환
-    
-    def _parse_datetime_string(self, datetime_str: str) -> Optional[str]:
-        """YYYYMMDDHHMMSS 형식의 날짜시간 문자열을 ISO 형식으로 변환"""
-        if not datetime_str or not isinstance(datetime_str, str):
-            return None
-        
-        try:
-            # YYYYMMDDHHMMSS (14자리) 형식 확인
-            if len(datetime_str) == 14 and datetime_str.isdigit():
-                year = datetime_str[:4]
-                month = datetime_str[4:6]
-                day = datetime_str[6:8]
-                hour = datetime_str[8:10]
-                minute = datetime_str[10:12]
-                second = datetime_str[12:14]
-                return f"{year}-{month}-{day}T{hour}:{minute}:{second}"
-            else:
-                return datetime_str  # 다른 형식은 그대로 저장
-        except Exception:
-            return datetime_str  # 파싱 실패시 원본 반환
-    
-    def _save_change_history(self, existing_data: Dict, new_data: Dict, property_id: int):
-        """변경사항을 history 테이블에 저장"""
+    def _save_change_history(self, existing_data: Dict, new_data: Dict, property_id: int) -> bool:
+        """변경사항을 history 테이블에 저장하고 변경 여부 반환"""
         try:
             changes_detected = []
             history_record = {
@@ -455,16 +352,22 @@ class OptimizedPropertyRepository:
                 history_record['change_summary'] = '; '.join(changes_detected)
                 
                 # history 테이블에 저장
-                result = self.client.table('naver_property_history').insert(history_record).execute()
+                with stage_spans.span('save.history'):
+                    result = self.client.table('naver_property_history').insert(history_record).execute()
                 if result.data:
-                    self.save_stats['history_records'] += 1
-                    print(f"📝 변경사항 기록: {history_record['change_summary']}")
+                    self._count('history_records')
+                    logger.info("📝 변경사항 기록: %s", history_record['change_summary'],
+                                extra={'property_id': property_id, 'change_type': history_record['change_type']})
             
             # 가격 스냅샷 저장 (매일 1회)
-            self._save_price_snapshot(new_data, property_id)
+            with stage_spans.span('save.snapshot'):
+                self._save_price_snapshot(new_data, property_id)
+            
+            return bool(changes_detected)
             
         except Exception as e:
-            print(f"⚠️ Failed to save history: {e}")
+            logger.warning("⚠️ Failed to save history: %s", e, extra={'table': 'naver_property_history'})
+            return False
     
     def _save_price_snapshot(self, property_data: Dict, property_id: int):
         """일별 가격 스냅샷 저장"""
@@ -497,22 +400,76 @@ class OptimizedPropertyRepository:
                 
         except Exception as e:
             # 스냅샷 저장 실패는 경고만
-            print(f"⚠️ Failed to save price snapshot: {e}")
+            logger.warning("⚠️ Failed to save price snapshot: %s", e, extra={'table': 'naver_price_snapshots'})
+    
+    def bulk_update_properties(self, rows: List[Dict], batch_size: int = 500) -> Dict[str, int]:
+        """
+        재파싱으로 다시 만든 naver_properties 행을 일괄 반영 (배치당 id 조회 1회 + 행마다 update)
+        DB에 없는 매물은 건너뜀 - 부분 컬럼 upsert는 충돌이 없을 때 나머지 컬럼이 빈 행을 삽입하므로 id 기준 update만 사용
+        """
+        result = {'updated': 0, 'skipped': 0, 'failed': 0}
+        for i in range(0, len(rows), batch_size):
+            batch = rows[i:i + batch_size]
+            try:
+                existing = self.client.table('naver_properties').select('id, article_no').in_(
+                    'article_no', [row['article_no'] for row in batch]
+                ).execute()
+            except Exception as e:
+                logger.error("❌ 일괄 갱신 대상 조회 실패 (%d건): %s", len(batch), e, extra={'table': 'naver_properties'})
+                self._log_table_error('naver_properties', str(e))
+                result['failed'] += len(batch)
+                continue
+            ids = {row['article_no']: row['id'] for row in existing.data or []}
+            
+            for row in batch:
+                if row['article_no'] not in ids:
+                    result['skipped'] += 1
+                    continue
+                values = {column: value for column, value in row.items() if column != 'article_no'}
+                try:
+                    self.client.table('naver_properties').update(values).eq('id', ids[row['article_no']]).execute()
+                    result['updated'] += 1
+                except Exception as e:
+                    logger.error("❌ 매물 갱신 실패: %s", e,
+                                 extra={'table': 'naver_properties', 'article_no': row['article_no']})
+                    self._log_table_error('naver_properties', str(e))
+                    result['failed'] += 1
+        return result
+    
+    def count_recent_changes(self, article_nos: List[str], since: datetime, chunk_size: int = 200) -> Optional[int]:
+        """naver_property_history에서 주어진 매물들의 기간 내 변경 건수 조회 (조회 실패시 None)"""
+        if not article_nos:
+            return 0
+        
+        total = 0
+        try:
+            for i in range(0, len(article_nos), chunk_size):
+                chunk = article_nos[i:i + chunk_size]
+                result = self.client.table('naver_property_history').select('id', count='exact').in_(
+                    'article_no', chunk
+                ).gte('change_detected_at', since.isoformat()).limit(1).execute()
+                total += result.count or 0
+            return total
+        except Exception as e:
+            logger.warning("⚠️ 변경 이력 조회 실패: %s", e)
+            return None
     
     def _log_table_error(self, table_name: str, error_msg: str):
         """테이블별 에러 로깅"""
-        if table_name not in self.save_stats['table_errors']:
-            self.save_stats['table_errors'][table_name] = []
-        self.save_stats['table_errors'][table_name].append({
-            'error': error_msg,
-            'timestamp': datetime.now().isoformat()
-        })
+        with self._stats_lock:
+            self.save_stats['table_errors'].setdefault(table_name, []).append({
+                'error': error_msg,
+                'timestamp': datetime.now().isoformat()
+            })
     
     def get_save_stats(self) -> Dict[str, Any]:
         """저장 통계 반환"""
+        with self._stats_lock:
+            stats = {**self.save_stats, 'table_errors': {table: list(errors) for table, errors in self.save_stats['table_errors'].items()}}
         return {
-            **self.save_stats,
-            'success_rate': f"{(self.save_stats['successful_saves'] / max(1, self.save_stats['total_attempts']) * 100):.2f}%"
+            **stats,
+            'db_round_trips': self.supabase_client.request_count,
+            'success_rate': f"{(stats['successful_saves'] / max(1, stats['total_attempts']) * 100):.2f}%"
         }
     
     def print_save_summary(self):
@@ -527,6 +484,8 @@ class OptimizedPropertyRepository:
         print(f"   신규 저장: {stats['inserts']}건")
         print(f"   업데이트: {stats['updates']}건")
         print(f"   변경 이력: {stats['history_records']}건")
+        if self.building_table:
+            print(f"   건물 저장/갱신: {stats['building_writes']}건 (이미 확인한 건물 {stats['building_cache_hits']}건)")
         
         if stats['table_errors']:
             print(f"\n❌ 테이블별 에러:")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+ArticleRecord -> 테이블 행 변환
+저장소(수집 저장)와 재파싱(reparse) 프로세스가 함께 사용 - DB 클라이언트에 의존하지 않음
+"""
+
+import re
+from typing import Any, Dict, Optional
+from parsers.records import ArticleRecord
+
+# 카카오 주소 변환 결과에서 채우는 컬럼 (아카이브 응답만으로는 다시 만들 수 없음)
+ADDRESS_COLUMNS = ('building_name', 'detail_address')
+
+# 건물 테이블(naver_buildings)을 쓰면 매물 행에서 빼고 building_id로 참조하는 건축물대장 컬럼
+BUILDING_COLUMNS = ('building_structure', 'building_main_purpose', 'total_elevator_count')
+
+_ADDRESS_SPACES = re.compile(r'\s+')
+
+
+def normalize_address(address: Optional[str]) -> Optional[str]:
+    """건물 키용 주소 정규화 ('서울특별시'/'서울' 표기, 공백 차이 제거)"""
+    if not address:
+        return None
+    address = _ADDRESS_SPACES.sub(' ', address.strip())
+    for long_name, short_name in (('서울특별시', '서울'), ('서울시', '서울')):
+        if address.startswith(long_name):
+            address = short_name + address[len(long_name):]
+    return address or None
+
+
+def building_key(article: ArticleRecord) -> Optional[str]:
+    """건물 식별 키 - 건축물대장 PK(mgmBldrgstPk), 없으면 카카오 변환 주소 (둘 다 없으면 None)"""
+    building = article.building
+    if building and building.building_register_pk:
+        return f"pk:{building.building_register_pk}"
+    address = normalize_address((article.address_info or {}).get('primary_address'))
+    return f"addr:{address}" if address else None
+
+
+def build_building_row(article: ArticleRecord, key: str) -> Dict[str, Any]:
+    """naver_buildings 행 (건축물대장 값 + 건물명/주소/좌표)"""
+    address_info = article.address_info or {}
+    row = article.building.to_dict() if article.building else {}
+    row.update({
+        'building_key': key,
+        'building_name': address_info.get('building_name') or None,
+        'address': address_info.get('primary_address'),
+        'latitude': article.latitude,
+        'longitude': article.longitude
+    })
+    return row
+
+
+def build_property_row(article: ArticleRecord) -> Dict[str, Any]:
+    """naver_properties 행 (레코드 값은 이미 정규화되어 있어 그대로 사용)"""
+    address_info = article.address_info or {}
+    return {
+        # 기본 식별자
+        'article_no': article.article_no,
+        'is_active': article.is_active,
+
+        # 거래/매물 유형
+        'trade_type_name': article.trade_type,
+        'real_estate_type_name': article.real_estate_type,
+
+        # 건물 기본 정보 (카카오 API 건물명 우선 사용)
+        'building_name': address_info.get('building_name') or None,  # 카카오 API 실제 건물명만
+        'building_use': article.building_use,  # 네이버 API buildingTypeName (건물 유형: 중소형사무실, 대형사무실 등)
+        'law_usage': article.law_usage,
+
+        # 위치 정보
+        'latitude': article.latitude,
+        'longitude': article.longitude,
+        'exposure_address': article.exposure_address,
+        # 카카오 API로 변환한 상세 주소를 detail_address에 저장 (네이버는 상세주소 제공 안함)
+        'detail_address': address_info.get('primary_address'),
+
+        # 가격 정보 (거래유형별 분리)
+        'deal_price': article.deal_price,
+        'warrant_price': article.warrant_price,
+        'rent_price': article.rent_price,
+        'monthly_management_cost': article.monthly_management_cost,
+        'price_per_area': article.price_per_area,
+
+        # 면적 정보
+        'supply_area': article.supply_area,
+        'exclusive_area': article.exclusive_area,
+        'common_area': article.common_area,
+
+        # 층수 정보
+        'total_floor': article.total_floor,
+        'current_floor': article.current_floor,
+        'floor_description': article.floor_description,
+
+        # 교통 및 시설
+        'walking_to_subway': article.walking_to_subway,
+        'parking_count': article.parking_count,
+        'parking_possible': article.parking_possible,
+        'elevator_count': article.elevator_count,
+
+        # 새로 추가된 필드들
+        'bathroom_count': article.bathroom_count,
+        'office_count': article.office_count,
+        'heating_type': article.heating_type,
+        'approval_date': article.approval_date,
+
+        # 건물등기 정보 (articleBuildingRegister)
+        'building_structure': article.building_structure,
+        'building_main_purpose': article.building_main_purpose,
+        'total_elevator_count': article.total_elevator_count,
+
+        # 입주 정보
+        'move_in_type': article.move_in_type,
+        'move_in_discussion': article.move_in_discussion,
+
+        # 새로 추가된 날짜 필드들
+        'article_confirm_date': article.article_confirm_date,
+        'expose_start_date': article.expose_start_date,
+        'expose_end_date': article.expose_end_date,
+        'move_in_possible_date': article.move_in_possible_date,  # NOW, YYYYMMDD 등 다양한 형식
+
+        # 기타
+        'detail_description': article.detail_description,
+        'management_office_tel': article.management_office_tel
+    }
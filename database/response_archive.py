@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+원본 API 응답 압축 아카이브
+목록/상세 응답을 날짜별 세그먼트 파일에 응답 1건 = 압축 프레임 1개로 추가하고,
+(종류, 키) -> (세그먼트, offset, 길이) 인덱스를 SQLite로 관리
+
+세그먼트: responses-YYYYMMDD.jsonl.zst (zstandard 미설치 시 .jsonl.gz)
+프레임 내용: {"kind": ..., "key": ..., "fetched_at": ..., "body": <원본 응답 JSON>}
+"""
+
+import atexit
+import gzip
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from config.settings import settings
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    zstandard = None
+    HAS_ZSTD = False
+
+SEGMENT_PREFIX = 'responses-'
+
+
+def read_frame(archive_dir: str, segment: str, offset: int, length: int) -> Dict:
+    """세그먼트의 프레임 1개를 읽어 {"kind", "key", "fetched_at", "body"} 반환 (인덱스 없이 사용 가능)"""
+    with open(Path(archive_dir) / segment, 'rb') as f:
+        f.seek(offset)
+        frame = f.read(length)
+    if segment.endswith('.zst'):
+        if not HAS_ZSTD:
+            raise RuntimeError(f"zstandard 미설치로 {segment}를 읽을 수 없음")
+        return json.loads(zstandard.ZstdDecompressor().decompress(frame))
+    return json.loads(gzip.decompress(frame))
+
+
+class ResponseArchive:
+    """응답 아카이브 (스레드 안전 - 수집 워커들이 동시에 추가)"""
+
+    def __init__(self, archive_dir: str = None, compression_level: int = None):
+        config = settings.archive_settings
+        self.archive_dir = Path(archive_dir or config['archive_dir'])
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        level = compression_level or config['compression_level']
+        self.extension = '.jsonl.zst' if HAS_ZSTD else '.jsonl.gz'
+        self._compress = (zstandard.ZstdCompressor(level=level).compress if HAS_ZSTD
+                          else lambda data: gzip.compress(data, compresslevel=min(level, 9)))
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.archive_dir / 'index.db'), check_same_thread=False)
+        self._ensure_schema()
+        self.stats = {'appended': 0, 'raw_bytes': 0, 'stored_bytes': 0}
+        # 인덱스는 commit_every건 또는 commit_interval초마다 커밋 (커밋 전 중단되면 세그먼트의 마지막 프레임들만 인덱스에서 빠짐)
+        self.commit_every = config['commit_every']
+        self.commit_interval = config['commit_interval']
+        self._pending = 0
+        self._last_commit = time.time()
+        atexit.register(self.flush)
+
+    def _ensure_schema(self):
+        with self._lock:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    segment TEXT NOT NULL,
+                    offset INTEGER NOT NULL,
+                    length INTEGER NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_key ON entries(kind, key, fetched_at)")
+            self.conn.commit()
+
+    def _segment_name(self, fetched_at: float) -> str:
+        return f"{SEGMENT_PREFIX}{datetime.fromtimestamp(fetched_at).strftime('%Y%m%d')}{self.extension}"
+
+    def append(self, kind: str, key: str, body: bytes, fetched_at: float = None) -> None:
+        """
+        응답 1건 추가
+        kind: 'detail'(key=article_no) 또는 'list'(key=cortar_no:page:order:...:쿼리 해시)
+        body: 원본 응답 바이트 (JSON)
+        """
+        fetched_at = fetched_at or time.time()
+        header = json.dumps({'kind': kind, 'key': key, 'fetched_at': fetched_at}, ensure_ascii=False)
+        record = header[:-1].encode('utf-8') + b', "body": ' + body.strip() + b'}\n'
+        frame = self._compress(record)
+        segment = self._segment_name(fetched_at)
+
+        with self._lock:
+            with open(self.archive_dir / segment, 'ab') as f:
+                offset = f.tell()
+                f.write(frame)
+            self.conn.execute(
+                "INSERT INTO entries (kind, key, segment, offset, length, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, key, segment, offset, len(frame), fetched_at)
+            )
+            self._pending += 1
+            if self._pending >= self.commit_every or time.time() - self._last_commit >= self.commit_interval:
+                self._commit()
+            self.stats['appended'] += 1
+            self.stats['raw_bytes'] += len(record)
+            self.stats['stored_bytes'] += len(frame)
+
+    def read_entry(self, segment: str, offset: int, length: int) -> Dict:
+        return read_frame(str(self.archive_dir), segment, offset, length)
+
+    def get_latest(self, kind: str, key: str) -> Optional[Dict]:
+        """가장 최근에 저장된 응답 본문 (없으면 None)"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT segment, offset, length FROM entries WHERE kind = ? AND key = ? ORDER BY fetched_at DESC LIMIT 1",
+                (kind, key)
+            ).fetchone()
+        return self.read_entry(*row)['body'] if row else None
+
+    def get_latest_locations(self, kind: str = 'detail', since: float = None
+                             ) -> List[Tuple[str, str, int, int]]:
+        """키별 최신 응답 위치 [(key, segment, offset, length)] - 세그먼트/offset 순 (순차 읽기)"""
+        query = """
+            SELECT key, segment, offset, length FROM entries
+            WHERE id IN (SELECT MAX(id) FROM entries WHERE kind = ? AND fetched_at >= ? GROUP BY key)
+            ORDER BY segment, offset
+        """
+        with self._lock:
+            return self.conn.execute(query, (kind, since or 0)).fetchall()
+
+    def iter_entries(self, kind: str = None) -> Iterator[Dict]:
+        """전체 응답을 저장 순서대로 순회"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT segment, offset, length FROM entries WHERE (? IS NULL OR kind = ?) ORDER BY id",
+                (kind, kind)
+            ).fetchall()
+        for row in rows:
+            yield self.read_entry(*row)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            counts = dict(self.conn.execute("SELECT kind, COUNT(*) FROM entries GROUP BY kind").fetchall())
+        ratio = self.stats['raw_bytes'] / self.stats['stored_bytes'] if self.stats['stored_bytes'] else None
+        return {**self.stats, 'entries_by_kind': counts, 'compression_ratio': ratio}
+
+    def _commit(self):
+        """대기 중인 인덱스 행 커밋 (잠금을 잡은 상태에서 호출)"""
+        self.conn.commit()
+        self._pending = 0
+        self._last_commit = time.time()
+
+    def flush(self):
+        """대기 중인 인덱스 행 커밋"""
+        with self._lock:
+            if self._pending:
+                self._commit()
+
+    def close(self):
+        with self._lock:
+            if self._pending:
+                self._commit()
+            self.conn.close()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+수집 실행 기록 (SQLite collection_runs 테이블)
+main.py 실행 1회가 끝날 때마다 get_comprehensive_stats() 결과를 한 행으로 남겨 실행 간 성능 추이 비교에 사용
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+from config.settings import settings
+
+# 실행 기록에 남기는 단계별 시간 항목 (stage_spans.get_stats()의 일부)
+STAGE_TIMING_FIELDS = ('count', 'mean_ms', 'p95_ms', 'self_seconds')
+
+
+def build_run_record(stats: Dict[str, Any], mode: str, areas: Sequence[str], started_at: float,
+                     finished_at: float, status: str = 'completed') -> Dict[str, Any]:
+    """CollectionService.get_comprehensive_stats() 결과를 collection_runs 행으로 변환"""
+    collection = stats['collection_stats']
+    api = stats.get('api_stats', {})
+    duration = max(finished_at - started_at, 0.0)
+    fetched = collection['total_processed']
+    return {
+        'started_at': started_at,
+        'finished_at': finished_at,
+        'duration': round(duration, 3),
+        'mode': mode,
+        'status': status,
+        'areas': list(dict.fromkeys(areas)),
+        'articles_seen': collection.get('articles_seen', 0),
+        'articles_fetched': fetched,
+        'articles_skipped': collection.get('detail_requests_avoided', 0) + collection.get('refresh_skipped', 0),
+        'articles_saved': collection['successful_collections'],
+        'parse_failures': collection['parsing_failures'],
+        'save_failures': collection['save_failures'],
+        'api_calls': api.get('total_requests', 0),
+        'rate_limited': api.get('rate_limited', 0),
+        'geocode_calls': stats.get('address_stats', {}).get('total_requests', 0),
+        'db_round_trips': stats.get('save_stats', {}).get('db_round_trips', 0),
+        'articles_per_sec': round(fetched / duration, 3) if duration > 0 else 0.0,
+        'stage_timings': {
+            stage: {field: timing[field] for field in STAGE_TIMING_FIELDS}
+            for stage, timing in stats.get('stage_timings', {}).items()
+        }
+    }
+
+
+class RunLedger:
+    """collection_runs 테이블 (스레드 안전)"""
+
+    JSON_COLUMNS = ('areas', 'stage_timings')
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or settings.state_settings['run_ledger_path']
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._ensure_schema()
+
+    def _ensure_schema(self):
+        with self._lock:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS collection_runs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    started_at REAL,
+                    finished_at REAL,
+                    duration REAL,
+                    mode TEXT,
+                    status TEXT,
+                    areas TEXT,
+                    articles_seen INTEGER,
+                    articles_fetched INTEGER,
+                    articles_skipped INTEGER,
+                    articles_saved INTEGER,
+                    parse_failures INTEGER,
+                    save_failures INTEGER,
+                    api_calls INTEGER,
+                    rate_limited INTEGER,
+                    geocode_calls INTEGER,
+                    db_round_trips INTEGER,
+                    articles_per_sec REAL,
+                    stage_timings TEXT
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_collection_runs_mode ON collection_runs(mode, finished_at)")
+            self.conn.commit()
+
+    def record_run(self, record: Dict[str, Any]) -> int:
+        """실행 기록 1행 추가 후 id 반환"""
+        row = {key: json.dumps(value, ensure_ascii=False) if key in self.JSON_COLUMNS else value
+               for key, value in record.items()}
+        columns = ', '.join(row)
+        placeholders = ', '.join('?' * len(row))
+        with self._lock:
+            cursor = self.conn.execute(f"INSERT INTO collection_runs ({columns}) VALUES ({placeholders})",
+                                       list(row.values()))
+            self.conn.commit()
+        return cursor.lastrowid
+
+    def recent_runs(self, limit: int = 20, mode: Optional[str] = None) -> List[Dict[str, Any]]:
+        """최근 실행 기록 (오래된 순)"""
+        query = "SELECT * FROM collection_runs"
+        params: List[Any] = []
+        if mode:
+            query += " WHERE mode = ?"
+            params.append(mode)
+        query += " ORDER BY finished_at DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self.conn.execute(query, params).fetchall()
+
+        runs = []
+        for row in reversed(rows):
+            run = dict(row)
+            for column in self.JSON_COLUMNS:
+                run[column] = json.loads(run[column]) if run[column] else ([] if column == 'areas' else {})
+            runs.append(run)
+        return runs
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
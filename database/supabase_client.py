@@ -1,21 +1,89 @@
 #!/usr/bin/env python3
 """
 Supabase 클라이언트 관리
+클라이언트는 처음 사용할 때 생성 (import만으로는 연결하지 않음)
+NAVER_DB_BACKEND=fake 이면 메모리 클라이언트(database/fake_supabase.py) 사용
 """
 
-from supabase import create_client
 from config.settings import settings
+import threading
 import time
 
+DB_BACKENDS = ('supabase', 'fake')
+
+class _CountingQuery:
+    """쿼리 빌더 체인을 감싸 execute() 1회를 DB 왕복 1회로 집계"""
+    
+    def __init__(self, query, on_execute):
+        self._query = query
+        self._on_execute = on_execute
+    
+    def execute(self, *args, **kwargs):
+        self._on_execute()
+        return self._query.execute(*args, **kwargs)
+    
+    def __getattr__(self, name):
+        attr = getattr(self._query, name)
+        if not callable(attr):
+            return attr
+        
+        def chained(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            return _CountingQuery(result, self._on_execute) if hasattr(result, 'execute') else result
+        return chained
+
+class CountingClient:
+    """table()/rpc()로 만든 쿼리의 실행 횟수를 세는 클라이언트 래퍼 (나머지 속성은 그대로 전달)"""
+    
+    def __init__(self, client, on_execute):
+        self._client = client
+        self._on_execute = on_execute
+    
+    def table(self, name: str):
+        return _CountingQuery(self._client.table(name), self._on_execute)
+    
+    def rpc(self, name: str, *args, **kwargs):
+        return _CountingQuery(self._client.rpc(name, *args, **kwargs), self._on_execute)
+    
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+def create_backend_client():
+    """설정의 database_settings['backend']에 맞는 클라이언트 생성"""
+    config = settings.database_settings
+    backend = config['backend']
+    if backend == 'fake':
+        from database.fake_supabase import FakeSupabaseClient
+        print(f"🧪 메모리 DB 사용 (요청당 지연 {config['fake_latency']}초)")
+        return FakeSupabaseClient(latency=config['fake_latency'])
+    if backend != 'supabase':
+        raise ValueError(f"알 수 없는 DB 백엔드: {backend} (가능: {', '.join(DB_BACKENDS)})")
+
+    from supabase import create_client
+    return create_client(
+        settings.supabase_config['url'],
+        settings.supabase_config['key']
+    )
+
 class SupabaseClient:
-    def __init__(self):
-        self.client = create_client(
-            settings.supabase_config['url'],
-            settings.supabase_config['key']
-        )
+    def __init__(self, client=None):
+        """client: 미리 만든 클라이언트 (FakeSupabaseClient 등), 없으면 처음 사용할 때 설정에 따라 생성"""
+        self._client = CountingClient(client, self._count_request) if client is not None else None
         self.connection_verified = False
         self._connection_pool_retry = 0
         self._max_pool_retries = 3
+        self.request_count = 0  # DB 왕복 수 (execute 호출 수, 실행 기록용)
+        self._stats_lock = threading.Lock()
+    
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = CountingClient(create_backend_client(), self._count_request)
+        return self._client
+    
+    def _count_request(self):
+        with self._stats_lock:
+            self.request_count += 1
     
     def verify_connection(self) -> bool:
         try:
@@ -51,4 +119,4 @@ class SupabaseClient:
         # 모든 재시도 실패시 원래 클라이언트 반환
         return self.client
 
-supabase_client = SupabaseClient()
\ No newline at end of file
+supabase_client = SupabaseClient()
@@ -4,15 +4,20 @@
 """
 
 import sys
+import time
 import argparse
+import logging
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 # 현재 디렉토리를 Python path에 추가
 current_dir = Path(__file__).parent
 sys.path.insert(0, str(current_dir))
 
 from services.collection_service import CollectionService
+from config.settings import settings
+
+logger = logging.getLogger('main')
 
 def main():
     parser = argparse.ArgumentParser(description='네이버 부동산 데이터 수집기 v2.0')
@@ -23,15 +28,90 @@ def main():
     parser.add_argument('--gangnam', action='store_true', help='강남구 전체 수집')
     parser.add_argument('--priority', action='store_true', help='우선순위 순서로 전체 지역 수집')
     parser.add_argument('--high-priority', action='store_true', help='높은 우선순위 지역만 수집 (20점 이상)')
+    parser.add_argument('--discovery', action='store_true', help='최신순 목록으로 신규/변경 매물만 수집 (이미 아는 매물 페이지에서 조기 종료)')
+    parser.add_argument('--watch', action='store_true', help='높은 우선순위 지역 1페이지를 짧은 주기로 감시하여 신규 매물 즉시 수집')
+    parser.add_argument('--watch-interval', type=float, help='감시 주기 (초)')
+    parser.add_argument('--max-cycles', type=int, help='감시/스케줄러 최대 주기 수 (기본: 무한)')
+    parser.add_argument('--schedule', action='store_true', help='우선순위/변경률 기반으로 재수집할 지역을 골라 반복 수집')
+    parser.add_argument('--smart-refresh', action='store_true', help='목록 변경이 없고 매물별 재수집 주기(TTL)가 남은 매물은 상세 요청 생략')
+    parser.add_argument('--tiled', action='store_true', help='큰 지역 목록을 위경도 타일로 나눠 병렬 조회 (전체 수집)')
+    parser.add_argument('--banded', action='store_true', help='지역 목록을 면적/가격 구간으로 나눠 병렬 조회 (전체 수집)')
+    parser.add_argument('--group-address', action='store_true', help='동일주소 매물을 묶어 목록 조회 (구성원은 묶음이 바뀌었거나 주기가 지났을 때만 수집)')
+    parser.add_argument('--prefilter', action='store_true', help='검증 규칙을 목록 쿼리에 적용하고 조건 밖 매물의 상세 요청 생략')
+    parser.add_argument('--reparse', action='store_true', help='응답 아카이브로 naver_properties 컬럼 재생성 (API 호출 없음)')
+    parser.add_argument('--since', type=str, help='재파싱에 사용할 응답 시작일 (YYYY-MM-DD)')
+    parser.add_argument('--columns', type=str, help='재파싱으로 갱신할 컬럼 (쉼표 구분, 기본: 전체)')
+    parser.add_argument('--workers', type=int, help='재파싱 프로세스 수')
+    parser.add_argument('--dry-run', action='store_true', help='재파싱 결과를 DB에 쓰지 않음')
+    parser.add_argument('--profile', action='store_true', help='샘플링 프로파일러로 실행하고 flamegraph용 folded stack 파일 저장')
+    parser.add_argument('--profile-output', type=str, help='프로파일 파일 경로 (기본: data/profiles/profile-시각.folded)')
+    parser.add_argument('--metrics-port', type=int, help='Prometheus 지표 엔드포인트 포트 (/metrics, 기본: NAVER_METRICS_PORT)')
+    parser.add_argument('--log-level', type=str, help='로그 레벨 (DEBUG/INFO/WARNING, 기본: NAVER_LOG_LEVEL)')
+    parser.add_argument('--log-file', type=str, help='JSON lines 구조화 로그 파일 (기본: NAVER_LOG_FILE)')
+    parser.add_argument('--report', action='store_true', help='최근 수집 실행 기록의 성능 추이 출력 (매물/초 저하 표시)')
+    parser.add_argument('--deadline', type=str, help='사이클 마감 (지금부터 초 또는 HH:MM) - 마감 전에 끝낼 작업을 가치 순으로 계획')
+    parser.add_argument('--request-budget', type=int, help='사이클 최대 API 요청 수 - 예산 안에서 작업을 가치 순으로 계획')
+    parser.add_argument('--districts', type=str, help='--priority/--schedule/계획 사이클 대상 구 (쉼표 구분, 기본: NAVER_DISTRICTS, 둘 다 없으면 기존 강남구 목록)')
+    parser.add_argument('--regions', action='store_true', help='대상 구의 동 코드 목록 출력 (지역 목록 API, 디스크 캐시)')
+    parser.add_argument('--refresh-regions', action='store_true', help='지역 캐시 TTL과 관계없이 지역 목록 다시 조회')
     
     args = parser.parse_args()
     
+    from monitoring.structured_log import setup_logging
+    setup_logging(level=args.log_level, log_file=args.log_file)
+    
+    if args.report:
+        from services.run_report import print_run_report
+        print_run_report()
+        return
+    
+    districts = [name.strip() for name in args.districts.split(',') if name.strip()] if args.districts else None
+    if args.regions:
+        from services.region_service import RegionService
+        RegionService().print_tree(districts, refresh=args.refresh_regions)
+        return
+    
     # 수집 서비스 초기화
     print("🚀 네이버 부동산 수집기 v2.0 시작")
     print("="*50)
     
+    profiler = None
+    if args.profile:
+        from monitoring.profiler import SamplingProfiler
+        profiler = SamplingProfiler(settings.monitoring_settings['profile_interval']).start()
+        print("🔬 샘플링 프로파일러 실행 중")
+    
+    metrics_port = args.metrics_port or settings.monitoring_settings['metrics_port']
+    if metrics_port:
+        from monitoring.metrics import start_metrics_server
+        start_metrics_server(metrics_port, settings.monitoring_settings['metrics_host'])
+    
+    service = None
+    run_started_at = time.time()
+    run_status = 'completed'
+    
     try:
-        service = CollectionService()
+        if args.reparse:
+            from datetime import datetime
+            from services.reparse_service import ReparseService
+            ReparseService(workers=args.workers).run(
+                since=datetime.strptime(args.since, '%Y-%m-%d') if args.since else None,
+                columns=[column.strip() for column in args.columns.split(',')] if args.columns else None,
+                dry_run=args.dry_run,
+                limit=args.max_articles
+            )
+            return
+        
+        service = CollectionService(list_prefilter=args.prefilter or None, smart_refresh=args.smart_refresh or None,
+                                    tiled_listing=args.tiled or None, banded_listing=args.banded or None,
+                                    same_address_group=args.group_address or None)
+        # 지역 수집 방식: 전체 랭킹순 수집 또는 최신순 신규 매물 탐색
+        collect_area = service.discover_and_save_area if args.discovery else service.collect_and_save_area
+        sweep_mode = 'discovery' if args.discovery else 'full'
+        deadline = None
+        if args.deadline:
+            from services.cycle_planner import parse_deadline
+            deadline = parse_deadline(args.deadline)
         
         if args.article:
             print(f"📋 단일 매물 수집: {args.article}")
@@ -41,9 +121,35 @@ def main():
             else:
                 print("❌ 매물 수집 실패")
                 
+        elif args.watch:
+            from config.area_codes import get_high_priority_areas
+            from services.listing_watcher import ListingWatcher
+            if args.area:
+                watch_areas = [{'name': args.area, 'code': args.area}]
+            else:
+                watch_areas = get_high_priority_areas(min_score=settings.watcher_settings['min_priority'])
+            
+            watcher = ListingWatcher(service, watch_areas, poll_interval=args.watch_interval)
+            watcher.run(max_cycles=args.max_cycles)
+            
+        elif args.schedule:
+            from services.area_scheduler import AreaScheduler
+            from services.region_service import get_collection_areas
+            scheduler = AreaScheduler(service, get_collection_areas(districts, args.refresh_regions, service.api_client),
+                                      collect_area=collect_area)
+            scheduler.run(max_visits=args.max_cycles, max_pages=args.max_pages, max_articles=args.max_articles,
+                          until=deadline)
+            
+        elif deadline or args.request_budget:
+            from services.cycle_planner import CyclePlanner
+            planner = CyclePlanner(service, planned_areas(args, districts, service.api_client), deadline=deadline,
+                                   request_budget=args.request_budget)
+            planner.run(max_pages=args.max_pages)
+            
         elif args.area:
             print(f"🏢 지역 수집: {args.area}")
-            result = service.collect_and_save_area(
+            service.progress.plan([args.area], sweep_mode, args.max_pages)
+            result = collect_area(
                 args.area, 
                 max_pages=args.max_pages,
                 max_articles=args.max_articles
@@ -58,11 +164,12 @@ def main():
             print("🏙️ 강남구 전체 수집")
             from config.area_codes import get_gangnam_areas
             gangnam_areas = get_gangnam_areas()
+            service.progress.plan([area['code'] for area in gangnam_areas], sweep_mode, args.max_pages)
             
             total_results = []
             for area in gangnam_areas:
-                print(f"\n🔍 {area['name']} 수집 중...")
-                result = service.collect_and_save_area(
+                logger.info("🔍 %s 수집 중...", area['name'])
+                result = collect_area(
                     area['code'], 
                     max_pages=args.max_pages,
                     max_articles=args.max_articles
@@ -83,14 +190,16 @@ def main():
                 print(f"   {result['area_name']}: {result['successful_collections']}/{result['total_found']} ({result['success_rate']})")
         
         elif args.priority:
-            print("🏅 강남구 우선순위 순서로 전체 지역 수집")
-            from config.area_codes import get_all_priority_areas
-            priority_areas = get_all_priority_areas()
+            from services.region_service import get_collection_areas
+            priority_areas = get_collection_areas(districts, args.refresh_regions, service.api_client)
+            print(f"🏅 {', '.join(districts or settings.region_settings['districts'] or ['강남구'])} 우선순위 순서로 전체 지역 수집 "
+                  f"({len(priority_areas)}개 동)")
+            service.progress.plan([area['code'] for area in priority_areas], sweep_mode, args.max_pages)
             
             total_results = []
             for area in priority_areas:
-                print(f"\n🔍 {area['name']} (우선순위: {area['priority']}점) 수집 중...")
-                result = service.collect_and_save_area(
+                logger.info("🔍 %s (우선순위: %d점) 수집 중...", area['name'], area['priority'])
+                result = collect_area(
                     area['code'], 
                     max_pages=args.max_pages,
                     max_articles=args.max_articles
@@ -99,7 +208,7 @@ def main():
                 result['priority'] = area['priority']
                 total_results.append(result)
             
-            print("\n📍 강남구 지역별 상세 결과 (우선순위순):")
+            print("\n📍 지역별 상세 결과 (우선순위순):")
             for result in total_results:
                 print(f"   {result['area_name']} ({result['priority']}점): {result['successful_collections']}/{result['total_found']} ({result['success_rate']})")
         
@@ -107,11 +216,12 @@ def main():
             print("⭐ 강남구 높은 우선순위 지역만 수집 (20점 이상)")
             from config.area_codes import get_high_priority_areas
             high_priority_areas = get_high_priority_areas(min_score=20)
+            service.progress.plan([area['code'] for area in high_priority_areas], sweep_mode, args.max_pages)
             
             total_results = []
             for area in high_priority_areas:
-                print(f"\n🔍 {area['name']} (우선순위: {area['priority']}점) 수집 중...")
-                result = service.collect_and_save_area(
+                logger.info("🔍 %s (우선순위: %d점) 수집 중...", area['name'], area['priority'])
+                result = collect_area(
                     area['code'], 
                     max_pages=args.max_pages,
                     max_articles=args.max_articles
@@ -129,25 +239,102 @@ def main():
             print("   --area AREA_CODE     : 특정 지역 수집")
             print("   --article ARTICLE_NO : 특정 매물 수집") 
             print("   --gangnam           : 강남구 전체 수집")
-            print("   --priority          : 강남구 우선순위 순서로 전체 지역 수집")
+            print("   --priority          : 대상 구(NAVER_DISTRICTS) 우선순위 순서로 전체 지역 수집")
             print("   --high-priority     : 강남구 높은 우선순위 지역만 수집 (20점 이상)")
+            print("   --discovery         : 위 지역 수집을 최신순 신규 매물 탐색으로 실행")
+            print("   --watch             : 역삼동/삼성동 등 높은 우선순위 지역 신규 매물 감시")
+            print("   --schedule          : 변경이 잦은 지역부터 재수집하는 스케줄러 실행")
+            print("   --deadline / --request-budget : 마감/요청 예산 안에서 신규 탐색과 재수집을 가치 순으로 계획")
+            print("   --regions           : 대상 구의 동 코드 목록 확인 (--districts로 구 지정)")
+            print("   --reparse           : 응답 아카이브(NAVER_ARCHIVE_ENABLED=true로 수집)로 DB 컬럼 재생성")
             print("\n예시:")
             print("   python main.py --area 1168010600 --max-articles 10")
             print("   python main.py --article 2390390123")
             print("   python main.py --gangnam --max-pages 2")
             print("   python main.py --priority --max-articles 5")
             print("   python main.py --high-priority --max-pages 1")
+            print("   python main.py --gangnam --discovery")
+            print("   python main.py --area 1168010100 --tiled")
+            print("   python main.py --area 1168010100 --group-address")
+            print("   NAVER_BAND_DIMENSION=price python main.py --area 1168010100 --banded")
+            print("   python main.py --watch --watch-interval 60")
+            print("   python main.py --schedule --discovery")
+            print("   python main.py --reparse --columns total_floor,current_floor --since 2026-09-01")
+            print("   python main.py --area 1168010600 --max-articles 50 --profile")
+            print("   python main.py --schedule --metrics-port 9108")
+            print("   python main.py --gangnam --log-file logs/gangnam.jsonl --log-level WARNING")
+            print("   python main.py --report")
+            print("   python main.py --priority --deadline 1740")
+            print("   python main.py --regions --districts 강남구,서초구")
+            print("   python main.py --priority --districts 서초구 --discovery")
+            print("   python main.py --high-priority --deadline 06:00 --request-budget 3000")
             return
         
         # 최종 통계 출력
         service.print_final_summary()
         
     except KeyboardInterrupt:
+        run_status = 'interrupted'
         print("\n\n⚠️ 사용자에 의해 중단되었습니다.")
     except Exception as e:
+        run_status = 'failed'
         print(f"\n❌ 예상치 못한 오류: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        mode = run_mode(args)
+        if service and mode and settings.monitoring_settings['record_runs']:
+            record_run(service, mode, run_started_at, run_status)
+        if profiler:
+            write_profile(profiler, args.profile_output)
+
+def planned_areas(args, districts: List[str] = None, api_client=None) -> List[Dict]:
+    """--deadline/--request-budget 사이클 대상 지역 (--area/--gangnam/--high-priority, 기본: 대상 구 전체 동)"""
+    from config.area_codes import get_all_priority_areas, get_gangnam_areas, get_high_priority_areas
+    from services.region_service import get_collection_areas
+    if args.area:
+        known = {area['code']: area for area in get_all_priority_areas()}
+        return [known.get(args.area, {'name': args.area, 'code': args.area, 'priority': 0})]
+    if args.gangnam:
+        return get_gangnam_areas()
+    if args.high_priority:
+        return get_high_priority_areas(min_score=20)
+    return get_collection_areas(districts, args.refresh_regions, api_client)
+
+def run_mode(args) -> Optional[str]:
+    """실행 기록의 모드 이름 (같은 모드끼리 성능 비교), 수집 대상이 없으면 None"""
+    mode = next((name for name in ('article', 'watch', 'schedule') if getattr(args, name)), None)
+    if not mode and (args.deadline or args.request_budget):
+        mode = 'planned'
+    mode = mode or next((name for name in ('area', 'gangnam', 'priority', 'high_priority') if getattr(args, name)), None)
+    if not mode:
+        return None
+    if args.discovery:
+        mode += '+discovery'
+    if args.max_pages or args.max_articles:
+        mode += '+limited'
+    return mode
+
+def record_run(service, mode: str, started_at: float, status: str):
+    """이번 실행 통계를 collection_runs에 저장 (실패해도 종료 흐름은 유지)"""
+    try:
+        from database.run_ledger import RunLedger, build_run_record
+        record = build_run_record(service.get_comprehensive_stats(), mode, service.areas_collected,
+                                  started_at, time.time(), status)
+        run_id = RunLedger().record_run(record)
+        print(f"📒 실행 기록 #{run_id} 저장 (매물/초 {record['articles_per_sec']:.2f}, python main.py --report)")
+    except Exception as e:
+        print(f"⚠️ 실행 기록 저장 실패: {e}")
+
+def write_profile(profiler, output: str = None):
+    """프로파일러를 멈추고 folded stack 파일 저장 + 샘플이 많은 함수 출력"""
+    from monitoring.profiler import default_profile_path
+    profiler.stop()
+    path = profiler.write_folded(output or default_profile_path(settings.monitoring_settings['profile_dir']))
+    print(f"\n🔬 프로파일 저장: {path} (샘플 {profiler.sample_count}회, flamegraph.pl 또는 speedscope로 열기)")
+    total = sum(profiler.samples.values()) or 1
+    for function, count in profiler.top_functions(10):
+        print(f"   {count / total * 100:5.1f}%  {function}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Prometheus 텍스트 형식 지표 (의존성 없는 최소 구현) + /metrics HTTP 엔드포인트
+카운터/게이지/히스토그램은 스레드 안전 - 수집 워커 스레드에서 바로 기록
+
+  python main.py --gangnam --metrics-port 9108
+  curl localhost:9108/metrics
+
+429 비율: rate(naver_requests_total{status="429"}[5m]) / rate(naver_requests_total[5m])
+DB 지연: collector_stage_seconds{stage=~"save.*"} (저장소 하위 단계 span 히스토그램)
+"""
+
+import os
+import resource
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from monitoring.spans import BUCKET_BOUNDS, stage_spans
+
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    psutil = None
+    HAS_PSUTIL = False
+
+
+def _escape_label_value(value: str) -> str:
+    """텍스트 포맷 라벨 값 이스케이프 (역슬래시, 큰따옴표, 줄바꿈)"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        super().__init__(name, help_text, labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1):
+        key = tuple(str(value) for value in label_values)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, *label_values: str) -> float:
+        with self._lock:
+            return self._values.get(tuple(str(value) for value in label_values), 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+                                for key, value in items]
+
+
+class Gauge(Counter):
+    kind = 'gauge'
+
+    def set(self, *label_values: str, value: float):
+        with self._lock:
+            self._values[tuple(str(v) for v in label_values)] = value
+
+    def dec(self, *label_values: str, amount: float = 1):
+        self.inc(*label_values, amount=-amount)
+
+
+class CallbackGauge(_Metric):
+    """렌더링 시점에 함수로 값을 계산하는 게이지 (None이면 생략)"""
+    kind = 'gauge'
+
+    def __init__(self, name: str, help_text: str, function: Callable[[], Optional[float]]):
+        super().__init__(name, help_text)
+        self.function = function
+
+    def render(self) -> List[str]:
+        value = self.function()
+        return self.header() + ([f"{self.name} {_format_value(value)}"] if value is not None else [])
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = BUCKET_BOUNDS):
+        super().__init__(name, help_text, labels)
+        self.bounds = tuple(buckets)
+        self._series: Dict[Tuple[str, ...], List] = {}  # key -> [구간별 횟수, 합계, 횟수]
+
+    def observe(self, *label_values: str, value: float):
+        key = tuple(str(v) for v in label_values)
+        index = next((i for i, bound in enumerate(self.bounds) if value <= bound), len(self.bounds))
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.bounds) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def series(self) -> Dict[Tuple[str, ...], Tuple[List[int], float, int]]:
+        with self._lock:
+            return {key: (list(s[0]), s[1], s[2]) for key, s in self._series.items()}
+
+    def render(self) -> List[str]:
+        return self.header() + render_histogram_series(self.name, self.label_names, self.bounds, self.series())
+
+
+def render_histogram_series(name: str, label_names: Sequence[str], bounds: Sequence[float],
+                            series: Dict[Tuple[str, ...], Tuple[List[int], float, int]]) -> List[str]:
+    lines = []
+    for key, (buckets, total, count) in sorted(series.items()):
+        cumulative = 0
+        for bound, bucket_count in zip(list(bounds) + [float('inf')], buckets):
+            cumulative += bucket_count
+            le = f'le="{_format_value(bound)}"'
+            lines.append(f"{name}_bucket{_format_labels(label_names, key, le)} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(label_names, key)} {_format_value(total)}")
+        lines.append(f"{name}_count{_format_labels(label_names, key)} {count}")
+    return lines
+
+
+class StageSpanHistogram(_Metric):
+    """monitoring.spans의 단계별 히스토그램을 그대로 노출"""
+    kind = 'histogram'
+
+    def render(self) -> List[str]:
+        series = {(stage,): values for stage, values in stage_spans.histograms().items()}
+        return self.header() + render_histogram_series(self.name, ('stage',), BUCKET_BOUNDS, series)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help_text, labels))
+
+    def gauge(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, help_text, labels))
+
+    def histogram(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Histogram:
+        return self.register(Histogram(name, help_text, labels))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+def _resident_memory_bytes() -> float:
+    if HAS_PSUTIL:
+        return psutil.Process(os.getpid()).memory_info().rss
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # 최대 RSS로 대체 (리눅스 KB)
+
+
+_token_collected_at = {'value': None}
+
+
+def mark_token_collected():
+    """토큰 수집기가 새 토큰/세션을 받았을 때 호출 (naver_token_age_seconds 기준 시각)"""
+    _token_collected_at['value'] = time.time()
+
+
+def _token_age() -> Optional[float]:
+    collected_at = _token_collected_at['value']
+    return time.time() - collected_at if collected_at else None
+
+
+registry = MetricsRegistry()
+
+NAVER_REQUESTS = registry.counter('naver_requests_total', '네이버 API 응답 수 (상태코드별, error=예외)', ['kind', 'status'])
+NAVER_REQUEST_SECONDS = registry.histogram('naver_request_seconds', '네이버 API 요청 시간', ['kind'])
+NAVER_CONSECUTIVE_429 = registry.gauge('naver_consecutive_429', '연속 429 응답 수')
+KAKAO_REQUESTS = registry.counter('kakao_requests_total', '카카오 주소 변환 응답 수 (상태코드별)', ['status'])
+GEOCODE_CACHE = registry.counter('geocode_cache_total', '주소 변환 캐시 조회 (hit/miss)', ['result'])
+ARTICLES = registry.counter('collector_articles_total', '지역별 매물 처리 결과 (saved/failed/skipped_prefilter/skipped_refresh)',
+                            ['area', 'result'])
+DETAIL_QUEUE_DEPTH = registry.gauge('collector_detail_queue_depth', '스레드 풀에 제출되어 끝나지 않은 상세 수집 작업 수')
+registry.register(StageSpanHistogram('collector_stage_seconds', '매물 처리 단계별 시간 (save.*는 DB 하위 단계)'))
+registry.register(CallbackGauge('naver_token_age_seconds', '현재 네이버 토큰/세션을 받은 뒤 지난 시간', _token_age))
+registry.register(CallbackGauge('process_resident_memory_bytes', '프로세스 RSS', _resident_memory_bytes))
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_metrics_server(port: int, host: str = '0.0.0.0') -> ThreadingHTTPServer:
+    """백그라운드 스레드에서 /metrics 제공"""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True).start()
+    print(f"📈 지표 엔드포인트: http://{host}:{server.server_address[1]}/metrics")
+    return server
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+샘플링 프로파일러 - 모든 스레드(수집 워커 포함)의 호출 스택을 주기적으로 수집해 (벽시계 기준 - 대기 시간 포함)
+flamegraph용 folded stack 파일로 저장 (cProfile은 메인 스레드만 측정하므로 워커 스레드 풀에 맞지 않음)
+
+파일 형식: 한 줄에 "스레드;바깥함수;...;안쪽함수 샘플수"
+  flamegraph.pl profile.folded > profile.svg   또는 https://www.speedscope.app 에 그대로 열기
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import List, Tuple
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples = Counter()
+        self.sample_count = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> 'SamplingProfiler':
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame))
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.samples[';'.join(reversed(stack))] += 1
+            self.sample_count += 1
+
+    def top_functions(self, limit: int = 15) -> List[Tuple[str, int]]:
+        """샘플에서 스택 맨 위(실제로 실행 중이던) 함수별 횟수"""
+        leaf_counts = Counter()
+        for stack, count in self.samples.items():
+            leaf_counts[stack.rsplit(';', 1)[-1]] += count
+        return leaf_counts.most_common(limit)
+
+    def write_folded(self, path: str) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.samples.items()):
+                f.write(f"{stack} {count}\n")
+        return path
+
+    def __enter__(self) -> 'SamplingProfiler':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def default_profile_path(output_dir: str) -> Path:
+    return Path(output_dir) / f"profile-{time.strftime('%Y%m%d-%H%M%S')}.folded"
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+단계별 시간 측정 (span)
+매물 처리 단계(fetch/parse/geocode/validate/save)와 저장소 하위 단계를 with 블록으로 감싸 단계별 히스토그램에 누적
+
+  with stage_spans.span('article.fetch'):
+      ...
+
+span은 스레드별로 중첩 가능 - 단계마다 전체 시간(하위 단계 포함)과 자체 시간(하위 단계 제외)을 함께 기록
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+from config.settings import settings
+
+# 히스토그램 구간 상한 (초) - 마지막 구간은 무한대
+BUCKET_BOUNDS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+
+class StageHistogram:
+    """단계 1개의 누적 통계 (구간별 횟수, 합계, 최대값)"""
+    __slots__ = ('count', 'total', 'self_total', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.self_total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+
+    def observe(self, duration: float, self_duration: float):
+        self.count += 1
+        self.total += duration
+        self.self_total += self_duration
+        if duration > self.max:
+            self.max = duration
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS, duration)] += 1
+
+    def percentile(self, q: float) -> float:
+        """구간 상한으로 근사한 분위수 (초) - 마지막 구간은 관측 최대값"""
+        target = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.buckets):
+            cumulative += bucket_count
+            if cumulative >= target and bucket_count:
+                return min(BUCKET_BOUNDS[index], self.max) if index < len(BUCKET_BOUNDS) else self.max
+        return self.max
+
+
+class SpanRecorder:
+    """스레드 안전 단계별 히스토그램 (수집 워커 스레드들이 동시에 기록)"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._histograms: Dict[str, StageHistogram] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        stack: List[List[float]] = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        frame = [0.0]  # 하위 span 시간 합계
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1][0] += duration
+            with self._lock:
+                histogram = self._histograms.get(name)
+                if histogram is None:
+                    histogram = self._histograms[name] = StageHistogram()
+                histogram.observe(duration, duration - frame[0])
+
+    def histograms(self) -> Dict[str, Tuple[List[int], float, int]]:
+        """단계별 (구간별 횟수, 합계, 횟수) 복사본 - 외부 지표 노출용"""
+        with self._lock:
+            return {name: (list(h.buckets), h.total, h.count) for name, h in self._histograms.items()}
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """단계별 횟수/합계/자체 시간/평균/p50/p95/p99/최대 (ms)"""
+        with self._lock:
+            return {
+                name: {
+                    'count': h.count,
+                    'total_seconds': round(h.total, 3),
+                    'self_seconds': round(h.self_total, 3),
+                    'mean_ms': round(h.total / h.count * 1000, 2) if h.count else 0.0,
+                    'p50_ms': round(h.percentile(0.5) * 1000, 2),
+                    'p95_ms': round(h.percentile(0.95) * 1000, 2),
+                    'p99_ms': round(h.percentile(0.99) * 1000, 2),
+                    'max_ms': round(h.max * 1000, 2),
+                }
+                for name, h in sorted(self._histograms.items())
+            }
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+stage_spans = SpanRecorder(enabled=settings.monitoring_settings['spans_enabled'])
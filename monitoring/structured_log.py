@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+구조화 로그 - 수집 핫패스의 print() 대체
+  - 워커 스레드는 QueueHandler로 큐에 넣기만 하고, 포맷/출력은 QueueListener 스레드 1개가 담당 (stdout 잠금 경합 없음)
+  - 파일은 JSON lines (한 줄에 ts/level/logger/msg + extra 필드), 콘솔은 기존과 같은 메시지 한 줄
+  - 모듈별 레벨: NAVER_LOG_LEVELS=database=WARNING,collectors.naver_api_client=DEBUG
+  - 매물별 성공 로그는 extra={'sampled': True}로 남기고 NAVER_LOG_SAMPLE_RATE 비율만 기록 (경고/오류는 항상 기록)
+
+  logger = logging.getLogger(__name__)
+  logger.info("✅ %s 완료", article_no, extra={'article_no': article_no, 'sampled': True})
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+from config.settings import settings
+
+# LogRecord 기본 속성 - 이 외의 속성은 extra 필드로 JSON에 포함
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {'message', 'asctime', 'sampled'}
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'msg': record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SampleFilter(logging.Filter):
+    """extra={'sampled': True} 인 INFO 이하 레코드를 rate 비율만 통과"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, 'sampled', False) or record.levelno > logging.INFO:
+            return True
+        return self.rate >= 1 or random.random() < self.rate
+
+
+class _DropOnFullQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 기다리지 않고 버림 - 로그 때문에 수집 워커가 멈추지 않도록"""
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+def parse_module_levels(spec: str) -> Dict[str, int]:
+    """'database=WARNING,collectors=DEBUG' -> {'database': 30, 'collectors': 10}"""
+    levels = {}
+    for item in spec.split(','):
+        name, _, level = item.partition('=')
+        if name.strip() and level.strip():
+            levels[name.strip()] = logging.getLevelName(level.strip().upper())
+    return levels
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging(level: str = None, log_file: str = None, console_format: str = None) -> logging.Logger:
+    """루트 로거를 큐 핸들러로 구성 (여러 번 호출해도 1회만 적용). 인자가 없으면 logging_settings 사용"""
+    global _listener
+    root = logging.getLogger()
+    if _listener is not None:
+        return root
+
+    config = settings.logging_settings
+    level = (level or config['level']).upper()
+    log_file = log_file if log_file is not None else config['file']
+    console_format = console_format or config['console_format']
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(JsonFormatter() if console_format == 'json' else logging.Formatter('%(message)s'))
+    handlers = [console]
+    if log_file:
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler.setFormatter(JsonFormatter())
+        handlers.append(file_handler)
+
+    log_queue = queue.Queue(maxsize=config['queue_size'])
+    queue_handler = _DropOnFullQueueHandler(log_queue)
+    queue_handler.addFilter(SampleFilter(config['success_sample_rate']))
+
+    root.handlers[:] = [queue_handler]
+    root.setLevel(level)
+    for name, module_level in parse_module_levels(config['module_levels']).items():
+        logging.getLogger(name).setLevel(module_level)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return root
+
+
+def shutdown_logging():
+    """큐에 남은 로그를 모두 출력하고 리스너 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        logging.getLogger().handlers[:] = []
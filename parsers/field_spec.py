@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+네이버 부동산 상세 API 섹션별 필드 매핑 명세
+(API 키, 파싱 후 필드명, 타입, 기본값)을 한 곳에서 데이터로 관리하고,
+import 시점에 섹션별 전용 추출 함수로 컴파일
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class Nested:
+    """하위 dict를 다른 명세로 추출 (예: articleAddition.prcInfo)"""
+    def __init__(self, spec_name: str):
+        self.spec_name = spec_name
+
+
+class ListOf:
+    """dict 리스트의 각 항목을 다른 명세로 추출 (예: articleFacility.subwayList)"""
+    def __init__(self, spec_name: str):
+        self.spec_name = spec_name
+
+
+# (API 키, 필드명, 타입, 기본값) - API 키가 None이면 다른 섹션/후처리에서 채우는 자리
+FieldSpec = Tuple[Optional[str], str, Any, Any]
+
+FIELD_SPECS: Dict[str, List[FieldSpec]] = {
+    'articleDetail': [
+        ('articleNo', 'article_no', str, None),
+        ('realestateTypeName', 'real_estate_type', str, None),
+        ('realestateTypeCode', 'real_estate_type_code', str, None),  # 유형별 검증 규칙/저장 테이블 (SMS, SG 등)
+        ('tradeTypeName', 'trade_type', str, None),
+        ('tradeTypeCode', 'trade_type_code', str, None),  # 검증 규칙(제외 거래유형) 비교용
+        ('floorLayerName', 'floor_info', str, None),
+        ('buildingTypeName', 'building_name', str, None),
+        (None, 'deal_or_warrant_price', None, None),  # articlePrice 섹션에서 처리
+        (None, 'rent_price', None, None),  # articlePrice 섹션에서 처리
+        (None, 'space_size', None, None),  # articleSpace 섹션에서 처리
+        (None, 'supply_size', None, None),  # articleSpace 섹션에서 처리
+        (None, 'direction', None, None),  # articleFacility 섹션에서 처리
+        ('moveInPossibleYmd', 'construction_completion_date', str, None),
+        ('monthlyManagementCost', 'manage_cost', int, None),
+        ('tagList', 'tags', list, []),
+        ('latitude', 'latitude', str, None),
+        ('longitude', 'longitude', str, None),
+        ('lawUsage', 'law_usage', str, None),
+        ('exposureAddress', 'exposure_address', str, None),
+        ('detailAddress', 'detail_address', str, None),
+        ('detailDescription', 'detail_description', str, None),
+        ('parkingCount', 'parking_count', int, None),
+        ('parkingPossibleYN', 'parking_possible', str, None),
+        ('walkingTimeToNearSubway', 'walking_to_subway', int, None),
+        ('moveInTypeName', 'move_in_type', str, None),
+        ('bathroomCount', 'bathroom_count', str, None),
+        ('householdCount', 'office_count', str, None),
+        ('articleConfirmYMD', 'article_confirm_date', str, None),  # 확인매물 날짜
+        ('exposeStartYMD', 'expose_start_date', str, None),  # 노출 시작일
+        ('exposeEndYMD', 'expose_end_date', str, None),  # 노출 종료일
+        ('moveInPossibleYmd', 'move_in_possible_date', str, None),  # 입주가능일
+        (None, 'elevator_count', None, None),  # articleFacility에서 처리
+        (None, 'management_office_tel', None, None),  # 실제 필드명을 찾지 못함
+    ],
+    'articleAddition': [
+        ('sameAddrDirectCnt', 'same_address_direct_deal', int, 0),
+        ('sameAddrHash', 'same_address_hash', str, None),
+        ('prcPerSpace', 'price_by_area', str, None),
+        ('prcInfo', 'nearby_sales', Nested('priceComparison'), None),
+        ('articleConfirmYmd', 'article_confirm_date_addition', str, None),  # 추가 확인일자
+    ],
+    'articleFacility': [
+        ('subwayList', 'near_subway', ListOf('subway'), None),
+        ('airconFacilities', 'convenience_facilities', list, []),
+        ('securityFacilities', 'security_facilities', list, []),
+        ('directionTypeName', 'direction', str, None),
+        ('heatMethodTypeName', 'heating_type', str, None),
+        ('buildingUseAprvYmd', 'approval_date', str, None),
+        (None, 'elevator_count', None, None),  # etcFacilities에서 후처리
+        ('etcFacilities', 'etc_facilities', list, []),
+    ],
+    'articleFloor': [
+        ('totalFloorCount', 'total_floor', int, None),
+        (None, 'current_floor', None, None),  # correspondingFloorCount에서 후처리
+        ('correspondingFloorCount', 'current_floor_raw', str, None),  # 원본 층수 문자열
+        ('undergroundFloorCount', 'underground_floor', str, None),
+        ('uppergroundFloorCount', 'aboveground_floor', str, None),
+        (None, 'floor_description', None, None),  # 후처리로 생성 (5층/20층 형식)
+    ],
+    'articlePrice': [
+        ('dealPrice', 'deal_price', int, 0),
+        ('warrantPrice', 'warrant_price', int, 0),
+        ('rentPrice', 'rent_price', int, 0),
+        (None, 'manage_cost', None, None),  # 별도 필드 없음, articleDetail에서 처리
+        ('priceBySpace', 'price_per_area', float, 0.0),
+        ('allWarrantPrice', 'all_warrant_price', int, 0),
+        ('allRentPrice', 'all_rent_price', int, 0),
+        ('financePrice', 'finance_price', int, 0),
+        ('premiumPrice', 'premium_price', int, 0),
+    ],
+    'articleRealtor': [
+        ('address', 'office_name', str, None),
+        ('realtorName', 'agent_name', str, None),
+        ('representativeTelNo', 'phone_number', str, None),
+        (None, 'office_certified', None, False),  # 별도 필드 없음
+        ('cellPhoneNo', 'representative_mobile', str, None),
+    ],
+    'articleSpace': [
+        ('supplySpace', 'supply_area', float, None),
+        ('exclusiveSpace', 'exclusive_area', float, None),
+        ('groundShareSpace', 'common_area', float, 0.0),
+        ('totalSpace', 'total_area', float, 0.0),
+        ('buildingSpace', 'building_area', float, 0.0),
+        ('groundSpace', 'ground_space', float, 0.0),
+        ('expectSpace', 'expect_space', float, 0.0),
+        ('exclusiveRate', 'exclusive_rate', str, None),
+    ],
+    'articleTax': [
+        ('acquisitionTax', 'acquisition_tax', int, 0),
+        ('brokerFee', 'brokerage_fee', float, 0.0),
+        ('registFee', 'etc_cost', float, 0.0),
+        ('registTax', 'regist_tax', float, 0.0),
+        ('totalPrice', 'total_price', int, 0),
+        ('maxBrokerFee', 'max_broker_fee', float, 0.0),
+    ],
+    'articleBuildingRegister': [
+        ('mgmBldrgstPk', 'building_register_pk', str, None),
+        ('regstrKindCdNm', 'register_type', str, None),
+        ('platArea', 'plot_area', float, None),
+        ('archArea', 'building_area', float, None),
+        ('bcRat', 'building_coverage_ratio', float, None),
+        ('totArea', 'total_area', float, None),
+        ('vlRat', 'volume_ratio', float, None),
+        ('strctCdNm', 'structure_type', str, None),
+        ('mainPurpsCdNm', 'main_purpose', str, None),
+        ('grndFlrCnt', 'ground_floor_count', int, None),
+        ('ugrndFlrCnt', 'underground_floor_count', int, None),
+        ('totalElvtCnt', 'total_elevator_count', int, None),
+        ('elvtInfo', 'elevator_info', str, None),
+        ('indrAutoUtcnt', 'indoor_parking_count', int, None),
+        ('oudrAutoUtcnt', 'outdoor_parking_count', int, None),
+        ('etcParkInfo', 'parking_info', str, None),
+    ],
+    # 하위 명세 (섹션 안의 dict/리스트 항목)
+    'priceComparison': [
+        ('lowerPrcCnt', 'lower_price_count', int, 0),
+        ('samePrcCnt', 'similar_price_count', int, 0),
+        ('higherPrcCnt', 'higher_price_count', int, 0),
+    ],
+    'subway': [
+        ('subwayName', 'line_name', str, None),
+        ('stationName', 'station_name', str, None),
+        ('distance', 'distance', int, None),
+        ('walkingTime', 'walking_time', int, None),
+    ],
+    'photo': [
+        ('imageSrc', 'url', str, None),  # imageSrc가 실제 API 필드명
+        ('thumbnailUrl', 'thumbnail_url', str, None),
+        ('smallCategoryName', 'description', str, None),
+        ('imageOrder', 'order', int, None),
+        ('imageType', 'image_type', str, None),
+        ('imageId', 'image_id', str, None),
+        ('registYmdt', 'registered_datetime', str, None),  # 사진 등록 일시
+    ],
+}
+
+# 하위 명세는 섹션이 아님
+SUB_SPECS = ('priceComparison', 'subway', 'photo')
+
+
+def get_api_keys(spec_name: str) -> List[str]:
+    """명세에 등록된 API 키 목록 (NULL 필드 진단 등에 사용)"""
+    return [key for key, _, _, _ in FIELD_SPECS.get(spec_name, []) if key]
+
+
+# ----------------------------------------------------------------------
+# 변환 함수 - 기존 ArticleParser._safe_extract(bench/parser_benchmark.py LegacyParser)와 같은 규칙 (빠른 경로는 컴파일된 코드에 인라인)
+# ----------------------------------------------------------------------
+
+def _to_int(value: Any, default: Any) -> Any:
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str) and value.replace('-', '').replace('.', '').isdigit():
+        try:
+            return int(float(value))
+        except ValueError:
+            return default
+    return default
+
+
+def _to_float(value: Any, default: Any) -> Any:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str) and value.replace('-', '').replace('.', '').isdigit():
+        try:
+            return float(value)
+        except ValueError:
+            return default
+    return default
+
+
+def parse_floor_number(floor_str: Optional[str]) -> Optional[int]:
+    """층수 문자열을 정수로 변환 (B1 -> -1, 1 -> 1 등)"""
+    if not floor_str:
+        return None
+
+    try:
+        # 지하층 처리 (B1, B2 등)
+        if floor_str.upper().startswith('B'):
+            floor_num = floor_str[1:]  # B 제거
+            return -int(floor_num) if floor_num.isdigit() else None
+
+        # 일반 층수 처리
+        if floor_str.isdigit():
+            return int(floor_str)
+
+        # 기타 경우는 None 반환
+        return None
+
+    except (ValueError, TypeError):
+        return None
+
+
+# ----------------------------------------------------------------------
+# 섹션별 후처리 (명세만으로 표현되지 않는 파생 필드)
+# ----------------------------------------------------------------------
+
+def _post_articleFacility(section: Dict):
+    # etcFacilities에서 엘리베이터 정보 추출
+    section['elevator_count'] = 1 if '엘리베이터' in section['etc_facilities'] else None
+
+
+def _post_articleFloor(section: Dict):
+    # correspondingFloorCount는 "B1", "1", "2" 등의 형식으로 올 수 있음
+    current_floor_raw = section['current_floor_raw']
+    total_floor = section['total_floor']
+    section['current_floor'] = parse_floor_number(current_floor_raw)
+
+    if current_floor_raw and total_floor:
+        section['floor_description'] = f"{current_floor_raw}/{total_floor}층"
+    elif current_floor_raw:
+        section['floor_description'] = f"{current_floor_raw}층"
+
+
+POST_PROCESSORS: Dict[str, Callable[[Dict], None]] = {
+    'articleFacility': _post_articleFacility,
+    'articleFloor': _post_articleFloor,
+}
+
+
+# ----------------------------------------------------------------------
+# 컴파일: 명세 -> 섹션 전용 함수 소스 -> exec
+# ----------------------------------------------------------------------
+
+def _field_expression(kind: Any, default: Any, prefix: str = 'extract_') -> str:
+    """변수 v(API 값)를 변환하는 식"""
+    d = repr(default)
+    if kind is str:
+        return f"{d} if v is None or v == '' else (v.strip() if v.__class__ is str else str(v).strip())"
+    if kind is int:
+        return f"{d} if v is None or v == '' else (v if v.__class__ is int else _to_int(v, {d}))"
+    if kind is float:
+        return f"{d} if v is None or v == '' else (v if v.__class__ is float else _to_float(v, {d}))"
+    if kind is list:
+        return f"list(v) if isinstance(v, list) else {d}"
+    if isinstance(kind, Nested):
+        return f"{prefix}{kind.spec_name}(v)"
+    if isinstance(kind, ListOf):
+        return f"[{prefix}{kind.spec_name}(item) for item in v] if isinstance(v, list) else []"
+    raise ValueError(f"지원하지 않는 필드 타입: {kind!r}")
+
+
+def _generate_source(spec_name: str, fields: List[FieldSpec], access: str = 'item') -> str:
+    """
+    access='item': dict에서 data.get(key)로 읽는 함수 (extract_<spec>)
+    access='attr': 명세 필드를 속성으로 가진 객체(msgspec Struct 등)에서 읽는 함수 (extract_attr_<spec>),
+                   그런 객체가 아니면 dict용 함수로 넘김
+    """
+    if access == 'attr':
+        prefix = 'extract_attr_'
+        lines = [
+            f"def extract_attr_{spec_name}(data):",
+            "    if not isinstance(data, _Struct):",
+            f"        return extract_{spec_name}(data)",
+        ]
+    else:
+        prefix = 'extract_'
+        lines = [
+            f"def extract_{spec_name}(data):",
+            "    if data.__class__ is not dict:",
+            "        data = data if isinstance(data, dict) else {}",
+            "    get = data.get",
+        ]
+    for index, (key, _, kind, default) in enumerate(fields):
+        if key is None:
+            lines.append(f"    f{index} = {default!r}")
+        else:
+            lines.append(f"    v = data.{key}" if access == 'attr' else f"    v = get({key!r})")
+            lines.append(f"    f{index} = {_field_expression(kind, default, prefix)}")
+
+    items = ', '.join(f"{target!r}: f{index}" for index, (_, target, _, _) in enumerate(fields))
+    lines.append(f"    out = {{{items}}}")
+    if spec_name in POST_PROCESSORS:
+        lines.append(f"    _post_{spec_name}(out)")
+    lines.append("    return out")
+    return '\n'.join(lines) + '\n'
+
+
+def compile_extractors(access: str = 'item', namespace: Dict[str, Any] = None
+                       ) -> Tuple[Dict[str, Callable[[Any], Dict]], Dict[str, str]]:
+    """명세 전체를 추출 함수로 컴파일 -> ({명세명: 함수}, {명세명: 소스})"""
+    namespace = {
+        '_to_int': _to_int,
+        '_to_float': _to_float,
+        **{f'_post_{name}': func for name, func in POST_PROCESSORS.items()},
+        **(namespace or {}),
+    }
+    prefix = 'extract_attr_' if access == 'attr' else 'extract_'
+    sources = {}
+    # 하위 명세를 먼저 컴파일해야 상위 함수에서 참조 가능 (참조는 실행 시점이지만 순서를 명시)
+    for spec_name in list(SUB_SPECS) + [name for name in FIELD_SPECS if name not in SUB_SPECS]:
+        source = _generate_source(spec_name, FIELD_SPECS[spec_name], access)
+        exec(compile(source, f'<field_spec:{access}:{spec_name}>', 'exec'), namespace)
+        sources[spec_name] = source
+    extractors = {name: namespace[f'{prefix}{name}'] for name in FIELD_SPECS}
+    return extractors, sources
+
+
+_EXTRACTORS, EXTRACTOR_SOURCES = compile_extractors()
+
+
+def make_photos_extractor(extract_photo: Callable[[Any], Dict]) -> Callable[[Any], Dict]:
+    """articlePhotos는 사진 리스트 - URL 없는 사진은 제외"""
+    def extract_articlePhotos(data: Any) -> Dict:
+        photos = []
+        if isinstance(data, list):
+            for item in data:
+                photo = extract_photo(item)
+                if photo['url']:  # null, 빈 문자열, None 필터링
+                    photos.append(photo)
+        return {'photos': photos, 'total_count': len(photos)}
+    return extract_articlePhotos
+
+
+# 섹션명 -> 추출 함수 (ArticleParser에서 사용)
+SECTION_EXTRACTORS: Dict[str, Callable[[Any], Dict]] = {
+    name: func for name, func in _EXTRACTORS.items() if name not in SUB_SPECS
+}
+SECTION_EXTRACTORS['articlePhotos'] = make_photos_extractor(_EXTRACTORS['photo'])
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+파싱된 매물 레코드 (__slots__)
+파서가 섹션 추출 결과를 한 번만 정규화해 만들고, 검증/주소 보강/저장이 그대로 사용
+(값 변환은 여기서만 - 저장소는 레코드를 행으로 옮기기만 함)
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+def to_int(value: Any) -> Optional[int]:
+    """안전한 정수 변환 (쉼표, '만', '원' 등 제거)"""
+    if value is None or value == '':
+        return None
+    if value.__class__ is int:
+        return value
+    try:
+        str_val = str(value).replace(',', '').replace('만', '').replace('원', '').strip()
+        if str_val == '':
+            return None
+        return int(float(str_val))
+    except (ValueError, TypeError):
+        return None
+
+
+def to_decimal(value: Any) -> Optional[float]:
+    """안전한 소수점 변환 (0.0도 유효한 값으로 처리)"""
+    if value is None or value == '':
+        return None
+    if value.__class__ is float:
+        return value
+    try:
+        return float(str(value).replace(',', ''))
+    except (ValueError, TypeError):
+        return None
+
+
+def to_bool(value: Any) -> bool:
+    """안전한 불린 변환"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.lower() in ('true', 'yes', 'y', '1', 'on')
+    return bool(value) if value is not None else False
+
+
+def parse_date(date_str: Optional[str]) -> Optional[str]:
+    """YYYYMMDD 형식의 날짜 문자열을 YYYY-MM-DD 형식으로 변환 (다른 형식은 그대로)"""
+    if not date_str or not isinstance(date_str, str):
+        return None
+    if len(date_str) == 8 and date_str.isdigit():
+        return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
+    return date_str
+
+
+def parse_datetime(datetime_str: Optional[str]) -> Optional[str]:
+    """YYYYMMDDHHMMSS 형식의 날짜시간 문자열을 ISO 형식으로 변환 (다른 형식은 그대로)"""
+    if not datetime_str or not isinstance(datetime_str, str):
+        return None
+    if len(datetime_str) == 14 and datetime_str.isdigit():
+        d = datetime_str
+        return f"{d[:4]}-{d[4:6]}-{d[6:8]}T{d[8:10]}:{d[10:12]}:{d[12:14]}"
+    return datetime_str
+
+
+def separate_prices_by_trade_type(trade_type: Optional[str], article_price: Dict) -> tuple:
+    """거래 유형에 따라 가격을 (매매가, 보증금, 월세)로 분리"""
+    deal_price_raw = article_price.get('deal_price')
+    warrant_price_raw = article_price.get('warrant_price')
+    rent_price_raw = article_price.get('rent_price')
+
+    if trade_type == '매매':
+        return to_int(deal_price_raw), None, None
+    if trade_type == '전세':
+        # 네이버 API는 전세금을 deal_price로 제공
+        return None, to_int(deal_price_raw or warrant_price_raw), None
+    if trade_type == '월세':
+        return None, to_int(warrant_price_raw or deal_price_raw), to_int(rent_price_raw)
+    return None, None, None
+
+
+class Record:
+    """__slots__ 레코드 공통 기능 - 생성자 키워드 인자, dict 변환, 비교"""
+    __slots__ = ()
+    _defaults: Dict[str, Any] = {}
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            if name in values:
+                setattr(self, name, values.pop(name))
+            else:
+                default = self._defaults.get(name)
+                setattr(self, name, default() if callable(default) else default)
+        if values:
+            raise TypeError(f"{self.__class__.__name__}에 없는 필드: {', '.join(values)}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if isinstance(value, Record):
+                value = value.to_dict()
+            elif isinstance(value, list) and value and isinstance(value[0], Record):
+                value = [item.to_dict() for item in value]
+            result[name] = value
+        return result
+
+    def __eq__(self, other) -> bool:
+        return type(self) is type(other) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__[:3])
+        return f"{self.__class__.__name__}({fields}, ...)"
+
+
+class SubwayRecord(Record):
+    __slots__ = ('line_name', 'station_name', 'distance', 'walking_time')
+
+
+class PhotoRecord(Record):
+    __slots__ = ('url', 'thumbnail_url', 'description', 'display_order', 'registered_datetime')
+
+
+class RealtorRecord(Record):
+    __slots__ = ('office_name', 'agent_name', 'phone_number', 'representative_mobile', 'office_certified')
+
+
+class BuildingRecord(Record):
+    """건축물대장 (articleBuildingRegister) - 같은 건물의 매물은 모두 같은 값 (naver_buildings 1행)"""
+    __slots__ = (
+        'building_register_pk', 'register_type', 'structure_type', 'main_purpose',
+        'plot_area', 'building_area', 'total_area', 'building_coverage_ratio', 'volume_ratio',
+        'ground_floor_count', 'underground_floor_count', 'total_elevator_count', 'elevator_info',
+        'indoor_parking_count', 'outdoor_parking_count', 'parking_info',
+    )
+
+    @classmethod
+    def from_register(cls, register: Dict) -> Optional['BuildingRecord']:
+        """건축물대장 섹션 추출 결과 -> 레코드 (섹션이 비어 있으면 None)"""
+        if not any(value is not None for value in register.values()):
+            return None
+        return cls(
+            building_register_pk=register.get('building_register_pk'),
+            register_type=register.get('register_type'),
+            structure_type=register.get('structure_type'),
+            main_purpose=register.get('main_purpose'),
+            plot_area=to_decimal(register.get('plot_area')),
+            building_area=to_decimal(register.get('building_area')),
+            total_area=to_decimal(register.get('total_area')),
+            building_coverage_ratio=to_decimal(register.get('building_coverage_ratio')),
+            volume_ratio=to_decimal(register.get('volume_ratio')),
+            ground_floor_count=to_int(register.get('ground_floor_count')),
+            underground_floor_count=to_int(register.get('underground_floor_count')),
+            total_elevator_count=to_int(register.get('total_elevator_count')),
+            elevator_info=register.get('elevator_info'),
+            indoor_parking_count=to_int(register.get('indoor_parking_count')),
+            outdoor_parking_count=to_int(register.get('outdoor_parking_count')),
+            parking_info=register.get('parking_info')
+        )
+
+
+class ArticleRecord(Record):
+    """매물 1건 - naver_properties/naver_facilities 컬럼 단위로 정규화된 값과 중개사/사진 하위 레코드"""
+    __slots__ = (
+        # 식별자/유형
+        'article_no', 'trade_type', 'trade_type_code', 'real_estate_type', 'real_estate_type_code', 'building_use',
+        'law_usage',
+        # 위치
+        'latitude', 'longitude', 'exposure_address', 'address_info',
+        # 가격 (거래유형별 분리 후)
+        'deal_price', 'warrant_price', 'rent_price', 'monthly_management_cost', 'price_per_area',
+        # 면적/층
+        'supply_area', 'exclusive_area', 'common_area', 'total_floor', 'current_floor', 'floor_description',
+        # 교통/시설
+        'walking_to_subway', 'parking_count', 'parking_possible', 'elevator_count',
+        'bathroom_count', 'office_count', 'heating_type', 'approval_date',
+        # 건축물대장
+        'building_register_pk', 'building_structure', 'building_main_purpose', 'total_elevator_count',
+        # 입주/날짜
+        'move_in_type', 'move_in_discussion', 'article_confirm_date', 'expose_start_date',
+        'expose_end_date', 'move_in_possible_date',
+        # 기타
+        'detail_description', 'management_office_tel',
+        # 편의시설/시세/세금 (naver_facilities)
+        'near_subway', 'convenience_facilities', 'security_facilities',
+        'same_addr_direct_deal', 'same_addr_hash', 'nearby_sales',
+        'acquisition_tax', 'brokerage_fee', 'etc_cost',
+        # 하위 레코드
+        'realtor', 'photos', 'building',
+        # 처리 상태 (검증/저장 결과)
+        'is_active', 'change_detected', 'parsed_at',
+    )
+    _defaults = {
+        'near_subway': list,
+        'convenience_facilities': list,
+        'security_facilities': list,
+        'nearby_sales': dict,
+        'photos': list,
+        'is_active': True,
+        'change_detected': False,
+    }
+
+    @classmethod
+    def from_sections(cls, article_no: str, sections: Dict[str, Dict],
+                      parsed_at: str = None) -> 'ArticleRecord':
+        """ArticleParser 섹션 추출 결과(크로스 섹션 매핑 후)를 레코드로 정규화"""
+        detail = sections.get('articleDetail', {})
+        price = sections.get('articlePrice', {})
+        space = sections.get('articleSpace', {})
+        floor = sections.get('articleFloor', {})
+        facility = sections.get('articleFacility', {})
+        addition = sections.get('articleAddition', {})
+        tax = sections.get('articleTax', {})
+        register = sections.get('articleBuildingRegister', {})
+        realtor = sections.get('articleRealtor')
+
+        trade_type = detail.get('trade_type')
+        deal_price, warrant_price, rent_price = separate_prices_by_trade_type(trade_type, price)
+
+        return cls(
+            article_no=article_no,
+            trade_type=trade_type,
+            trade_type_code=detail.get('trade_type_code'),
+            real_estate_type=detail.get('real_estate_type'),
+            real_estate_type_code=detail.get('real_estate_type_code'),
+            building_use=detail.get('building_name'),  # buildingTypeName (중소형사무실, 대형사무실 등)
+            law_usage=detail.get('law_usage'),
+            latitude=to_decimal(detail.get('latitude')),
+            longitude=to_decimal(detail.get('longitude')),
+            exposure_address=detail.get('exposure_address'),
+            address_info=detail.get('address_info'),
+            deal_price=deal_price,
+            warrant_price=warrant_price,
+            rent_price=rent_price,
+            monthly_management_cost=to_int(detail.get('manage_cost')),
+            price_per_area=to_decimal(price.get('price_per_area')),
+            supply_area=to_decimal(space.get('supply_area')),
+            exclusive_area=to_decimal(space.get('exclusive_area')),
+            common_area=to_decimal(space.get('common_area')),
+            total_floor=to_int(floor.get('total_floor')),
+            current_floor=to_int(floor.get('current_floor')),
+            floor_description=floor.get('floor_description'),
+            walking_to_subway=to_int(detail.get('walking_to_subway')),
+            parking_count=to_int(detail.get('parking_count')),
+            parking_possible=to_bool(detail.get('parking_possible')),
+            elevator_count=to_int(facility.get('elevator_count')),
+            bathroom_count=detail.get('bathroom_count'),
+            office_count=detail.get('office_count'),
+            heating_type=facility.get('heating_type'),
+            approval_date=facility.get('approval_date'),
+            building_register_pk=register.get('building_register_pk'),
+            building_structure=register.get('structure_type'),
+            building_main_purpose=register.get('main_purpose'),
+            total_elevator_count=to_int(register.get('total_elevator_count')),
+            move_in_type=detail.get('move_in_type'),
+            move_in_discussion=to_bool(detail.get('move_in_discussion')),
+            article_confirm_date=parse_date(detail.get('article_confirm_date')),
+            expose_start_date=parse_date(detail.get('expose_start_date')),
+            expose_end_date=parse_date(detail.get('expose_end_date')),
+            move_in_possible_date=detail.get('move_in_possible_date'),  # NOW, YYYYMMDD 등 다양한 형식
+            detail_description=detail.get('detail_description'),
+            management_office_tel=detail.get('management_office_tel'),
+            near_subway=[
+                SubwayRecord(**subway) for subway in facility.get('near_subway') or []
+            ],
+            convenience_facilities=facility.get('convenience_facilities') or [],
+            security_facilities=facility.get('security_facilities') or [],
+            same_addr_direct_deal=to_int(addition.get('same_address_direct_deal')),
+            same_addr_hash=addition.get('same_address_hash'),
+            nearby_sales=addition.get('nearby_sales') or {},
+            acquisition_tax=to_int(tax.get('acquisition_tax')),
+            brokerage_fee=to_int(tax.get('brokerage_fee')),
+            etc_cost=to_int(tax.get('etc_cost')),
+            realtor=RealtorRecord(
+                office_name=realtor.get('office_name'),
+                agent_name=realtor.get('agent_name'),
+                phone_number=realtor.get('phone_number'),
+                representative_mobile=realtor.get('representative_mobile'),
+                office_certified=to_bool(realtor.get('office_certified'))
+            ) if realtor else None,
+            photos=[
+                PhotoRecord(
+                    url=photo['url'],
+                    thumbnail_url=photo.get('thumbnail_url'),
+                    description=photo.get('description'),
+                    display_order=to_int(photo.get('order')),
+                    registered_datetime=parse_datetime(photo.get('registered_datetime'))
+                )
+                for photo in sections.get('articlePhotos', {}).get('photos', []) if photo.get('url')
+            ],
+            building=BuildingRecord.from_register(register),
+            parsed_at=parsed_at or datetime.now().isoformat()
+        )
+
+    @classmethod
+    def from_parsed(cls, parsed_data: Dict) -> 'ArticleRecord':
+        """parse_article_detail의 dict 결과를 레코드로 변환 (디버그/테스트 스크립트 호환용)"""
+        record = cls.from_sections(
+            parsed_data.get('article_no'), parsed_data.get('sections', {}), parsed_data.get('parsing_timestamp')
+        )
+        metadata = parsed_data.get('metadata', {})
+        record.is_active = metadata.get('is_active', True)
+        return record
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+API 응답 바이트 디코더
+  json  : response.json() (기존 방식, 전체 dict 트리 생성)
+  orjson: orjson으로 bytes -> dict (orjson 설치 시)
+  typed : msgspec으로 bytes -> 사용하는 섹션/필드만 가진 Struct (모르는 키는 객체를 만들지 않고 건너뜀)
+
+typed 구조체는 field_spec 명세에서 생성하며, 기존 코드가 그대로 쓸 수 있도록 dict처럼
+get / [] / in / items()를 지원 (명세에 없는 키는 항상 없는 것으로 취급)
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, List, Optional
+from parsers.field_spec import (
+    FIELD_SPECS, SUB_SPECS, Nested, ListOf, compile_extractors, make_photos_extractor, _EXTRACTORS
+)
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    msgspec = None
+    HAS_MSGSPEC = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+logger = logging.getLogger(__name__)
+
+DECODERS = ('json', 'orjson', 'typed')
+
+# 목록 행에서 읽는 필드 (listing_state.FINGERPRINT_FIELDS, 사전 필터, 동일주소 정보 등)
+LIST_ROW_FIELDS = (
+    'articleNo', 'articleName', 'articleStatus', 'realEstateTypeCode', 'realEstateTypeName',
+    'tradeTypeCode', 'tradeTypeName', 'verificationTypeCode', 'floorInfo', 'dealOrWarrantPrc',
+    'rentPrc', 'area1', 'area2', 'direction', 'articleConfirmYmd', 'articleFeatureDesc', 'tagList',
+    'buildingName', 'sameAddrCnt', 'sameAddrDirectCnt', 'sameAddrMaxPrc', 'sameAddrMinPrc',
+    'realtorName', 'cpid', 'latitude', 'longitude', 'isPriceModification'
+)
+
+LIST_RESPONSE_FIELDS = ('isMoreData', 'mapExposedCount', 'totalCount', 'nonMapExposedIncluded')
+
+
+def resolve_decoder(name: str) -> str:
+    """설정된 디코더를 설치된 라이브러리에 맞게 결정 (typed -> orjson -> json 순으로 대체)"""
+    if name not in DECODERS:
+        logger.warning("⚠️ 알 수 없는 응답 디코더 '%s', json 사용", name)
+        return 'json'
+    if name == 'typed' and not HAS_MSGSPEC:
+        logger.warning("⚠️ msgspec 미설치로 typed 디코더 대신 %s 사용", 'orjson' if HAS_ORJSON else 'json')
+        name = 'orjson'
+    if name == 'orjson' and not HAS_ORJSON:
+        return 'json'
+    return name
+
+
+def is_typed(data: Any) -> bool:
+    return HAS_MSGSPEC and isinstance(data, msgspec.Struct)
+
+
+if HAS_MSGSPEC:
+    class MappingStruct(msgspec.Struct):
+        """dict처럼 읽을 수 있는 Struct - 값이 None(필드 없음 포함)이면 없는 키로 취급"""
+
+        def get(self, key: str, default: Any = None) -> Any:
+            value = getattr(self, key, None)
+            return default if value is None else value
+
+        def __getitem__(self, key: str) -> Any:
+            value = getattr(self, key, None)
+            if value is None:
+                raise KeyError(key)
+            return value
+
+        def __contains__(self, key: str) -> bool:
+            return getattr(self, key, None) is not None
+
+        def items(self):
+            for key in self.__struct_fields__:
+                value = getattr(self, key)
+                if value is not None:
+                    yield key, value
+
+    def _spec_struct(spec_name: str, cache: Dict[str, type]) -> type:
+        """명세의 API 키만 필드로 가진 Struct (값 타입은 API 그대로 두고 변환은 추출 함수에서)"""
+        if spec_name not in cache:
+            fields = []
+            for key, _, kind, _ in FIELD_SPECS[spec_name]:
+                if key is None or any(key == field[0] for field in fields):
+                    continue
+                if isinstance(kind, Nested):
+                    field_type = Optional[_spec_struct(kind.spec_name, cache)]
+                elif isinstance(kind, ListOf):
+                    field_type = Optional[List[_spec_struct(kind.spec_name, cache)]]
+                else:
+                    field_type = Any
+                fields.append((key, field_type, None))
+            cache[spec_name] = msgspec.defstruct(f'{spec_name}Struct', fields, bases=(MappingStruct,))
+        return cache[spec_name]
+
+    _STRUCTS: Dict[str, type] = {}
+    for _name in FIELD_SPECS:
+        _spec_struct(_name, _STRUCTS)
+
+    ArticleDetailStruct = msgspec.defstruct('ArticleDetailStruct', [
+        (name, Optional[List[_STRUCTS['photo']]] if name == 'articlePhotos' else Optional[_STRUCTS[name]], None)
+        for name in list(FIELD_SPECS) + ['articlePhotos'] if name not in SUB_SPECS
+    ], bases=(MappingStruct,))
+
+    ListRowStruct = msgspec.defstruct(
+        'ListRowStruct', [(name, Any, None) for name in LIST_ROW_FIELDS], bases=(MappingStruct,)
+    )
+    ListResponseStruct = msgspec.defstruct('ListResponseStruct', [
+        *[(name, Any, None) for name in LIST_RESPONSE_FIELDS],
+        ('articleList', Optional[List[ListRowStruct]], None)
+    ], bases=(MappingStruct,))
+
+    _TYPED_DECODERS = {
+        'detail': msgspec.json.Decoder(ArticleDetailStruct),
+        'list': msgspec.json.Decoder(ListResponseStruct),
+    }
+
+    _ATTR_EXTRACTORS, _ = compile_extractors('attr', {
+        '_Struct': msgspec.Struct,
+        **{f'extract_{name}': func for name, func in _EXTRACTORS.items()}
+    })
+
+    # 섹션명 -> Struct용 추출 함수 (ArticleParser에서 typed 응답에 사용)
+    TYPED_SECTION_EXTRACTORS: Dict[str, Callable[[Any], Dict]] = {
+        name: func for name, func in _ATTR_EXTRACTORS.items() if name not in SUB_SPECS
+    }
+    TYPED_SECTION_EXTRACTORS['articlePhotos'] = make_photos_extractor(_ATTR_EXTRACTORS['photo'])
+else:
+    TYPED_SECTION_EXTRACTORS = {}
+
+
+def decode_response(content: bytes, kind: str, decoder: str) -> Any:
+    """
+    응답 바이트 디코딩 (decoder는 resolve_decoder로 결정된 값)
+    kind: 'detail'(매물 상세) 또는 'list'(목록), typed 디코더에서만 사용
+    형식이 맞지 않으면 ValueError
+    """
+    if decoder == 'typed':
+        try:
+            return _TYPED_DECODERS[kind].decode(content)
+        except msgspec.DecodeError as e:
+            raise ValueError(f"typed 디코딩 실패: {e}") from e
+    if decoder == 'orjson':
+        return orjson.loads(content)
+    return json.loads(content)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+동일주소 묶음 조회 (sameAddressGroup=true)
+같은 건물/호실을 여러 중개사가 올린 매물은 목록에 대표 1건(sameAddrCnt = 묶음 매물 수)만 나옴
+-> 대표 매물만 평소처럼 상세 수집하고, 구성원은 묶음이 새로 생겼거나 요약(매물 수/최저/최고가)이 바뀌었거나
+   member_ttl_hours가 지났을 때만 대표 좌표 주변 범위를 묶음 해제 목록으로 조회해서 수집 대상에 추가
+묶음은 listing_state의 address_groups에 대표 매물 번호 기준으로 기록 (sameAddrHash는 대표 매물 상세에서 채움)
+"""
+
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# 묶음 요약 - 바뀌면 구성원 목록을 다시 확인
+SUMMARY_FIELDS = ('sameAddrCnt', 'sameAddrMinPrc', 'sameAddrMaxPrc')
+
+
+def group_summary(row: Dict) -> str:
+    return json.dumps([row.get(field) for field in SUMMARY_FIELDS], ensure_ascii=False, default=str)
+
+
+class AddressGroupExpander:
+    def __init__(self, api_client, listing_state, max_workers: int = None):
+        self.api_client = api_client
+        self.listing_state = listing_state
+        self.config = settings.grouping_settings
+        self.max_workers = max_workers or settings.collection_settings['parallel_workers']
+
+    def _fetch_members(self, cortar_no: str, row: Dict, filters: Optional[Dict]) -> Dict[str, Any]:
+        """대표 좌표 주변 범위를 묶음 해제로 조회해 같은 좌표의 다른 매물만 반환"""
+        latitude, longitude = float(row['latitude']), float(row['longitude'])
+        box = self.config['box_degrees']
+        bounds = (latitude - box, longitude - box, latitude + box, longitude + box)
+        filters = dict(filters or {}, sameAddressGroup=False)
+        members, requests = [], 0
+        for page in range(1, self.config['max_member_pages'] + 1):
+            response = self.api_client.get_area_articles(cortar_no, page, filters=filters, bounds=bounds)
+            requests += 1
+            articles = (response or {}).get('articleList') or []
+            members.extend(article for article in articles
+                           if article.get('articleNo') and str(article['articleNo']) != str(row['articleNo'])
+                           and article.get('latitude') == row['latitude'] and article.get('longitude') == row['longitude'])
+            if not articles or not response.get('isMoreData'):
+                break
+        return {'rows': members, 'requests': requests}
+
+    def expand(self, cortar_no: str, rows: List[Dict], filters: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        묶음 목록 한 페이지의 대표 행 중 구성원 확인이 필요한 묶음의 구성원 행 조회
+        반환: {'rows': 구성원 목록 행, 'groups_checked', 'members_skipped': 확인을 미룬 묶음의 구성원 수, 'list_requests'}
+        """
+        group_rows = [row for row in rows if (row.get('sameAddrCnt') or 1) > 1
+                      and row.get('latitude') and row.get('longitude')]
+        known = self.listing_state.get_address_groups(str(row['articleNo']) for row in group_rows)
+        member_ttl = self.config['member_ttl_hours'] * 3600
+        now = time.time()
+
+        due, members_skipped = [], 0
+        for row in group_rows:
+            group = known.get(str(row['articleNo']))
+            if group and group['summary'] == group_summary(row) and now - group['members_checked_at'] < member_ttl:
+                members_skipped += row['sameAddrCnt'] - 1
+            else:
+                due.append(row)
+
+        results = []
+        if due:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(due))) as executor:
+                results = list(executor.map(lambda row: self._fetch_members(cortar_no, row, filters), due))
+
+        members = []
+        for row, result in zip(due, results):
+            members.extend(result['rows'])
+            self.listing_state.save_address_group(
+                str(row['articleNo']), cortar_no, row['latitude'], row['longitude'], row['sameAddrCnt'],
+                group_summary(row), [str(member['articleNo']) for member in result['rows']])
+
+        list_requests = sum(result['requests'] for result in results)
+        if group_rows:
+            logger.info("🏢 동일주소 묶음 %d개 중 %d개 구성원 확인: 구성원 %d개, 요청 %d회 (미룬 구성원 %d개)",
+                        len(group_rows), len(due), len(members), list_requests, members_skipped,
+                        extra={'area': cortar_no})
+        return {
+            'rows': members,
+            'groups_checked': len(due),
+            'members_skipped': members_skipped,
+            'list_requests': list_requests
+        }
@@ -3,18 +3,30 @@
 주소 변환 서비스 (카카오 API 기반)
 """
 
+import logging
 import requests
 import json
+import threading
 import time
 from typing import Dict, Optional
 from config.settings import settings
+from collectors.cassette import Cassette, CassetteSession, get_default_cassette
+from monitoring.metrics import GEOCODE_CACHE, KAKAO_REQUESTS
+
+logger = logging.getLogger(__name__)
 
 class AddressService:
-    def __init__(self):
-        if not settings.kakao_api_key:
+    def __init__(self, cassette: Cassette = None):
+        """cassette: HTTP 녹화/재생 카세트, 기본값은 설정의 cassette_settings (재생 모드는 API 키 불필요)"""
+        cassette = cassette or get_default_cassette()
+        replaying = bool(cassette and cassette.mode == 'replay')
+        if not settings.kakao_api_key and not replaying:
             raise ValueError("카카오 API 키가 필요합니다. KAKAO_REST_API_KEY 환경변수를 설정하세요.")
         
-        self.api_key = settings.kakao_api_key
+        self.session = requests.Session()
+        if cassette:
+            self.session = CassetteSession(cassette, 'kakao', self.session)
+        self.api_key = settings.kakao_api_key or ''
         self.base_url = "https://dapi.kakao.com/v2/local/geo/coord2address.json"
         self.headers = {
             'Authorization': f'KakaoAK {self.api_key}',
@@ -23,15 +35,25 @@ class AddressService:
         
         self.address_cache = {}
         self.request_count = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._stats_lock = threading.Lock()  # 수집 워커 스레드들이 함께 갱신
         self.daily_limit = 100000
     
     def convert_coordinates_to_address(self, latitude: str, longitude: str) -> Optional[Dict]:
         cache_key = f"{latitude},{longitude}"
-        if cache_key in self.address_cache:
-            return self.address_cache[cache_key]
+        cached = self.address_cache.get(cache_key)
+        with self._stats_lock:
+            if cached is not None:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+        GEOCODE_CACHE.inc('hit' if cached is not None else 'miss')
+        if cached is not None:
+            return cached
         
         if self.request_count >= self.daily_limit:
-            print(f"⚠️ 일일 API 호출 제한 도달: {self.daily_limit}")
+            logger.warning("⚠️ 일일 API 호출 제한 도달: %d", self.daily_limit)
             return None
         
         try:
@@ -41,8 +63,10 @@ class AddressService:
                 'input_coord': 'WGS84'
             }
             
-            response = requests.get(self.base_url, headers=self.headers, params=params)
-            self.request_count += 1
+            response = self.session.get(self.base_url, headers=self.headers, params=params)
+            with self._stats_lock:
+                self.request_count += 1
+            KAKAO_REQUESTS.inc(response.status_code)
             
             if response.status_code == 200:
                 data = response.json()
@@ -52,24 +76,24 @@ class AddressService:
                     self.address_cache[cache_key] = address_info
                     return address_info
                 else:
-                    print(f"⚠️ 주소 변환 실패: 좌표 ({latitude}, {longitude})")
+                    logger.info("⚠️ 주소 변환 실패: 좌표 (%s, %s)", latitude, longitude)
                     return None
             
             elif response.status_code == 401:
-                print("❌ 카카오 API 인증 실패. API 키를 확인하세요.")
+                logger.error("❌ 카카오 API 인증 실패. API 키를 확인하세요.")
                 return None
             
             elif response.status_code == 429:
-                print("⚠️ API 호출 한도 초과. 잠시 대기 후 재시도...")
+                logger.warning("⚠️ API 호출 한도 초과. 잠시 대기 후 재시도...", extra={'status': 429})
                 time.sleep(1)
                 return self.convert_coordinates_to_address(latitude, longitude)
             
             else:
-                print(f"❌ API 호출 오류: {response.status_code}")
+                logger.error("❌ API 호출 오류: %d", response.status_code, extra={'status': response.status_code})
                 return None
                 
         except Exception as e:
-            print(f"❌ 주소 변환 중 오류: {e}")
+            logger.error("❌ 주소 변환 중 오류: %s", e)
             return None
     
     def _parse_address_response(self, document: Dict) -> Dict:
@@ -111,9 +135,13 @@ class AddressService:
         return result
     
     def get_usage_stats(self) -> Dict:
+        lookups = self.cache_hits + self.cache_misses
         return {
             "total_requests": self.request_count,
-            "cache_hits": len(self.address_cache),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_rate": f"{(self.cache_hits / lookups * 100):.2f}%" if lookups else "0%",
+            "cache_size": len(self.address_cache),
             "remaining_daily_limit": self.daily_limit - self.request_count,
             "usage_percentage": f"{(self.request_count / self.daily_limit * 100):.2f}%"
         }
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+지역 재수집 스케줄러 - 우선순위와 관측된 변경률로 지역별 재수집 주기를 정하고
+요청 1회당 기대 변경 건수가 가장 큰 지역부터 수집
+"""
+
+import logging
+import math
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Callable
+from config.settings import settings
+from config.area_codes import PRIORITY_SCORES
+
+logger = logging.getLogger(__name__)
+
+
+class AreaScheduler:
+    def __init__(self, service, areas: List[Dict], collect_area: Callable = None):
+        """
+        service: CollectionService (상태 저장소/저장소 공유)
+        areas: [{'name': ..., 'code': ..., 'priority': ...}]
+        collect_area: 지역 1회 수집 함수 (기본: 최신순 신규 매물 탐색)
+        """
+        self.service = service
+        self.areas = areas
+        self.collect_area = collect_area or service.discover_and_save_area
+        self.sweep_mode = 'full' if self.collect_area == service.collect_and_save_area else 'discovery'
+        self.config = settings.scheduler_settings
+        self.max_priority = max([area.get('priority', 0) for area in areas] + list(PRIORITY_SCORES.values()) + [1])
+        self._history_rates = {}
+        self._last_visit = {}
+
+    def _priority_weight(self, area: Dict) -> float:
+        """우선순위를 0.5~1.5 가중치로 변환"""
+        return 0.5 + area.get('priority', 0) / self.max_priority
+
+    def _get_history_rate(self, area: Dict) -> Optional[float]:
+        """naver_property_history 기반 시간당 변경 건수 (history_ttl초 동안 캐시 후 재조회)"""
+        code = area['code']
+        cached = self._history_rates.get(code)
+        if cached and time.time() - cached[1] < self.config['history_ttl']:
+            return cached[0]
+
+        window_days = self.config['history_window_days']
+        article_nos = self.service.listing_state.get_area_article_nos(code)
+        since = datetime.now() - timedelta(days=window_days)
+        changes = self.service.repository.count_recent_changes(article_nos, since) if article_nos else None
+        rate = changes / (window_days * 24) if changes is not None else None
+        self._history_rates[code] = (rate, time.time())
+        return rate
+
+    def estimate_change_rate(self, area: Dict) -> float:
+        """시간당 변경 건수 추정 - 목록 fingerprint 관측값과 변경 이력을 합산, 근거가 없으면 기본값"""
+        sweeps = self.service.listing_state.get_area_sweeps(area['code'], limit=self.config['sweep_window'])
+
+        observed_changes = 0
+        observed_hours = 0.0
+        for previous, current in zip(sweeps, sweeps[1:]):
+            observed_changes += current['rows_changed'] or 0
+            observed_hours += max(0.0, (current['finished_at'] - previous['finished_at']) / 3600)
+
+        history_rate = self._get_history_rate(area)
+        if history_rate is not None:
+            window_hours = self.config['history_window_days'] * 24
+            observed_changes += history_rate * window_hours
+            observed_hours += window_hours
+
+        if observed_hours <= 0:
+            return self.config['default_change_rate']
+        return max(observed_changes / observed_hours, self.config['min_change_rate'])
+
+    def get_interval(self, area: Dict, rate: float = None) -> float:
+        """재수집 주기 (초): 기대 변경 건수가 target에 도달하는 시간, 우선순위가 높을수록 짧게"""
+        if rate is None:
+            rate = self.estimate_change_rate(area)
+        weighted_rate = rate * self._priority_weight(area)
+        interval = self.config['target_changes_per_visit'] / weighted_rate * 3600
+        return min(max(interval, self.config['min_interval']), self.config['max_interval'])
+
+    def _last_finished_at(self, area: Dict) -> Optional[float]:
+        if area['code'] in self._last_visit:
+            return self._last_visit[area['code']]
+        sweeps = self.service.listing_state.get_area_sweeps(area['code'], limit=1)
+        return sweeps[-1]['finished_at'] if sweeps else None
+
+    def estimate_requests(self, area: Dict, expected_changes: float) -> float:
+        """지역 1회 방문 예상 요청 수 = 목록 페이지 + 변경 매물 상세 요청"""
+        sweeps = self.service.listing_state.get_area_sweeps(area['code'], limit=1)
+        rows_per_page = self.config['rows_per_page']
+        list_pages = max(1, math.ceil(expected_changes / rows_per_page))
+        if sweeps and sweeps[-1]['mode'] == 'full':
+            list_pages = max(list_pages, sweeps[-1]['list_requests'] or 1)
+        return list_pages + expected_changes
+
+    def score(self, area: Dict, now: float = None) -> Dict[str, Any]:
+        """지역의 재수집 필요 여부와 요청당 기대 변경 건수"""
+        now = now or time.time()
+        rate = self.estimate_change_rate(area)
+        interval = self.get_interval(area, rate)
+        last = self._last_finished_at(area)
+        elapsed = now - last if last else float('inf')
+
+        hours_since = min(elapsed, self.config['max_interval']) / 3600
+        expected_changes = rate * hours_since
+        requests = self.estimate_requests(area, expected_changes)
+
+        return {
+            'area': area,
+            'change_rate': rate,
+            'interval': interval,
+            'due_in': 0.0 if elapsed >= interval else interval - elapsed,
+            'expected_changes': expected_changes,
+            'changes_per_request': self._priority_weight(area) * expected_changes / requests if requests else 0.0,
+            'estimated_seconds': self.service.progress.estimate_seconds([area['code']], self.sweep_mode)
+        }
+
+    def next_area(self, until: float = None) -> Optional[Dict[str, Any]]:
+        """
+        재수집 시점이 된 지역 중 요청당 기대 변경 건수가 가장 큰 지역, 없으면 가장 먼저 도래할 지역
+        until: 이 시각(epoch)까지 끝나지 않을 것으로 예상되는 방문은 제외 (진행률 추적기의 ETA 기준)
+        """
+        now = time.time()
+        scores = [entry for entry in (self.score(area, now) for area in self.areas)
+                  if until is None or now + entry['due_in'] + entry['estimated_seconds'] <= until]
+        due = [entry for entry in scores if entry['due_in'] <= 0]
+        if due:
+            return max(due, key=lambda entry: entry['changes_per_request'])
+        return min(scores, key=lambda entry: entry['due_in']) if scores else None
+
+    def run(self, max_visits: int = None, max_pages: int = None, max_articles: int = None, until: float = None):
+        """until: 수집 창 종료 시각 (epoch), 그 전에 끝날 것으로 예상되는 방문만 수행"""
+        logger.info("🗓️ 지역 스케줄러 시작: %d개 지역", len(self.areas))
+        self.print_schedule()
+
+        visits = 0
+        try:
+            while max_visits is None or visits < max_visits:
+                entry = self.next_area(until)
+                if not entry:
+                    if until:
+                        logger.info("⌛ 수집 창 안에 끝낼 수 있는 지역 방문이 없어 종료")
+                    break
+
+                if entry['due_in'] > 0:
+                    wait = min(entry['due_in'], self.config['max_idle_sleep'])
+                    logger.info("⏳ 다음 재수집까지 %.0f초 대기 (%s)", wait, entry['area']['name'])
+                    time.sleep(wait)
+                    continue
+
+                area = entry['area']
+                logger.info("🔍 %s 재수집 (변경률 %.2f건/시간, 요청당 기대 변경 %.3f건, 예상 소요 %.1f분)",
+                            area['name'], entry['change_rate'], entry['changes_per_request'],
+                            entry['estimated_seconds'] / 60, extra={'area': area['code']})
+                self.collect_area(area['code'], max_pages=max_pages, max_articles=max_articles)
+                self._last_visit[area['code']] = time.time()
+                visits += 1
+        except KeyboardInterrupt:
+            logger.warning("⚠️ 스케줄러 중단")
+
+    def print_schedule(self):
+        logger.info("📅 지역별 재수집 계획:")
+        for entry in sorted((self.score(area) for area in self.areas), key=lambda e: -e['changes_per_request']):
+            logger.info("   %s (%s점): 변경률 %.2f건/시간, 주기 %.0f분, 대기 %.0f분, 요청당 기대 변경 %.3f건, 예상 소요 %.1f분",
+                        entry['area']['name'], entry['area'].get('priority', 0), entry['change_rate'],
+                        entry['interval'] / 60, entry['due_in'] / 60, entry['changes_per_request'],
+                        entry['estimated_seconds'] / 60)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+면적/가격 구간 분할 목록 조회
+한 지역(cortarNo) 목록을 겹치지 않는 면적(areaMin/areaMax) 또는 가격(priceMin/priceMax) 구간으로 나눠
+구간별 페이지 체인을 병렬 워커로 따라감 (깊은 페이지까지 내려가지 않아도 됨)
+
+  - 구간 구성: 직전 실행의 구간 구성에서 매물이 적은 이웃 구간은 합침 (기록이 없으면 기본 경계)
+  - 실행 중: 구간 1페이지의 총량이 max_pages를 넘으면 1페이지 행 값의 중앙값에서 나눠 다시 조회
+  - 완전성: 구간 총량 합계가 지역 총량과 같아야 완료 (다르면 호출 측에서 순차 조회로 보충)
+구간은 [하한, 상한) 실수 범위로 이웃 구간과 겹치지 않음 (49.5㎡처럼 소수 값도 한 구간에만 속함)
+목록 API 범위 파라미터는 상하한을 모두 포함하므로 상한은 값 단위(resolution)만큼 빼서 보냄, 전체 범위의 마지막 구간만 상한 포함
+"""
+
+import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from config.settings import settings
+from collectors.naver_api_client import BAND_PARAMS
+from services.progress_tracker import list_total_count
+from services.list_filter import PRICE_UNIT, parse_list_price
+from services.request_budget import RequestBudget
+
+logger = logging.getLogger(__name__)
+
+
+def band_value(row: Dict, dimension: str) -> Optional[float]:
+    """목록 행의 구간 기준 값 (면적: area1 ㎡, 가격: 매매가/보증금 만원)"""
+    if dimension == 'area':
+        value = row.get('area1')
+        return float(value) if isinstance(value, (int, float)) else None
+    price = parse_list_price(row.get('dealOrWarrantPrc'))
+    return price // PRICE_UNIT if price is not None else None
+
+
+def _round_bound(value: float, resolution: float) -> float:
+    """구간 경계를 값 단위로 맞춤 (정수 경계는 정수로)"""
+    value = round(round(value / resolution) * resolution, 6)
+    return int(value) if float(value).is_integer() else value
+
+
+def split_band(band: Dict[str, Any], samples: List[float] = (), resolution: float = 1) -> Optional[List[Dict[str, Any]]]:
+    """
+    [하한, 상한) 구간을 [하한, 중간)과 [중간, 상한)으로 나눔, 나눌 수 없으면 None
+    samples: 구간 1페이지 행의 값 - 중앙값에서 나눔 (없거나 하한과 같으면 범위가 넓을 때 기하 평균, 좁을 때 산술 평균)
+    resolution: 값 단위 (면적 0.01㎡, 가격 1만원) - 경계를 이 단위로 맞춤
+    """
+    low, high = band['min'], band['max']
+    candidates = []
+    samples = sorted(value for value in samples if low <= value <= high)
+    if samples:
+        candidates.append(samples[len(samples) // 2])
+    if high > 10 * max(low, 1):
+        candidates.append(math.sqrt(max(low, 1) * high))
+    candidates.append((low + high) / 2)
+    for middle in candidates:
+        middle = _round_bound(middle, resolution)
+        if low < middle < high:
+            return [{'min': low, 'max': middle, 'total': None}, {'min': middle, 'max': high, 'total': None}]
+    return None
+
+
+class BandPartitioner:
+    def __init__(self, api_client, listing_state=None, dimension: str = None, max_workers: int = None):
+        """listing_state: 직전 구간 구성 조회/저장용 ListingStateStore (없으면 매번 기본 경계)"""
+        self.api_client = api_client
+        self.listing_state = listing_state
+        self.config = settings.band_settings
+        self.dimension = dimension or self.config['dimension']
+        if self.dimension not in BAND_PARAMS:
+            raise ValueError(f"알 수 없는 구간 종류: {self.dimension} ({', '.join(BAND_PARAMS)})")
+        self.max_workers = max_workers or settings.collection_settings['parallel_workers']
+        self.rows_per_page = settings.scheduler_settings['rows_per_page']
+        self.resolution = self.config['resolution'][self.dimension]
+
+    def _query_range(self, filters: Optional[Dict]) -> Tuple[float, float]:
+        """목록 필터(사전 필터의 priceMin/priceMax 등)와 겹치는 구간 전체 범위 (상한 포함)"""
+        min_param, max_param = BAND_PARAMS[self.dimension]
+        filters = filters or {}
+        return filters.get(min_param, 0), filters.get(max_param, self.config['range_max'])
+
+    def query_bounds(self, band: Dict[str, Any], filters: Optional[Dict] = None) -> Tuple[float, float]:
+        """[하한, 상한) 구간의 목록 API 파라미터 값 (상하한 포함 API라 상한에서 값 단위를 뺌, 전체 범위 끝은 그대로)"""
+        if band['max'] >= self._query_range(filters)[1]:
+            return band['min'], band['max']
+        return band['min'], _round_bound(band['max'] - self.resolution, self.resolution)
+
+    def initial_bands(self, cortar_no: str, filters: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """직전 구간 구성에서 작은 이웃 구간을 합친 구간 목록, 기록이 없거나 범위가 다르면 기본 경계"""
+        low, high = self._query_range(filters)
+        previous = self.listing_state.get_area_bands(cortar_no, self.dimension) if self.listing_state else []
+        contiguous = all(current['min'] == before['max'] for before, current in zip(previous, previous[1:]))
+        if previous and contiguous and previous[0]['min'] == low and previous[-1]['max'] == high \
+                and all(band['total'] is not None for band in previous):
+            return self._merge_sparse(previous)
+
+        edges = sorted({edge for edge in self.config['edges'][self.dimension] if low < edge < high} | {low})
+        return [{'min': start, 'max': edges[index + 1] if index + 1 < len(edges) else high, 'total': None}
+                for index, start in enumerate(edges)]
+
+    def _merge_sparse(self, bands: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """합계가 target_pages 이하이거나 한쪽이 빈 이웃 구간을 합침 (큰 구간은 실행 중 1페이지 총량으로 나눔)"""
+        target_rows = self.config['target_pages'] * self.rows_per_page
+        merged: List[Dict[str, Any]] = []
+        for band in bands:
+            last = merged[-1] if merged else None
+            if last and (last['total'] + band['total'] <= target_rows or not last['total'] or not band['total']):
+                merged[-1] = {'min': last['min'], 'max': band['max'], 'total': last['total'] + band['total']}
+            else:
+                merged.append(dict(band))
+        return merged
+
+    def _fetch_page(self, cortar_no: str, band: Dict[str, Any], page: int, order: str,
+                    filters: Optional[Dict], budget: RequestBudget) -> Tuple[List[Dict], Optional[Dict]]:
+        """구간 목록 한 페이지, 요청 예산이 없으면 ([], None)"""
+        if not budget.take():
+            return [], None
+        band_min, band_max = self.query_bounds(band, filters)
+        response = self.api_client.get_area_articles(cortar_no, page, filters=filters, order=order,
+                                                     band=(self.dimension, band_min, band_max))
+        articles = [article for article in (response or {}).get('articleList') or [] if article.get('articleNo')]
+        return articles, response
+
+    def _fetch_first_pages(self, cortar_no: str, bands: List[Dict[str, Any]], order: str,
+                           filters: Optional[Dict], budget: RequestBudget) -> List[Dict[str, Any]]:
+        """
+        구간별 1페이지 조회로 총량 확인, 총량이 큰 구간은 나눠서 다시 조회 -> 최종 구간
+        요청 예산이 모자라 조회하지 못한 구간은 total None
+        """
+        split_rows = self.config['max_pages'] * self.rows_per_page
+        final: List[Dict[str, Any]] = []
+        pending = bands
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending:
+                results = list(executor.map(
+                    lambda band: self._fetch_page(cortar_no, band, 1, order, filters, budget), pending))
+                next_round = []
+                for band, (articles, response) in zip(pending, results):
+                    if response is None and budget.exhausted:
+                        final.append(dict(band, total=None, rows=[], more=False))
+                        continue
+                    band = dict(band, total=list_total_count(response or {}), rows=articles,
+                                more=bool(response and response.get('isMoreData')))
+                    if band['total'] is None:
+                        band['total'] = len(articles)
+                    samples = [value for value in (band_value(row, self.dimension) for row in articles)
+                               if value is not None]
+                    halves = split_band(band, samples, self.resolution) if band['total'] > split_rows else None
+                    if halves:
+                        next_round.extend(halves)
+                    else:
+                        final.append(band)
+                pending = next_round
+        final.sort(key=lambda band: band['min'])
+        return final
+
+    def _fetch_rest(self, cortar_no: str, band: Dict[str, Any], order: str, filters: Optional[Dict],
+                    budget: RequestBudget) -> List[Dict]:
+        """구간의 2페이지 이후 조회 (요청 예산까지)"""
+        rows: List[Dict] = []
+        if not band['more']:
+            return rows
+        last_page = max(math.ceil(band['total'] / self.rows_per_page), 2)
+        for page in range(2, last_page + 1):
+            articles, response = self._fetch_page(cortar_no, band, page, order, filters, budget)
+            rows.extend(articles)
+            if not articles or not response.get('isMoreData'):
+                break
+        return rows
+
+    def fetch(self, cortar_no: str, order: str = 'rank', filters: Optional[Dict] = None,
+              seen: Iterable[str] = (), total: Optional[int] = None, max_requests: Optional[int] = None) -> Dict[str, Any]:
+        """
+        지역을 구간별로 병렬 조회
+        seen: 이미 확인한 article_no (결과에서 제외), total: 지역 총량 (완전성 확인용)
+        max_requests: 목록 요청 수 상한 (구간 전체 합계, 상한에 걸리면 미완료로 반환하고 구간 구성은 저장하지 않음)
+        반환: {'rows': 중복 제거된 새 목록 행, 'seen', 'bands', 'band_total', 'complete': 구간 합계 == 지역 총량,
+               'list_requests', 'duplicates'}
+        """
+        budget = RequestBudget(max_requests)
+        bands = self._fetch_first_pages(cortar_no, self.initial_bands(cortar_no, filters), order, filters, budget)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            rest = list(executor.map(lambda band: self._fetch_rest(cortar_no, band, order, filters, budget), bands))
+        requests = budget.used
+
+        seen_nos: Set[str] = set(seen)
+        rows = []
+        duplicates = 0
+        for band, more_rows in zip(bands, rest):
+            for article in band['rows'] + more_rows:
+                article_no = str(article['articleNo'])
+                if article_no in seen_nos:
+                    duplicates += 1
+                    continue
+                seen_nos.add(article_no)
+                rows.append(article)
+
+        band_total = sum(band['total'] or 0 for band in bands)
+        layout = [{'min': band['min'], 'max': band['max'], 'total': band['total']} for band in bands]
+        if budget.exhausted:
+            logger.info("✂️ 지역 %s 구간 조회 요청 상한 %d회 도달", cortar_no, max_requests, extra={'area': cortar_no})
+        elif self.listing_state:
+            try:
+                self.listing_state.save_area_bands(cortar_no, self.dimension, layout)
+            except Exception as e:
+                logger.warning("⚠️ 구간 구성 저장 실패: %s", e)
+
+        logger.info("📐 지역 %s %s 구간 %d개 목록 조회: 요청 %d회, 구간 합계 %d/%s, 새 매물 %d개 (중복 %d개)",
+                    cortar_no, self.dimension, len(bands), requests, band_total,
+                    total if total is not None else '?', len(rows), duplicates,
+                    extra={'area': cortar_no, 'bands': layout})
+        return {
+            'rows': rows,
+            'seen': seen_nos,
+            'bands': layout,
+            'band_total': band_total,
+            'complete': total is not None and band_total == total and not budget.exhausted,
+            'list_requests': requests,
+            'duplicates': duplicates
+        }
@@ -3,80 +3,149 @@
 매물 수집 서비스 - 전체 수집 프로세스 조율
 """
 
-from typing import List, Dict, Optional, Any
+import logging
+from typing import List, Dict, Optional, Any, Tuple, Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
 import time
-from datetime import datetime
 from collectors.naver_api_client import NaverAPIClient
 from parsers.article_parser import ArticleParser
 from database.optimized_repository import OptimizedPropertyRepository
 from services.address_service import AddressService
+from services.list_filter import PRICE_UNIT, ListPrefilter, rules_for_type
+from database.listing_state import ListingStateStore, compute_list_fingerprint
+from parsers.records import ArticleRecord
+from services.refresh_policy import compute_next_refresh, parse_expose_start
+from services.progress_tracker import ProgressTracker, list_total_count
+from services.geo_tiles import TiledListFetcher
+from services.band_partition import BandPartitioner
+from services.address_groups import AddressGroupExpander
+from config.area_codes import get_area_bounds
 from config.settings import settings
+from monitoring.spans import stage_spans
+from monitoring.metrics import ARTICLES, DETAIL_QUEUE_DEPTH
+
+logger = logging.getLogger(__name__)
 
 class CollectionService:
-    def __init__(self):
-        self.api_client = NaverAPIClient()
+    def __init__(self, list_prefilter: Optional[bool] = None, smart_refresh: Optional[bool] = None,
+                 api_client: NaverAPIClient = None, repository: OptimizedPropertyRepository = None,
+                 address_service: AddressService = None, listing_state: ListingStateStore = None,
+                 tiled_listing: Optional[bool] = None, banded_listing: Optional[bool] = None,
+                 same_address_group: Optional[bool] = None):
+        """api_client/repository/address_service/listing_state: 미리 만든 구성요소 (벤치마크용), 없으면 설정대로 생성"""
+        self.api_client = api_client or NaverAPIClient()
         self.parser = ArticleParser()
-        self.repository = OptimizedPropertyRepository()
+        self.repository = repository or OptimizedPropertyRepository()
+        self.listing_state = listing_state or ListingStateStore()
         
-        try:
-            self.address_service = AddressService()
+        if address_service:
+            self.address_service = address_service
             self.address_enabled = True
-        except ValueError as e:
-            print(f"⚠️ 주소 서비스 비활성화: {e}")
-            self.address_enabled = False
+        else:
+            try:
+                self.address_service = AddressService()
+                self.address_enabled = True
+            except ValueError as e:
+                logger.warning("⚠️ 주소 서비스 비활성화: %s", e)
+                self.address_enabled = False
+        
+        # 목록 단계 사전 필터 (옵트인)
+        if list_prefilter is None:
+            list_prefilter = settings.collection_settings['list_prefilter_enabled']
+        self.list_prefilter = ListPrefilter() if list_prefilter and settings.validation_rules['validation_enabled'] else None
+        
+        # 매물별 TTL 기반 상세 재수집 (옵트인)
+        self.smart_refresh = settings.refresh_settings['ttl_enabled'] if smart_refresh is None else smart_refresh
+        
+        # 큰 지역 목록을 위경도 타일별로 병렬 조회 (옵트인)
+        self.tiled_listing = settings.tiling_settings['enabled'] if tiled_listing is None else tiled_listing
+        # 지역 목록을 면적/가격 구간별로 병렬 조회 (옵트인, 타일 분할보다 우선)
+        self.banded_listing = settings.band_settings['enabled'] if banded_listing is None else banded_listing
+        # 동일주소 묶음 목록 조회 - 구성원은 묶음이 바뀌었거나 주기가 지났을 때만 (옵트인)
+        if same_address_group is None:
+            same_address_group = settings.grouping_settings['enabled']
+        self.address_groups = AddressGroupExpander(self.api_client, self.listing_state) if same_address_group else None
         
         self.collection_stats = {
             'total_processed': 0,
             'successful_collections': 0,
             'parsing_failures': 0,
             'save_failures': 0,
+            'detail_requests_avoided': 0,
+            'refresh_skipped': 0,
+            'group_members_skipped': 0,
+            'articles_seen': 0,
+            'saved_by_type': {},         # 매물 유형 코드별 저장 건수 (여러 유형을 함께 수집할 때 표시)
             'start_time': None,
             'estimated_completion': None
         }
+        self._stats_lock = threading.Lock()  # collection_stats는 수집 워커 스레드들이 함께 갱신
+        self.areas_collected: List[str] = []  # 이번 실행에서 수집한 지역 (실행 기록용)
+        self.progress = ProgressTracker(self.listing_state)  # 실행 전체 진행률/ETA (main에서 plan()으로 지역 목록 지정)
+    
+    def _count(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self.collection_stats[key] += amount
     
     def collect_single_article(self, article_no: str, quiet: bool = False) -> bool:
-        self.collection_stats['total_processed'] += 1
+        with stage_spans.span('article.total'):
+            return self._collect_single_article(article_no, quiet)
+    
+    def _collect_single_article(self, article_no: str, quiet: bool = False) -> bool:
+        """fetch -> parse -> geocode -> validate -> save (단계별 시간은 stage_spans에 기록)"""
+        self._count('total_processed')
         if not quiet:
-            print(f"🔍 매물 {article_no} 상세정보 수집 중...")
+            logger.info("🔍 매물 %s 상세정보 수집 중...", article_no)
         
         try:
-            raw_data = self.api_client.get_article_detail(article_no)
+            with stage_spans.span('article.fetch'):
+                raw_data = self.api_client.get_article_detail(article_no)
             if not raw_data:
-                print(f"❌ API 호출 실패: {article_no}")
+                logger.warning("❌ API 호출 실패: %s", article_no, extra={'article_no': article_no})
                 return False
             
             if not quiet:
-                print(f"📝 매물 {article_no} 데이터 파싱 중...")
-            parsed_data = self.parser.parse_article_detail(raw_data, article_no)
-            if not parsed_data:
-                if not quiet:
-                    print(f"❌ 파싱 실패: {article_no}")
-                self.collection_stats['parsing_failures'] += 1
+                logger.debug("📝 매물 %s 데이터 파싱 중...", article_no)
+            with stage_spans.span('article.parse'):
+                article = self.parser.parse_article_record(raw_data, article_no)
+            if not article:
+                logger.warning("❌ 파싱 실패: %s", article_no, extra={'article_no': article_no})
+                self._count('parsing_failures')
                 return False
             
-            if self.address_enabled and 'articleDetail' in parsed_data.get('sections', {}):
-                self._enrich_with_address_data(parsed_data)
+            if self.address_enabled:
+                with stage_spans.span('article.geocode'):
+                    self._enrich_with_address_data(article)
             
             # 매물 검증 및 is_active 설정
-            self._validate_and_set_active_status(parsed_data, quiet)
+            with stage_spans.span('article.validate'):
+                self._validate_and_set_active_status(article, quiet)
             
             if not quiet:
-                print(f"💾 매물 {article_no} 데이터베이스 저장 중...")
-            success = self.repository.save_property(parsed_data)
+                logger.debug("💾 매물 %s 데이터베이스 저장 중...", article_no)
+            with stage_spans.span('article.save'):
+                success = self.repository.save_property(article)
             if success:
-                self.collection_stats['successful_collections'] += 1
+                self._count('successful_collections')
+                with self._stats_lock:
+                    saved_by_type = self.collection_stats['saved_by_type']
+                    type_code = article.real_estate_type_code or '?'
+                    saved_by_type[type_code] = saved_by_type.get(type_code, 0) + 1
+                with stage_spans.span('article.schedule'):
+                    self._schedule_next_refresh(article_no, article)
+                if self.address_groups and article.same_addr_hash:
+                    self.listing_state.set_address_group_hash(article_no, article.same_addr_hash)
                 if not quiet:
-                    print(f"✅ 매물 {article_no} 저장 완료!")
+                    logger.info("✅ 매물 %s 저장 완료!", article_no)
                 return True
             else:
-                self.collection_stats['save_failures'] += 1
-                if not quiet:
-                    print(f"❌ 데이터베이스 저장 실패: {article_no}")
+                self._count('save_failures')
+                logger.warning("❌ 데이터베이스 저장 실패: %s", article_no, extra={'article_no': article_no})
                 return False
                 
         except Exception as e:
-            print(f"❌ Error processing article {article_no}: {e}")
+            logger.error("❌ Error processing article %s: %s", article_no, e, extra={'article_no': article_no})
             return False
     
     def collect_area_articles(self, cortar_no: str, max_pages: int = None) -> List[str]:
@@ -87,16 +156,16 @@ class CollectionService:
             if max_pages and page > max_pages:
                 break
                 
-            print(f"🔍 수집 중: 지역 {cortar_no}, 페이지 {page}")
+            logger.debug("🔍 수집 중: 지역 %s, 페이지 %d", cortar_no, page)
             
-            response = self.api_client.get_area_articles(cortar_no, page)  # 사무실만 수집 (상가 제외)
+            response = self.api_client.get_area_articles(cortar_no, page)  # 설정된 매물 유형만 (기본: 사무실)
             if not response or 'articleList' not in response:
-                print(f"❌ No more articles found for area {cortar_no}")
+                logger.info("❌ No more articles found for area %s", cortar_no)
                 break
             
             articles = response['articleList']
             if not articles:
-                print(f"✅ No more articles on page {page}")
+                logger.info("✅ No more articles on page %d", page)
                 break
             
             page_articles = []
@@ -109,46 +178,37 @@ class CollectionService:
                 break
             
             collected_articles.extend(page_articles)
-            print(f"📄 페이지 {page}: {len(page_articles)}개 매물 발견")
+            logger.info("📄 페이지 %d: %d개 매물 발견", page, len(page_articles))
             
             page += 1
         
-        print(f"📊 지역 {cortar_no} 총 {len(collected_articles)}개 매물 발견")
+        logger.info("📊 지역 %s 총 %d개 매물 발견", cortar_no, len(collected_articles))
         return collected_articles
     
     def collect_and_save_area(self, cortar_no: str, max_pages: int = None, max_articles: int = None) -> Dict[str, Any]:
-        print(f"🚀 지역 {cortar_no} 수집 시작")
+        logger.info("🚀 지역 %s 수집 시작", cortar_no)
         
         successful_collections = 0
         total_processed = 0
-        page = 1
-        
-        while True:
-            if max_pages and page > max_pages:
-                break
-                
-            print(f"🔍 수집 중: 지역 {cortar_no}, 페이지 {page}")
-            
-            response = self.api_client.get_area_articles(cortar_no, page)  # 사무실만 수집 (상가 제외)
-            if not response or 'articleList' not in response:
-                print(f"❌ No more articles found for area {cortar_no}")
-                break
+        sweep = self._new_sweep_counters()
+        self.progress.start_area(cortar_no, 'full')
+        
+        for page, articles in self._iter_list_pages(cortar_no, settings.discovery_settings['full_sweep_order'],
+                                                    max_pages, sweep):
+            articles = self._expand_address_groups(cortar_no, articles, sweep)
+            fingerprints, changed_count = self._remember_list_rows(cortar_no, articles)
+            sweep['rows_seen'] += len(articles)
+            sweep['rows_changed'] += changed_count
+            articles = self.apply_list_prefilter(articles, page, cortar_no)
+            if self.smart_refresh:
+                articles = self._select_due_for_refresh(articles, fingerprints, cortar_no, page)
+            page_articles = [str(article['articleNo']) for article in articles]
             
-            articles = response['articleList']
-            if not articles:
-                print(f"✅ No more articles on page {page}")
-                break
-            
-            page_articles = []
-            for article in articles:
-                article_no = article.get('articleNo')
-                if article_no:
-                    page_articles.append(str(article_no))
+            logger.info("📄 페이지 %d: %d개 매물 발견", page, len(page_articles))
             
             if not page_articles:
-                break
-            
-            print(f"📄 페이지 {page}: {len(page_articles)}개 매물 발견")
+                self.progress.advance(cortar_no, len(fingerprints))
+                continue
             
             # 병렬 처리로 상세정보 수집 및 저장
             articles_to_process = page_articles[:max_articles - total_processed] if max_articles else page_articles
@@ -156,107 +216,387 @@ class CollectionService:
             if not self.collection_stats['start_time']:
                 self.collection_stats['start_time'] = time.time()
             
-            page_successful = self._collect_articles_parallel(articles_to_process, total_processed + 1, max_articles)
+            page_successful = self._collect_articles_parallel(
+                articles_to_process, total_processed + 1, max_articles,
+                cortar_no=cortar_no, fingerprints=fingerprints
+            )
             
             successful_collections += page_successful
             total_processed += len(articles_to_process)
             
-            # 진행률 및 ETA 출력
-            self._print_progress_with_eta(total_processed, successful_collections, max_articles)
+            # 진행률 및 실행 전체 ETA
+            self.progress.advance(cortar_no, len(fingerprints))
+            self.progress.emit()
             
             if max_articles and total_processed >= max_articles:
                 break
+        
+        sweep['detail_requests'] = total_processed
+        self._record_sweep(cortar_no, 'full', sweep)
+        self.progress.finish_area(cortar_no)
+        return self._build_area_result(cortar_no, total_processed, successful_collections, sweep)
+    
+    def discover_and_save_area(self, cortar_no: str, max_pages: int = None, max_articles: int = None) -> Dict[str, Any]:
+        """최신순 목록을 훑어 신규/변경 매물만 수집, 페이지 전체가 이미 아는 매물이면 조기 종료"""
+        logger.info("🆕 지역 %s 신규 매물 탐색 시작", cortar_no)
+        
+        max_pages = max_pages or settings.discovery_settings['max_pages']
+        successful_collections = 0
+        total_processed = 0
+        sweep = self._new_sweep_counters()
+        self.progress.start_area(cortar_no, 'discovery')
+        pages_checked = 0
+        page = 1
+        
+        while page <= max_pages:
+            articles = self.fetch_list_page(cortar_no, page, settings.discovery_settings['order'])
+            sweep['list_requests'] += 1
+            if articles is None:
+                break
+            pages_checked += 1
+            articles = self._expand_address_groups(cortar_no, articles, sweep)
+            
+            fingerprints = {str(article['articleNo']): compute_list_fingerprint(article) for article in articles}
+            known = self.listing_state.get_fingerprints(fingerprints.keys())
+            changed = {article_no for article_no, fingerprint in fingerprints.items() if known.get(article_no) != fingerprint}
+            sweep['rows_seen'] += len(articles)
+            sweep['rows_changed'] += len(changed)
+            
+            if not changed:
+                logger.info("🛑 페이지 %d: 모두 이미 수집된 변경 없는 매물, 탐색 종료", page)
+                self.progress.advance(cortar_no, len(articles))
+                break
+            
+            # 신규/변경 행 중 필터로 제외된 행은 상세 요청 없이 '확인됨'으로 기록
+            candidates = [article for article in articles if str(article['articleNo']) in changed]
+            accepted = self.apply_list_prefilter(candidates, page, cortar_no)
+            accepted_nos = {str(article['articleNo']) for article in accepted}
+            self.listing_state.mark_seen_many(
+                cortar_no, {article_no: fingerprints[article_no] for article_no in changed - accepted_nos})
+            
+            page_articles = [str(article['articleNo']) for article in accepted]
+            logger.info("📄 페이지 %d: %d개 중 신규/변경 %d개", page, len(articles), len(page_articles))
+            
+            if page_articles:
+                articles_to_process = page_articles[:max_articles - total_processed] if max_articles else page_articles
+                
+                if not self.collection_stats['start_time']:
+                    self.collection_stats['start_time'] = time.time()
                 
+                successful_collections += self._collect_articles_parallel(
+                    articles_to_process, total_processed + 1, max_articles,
+                    cortar_no=cortar_no, fingerprints=fingerprints
+                )
+                total_processed += len(articles_to_process)
+            
+            self.progress.advance(cortar_no, len(articles))
+            self.progress.emit()
+            if max_articles and total_processed >= max_articles:
+                break
+            
+            page += 1
+        
+        logger.info("📊 지역 %s 탐색 완료: 목록 %d페이지 확인, 신규/변경 %d개", cortar_no, pages_checked, total_processed)
+        sweep['detail_requests'] = total_processed
+        self._record_sweep(cortar_no, 'discovery', sweep)
+        self.progress.finish_area(cortar_no)
+        return self._build_area_result(cortar_no, total_processed, successful_collections, sweep)
+    
+    def refresh_known_articles(self, cortar_no: str, article_nos: List[str]) -> int:
+        """이미 저장한 매물의 상세정보만 다시 수집 (목록 요청 없음), 성공한 개수 반환"""
+        logger.info("🔄 지역 %s 저장 매물 %d개 재수집", cortar_no, len(article_nos), extra={'area': cortar_no})
+        if not self.collection_stats['start_time']:
+            self.collection_stats['start_time'] = time.time()
+        
+        # 저장된 fingerprint를 그대로 넘겨 성공한 매물의 마지막 저장 시각 갱신
+        fingerprints = self.listing_state.get_fingerprints(article_nos)
+        successful = self._collect_articles_parallel(article_nos, 1, None, cortar_no=cortar_no, fingerprints=fingerprints)
+        self.areas_collected.append(cortar_no)
+        logger.info("📊 지역 %s 재수집 완료: %d/%d개", cortar_no, successful, len(article_nos), extra={'area': cortar_no})
+        return successful
+    
+    def _iter_list_pages(self, cortar_no: str, order: str, max_pages: Optional[int],
+                         sweep: Dict[str, Any]) -> Iterator[Tuple[int, List[Dict]]]:
+        """
+        목록 페이지를 (페이지 번호, 목록 행)으로 차례대로 반환 (필요한 만큼만 조회)
+        분할 조회(구간/타일)가 켜져 있고 1페이지의 지역 총량이 크면 나머지는 분할 병렬 조회 결과를 페이지 크기로 나눠 반환
+        max_pages: 목록 요청 수 상한 (분할 조회 요청 포함)
+        """
+        articles = self.fetch_list_page(cortar_no, 1, order)
+        sweep['list_requests'] += 1
+        list_requests = 1
+        if articles is None:
+            return
+        yield 1, articles
+        
+        page = 2
+        seen: set = set()
+        total = self.progress.area_totals.get(cortar_no)  # 1페이지 응답의 지역 총량
+        rows_per_page = settings.scheduler_settings['rows_per_page']
+        partitioned = self._fetch_partitioned_rows(cortar_no, order, articles, total, max_pages) if total else None
+        if partitioned:
+            result, config = partitioned
+            sweep['list_requests'] += result['list_requests']
+            list_requests += result['list_requests']
+            seen = result['seen']
+            for start in range(0, len(result['rows']), rows_per_page):
+                if max_pages and page > max_pages:
+                    return
+                yield page, result['rows'][start:start + rows_per_page]
+                page += 1
+            
+            # 구간 분할은 구간 합계가 지역 총량과 같아야 완료, 타일은 지역 범위 밖 매물이 있을 수 있어 비율로 판단
+            if 'complete' in result:
+                complete = result['complete'] and len(seen) >= total
+            else:
+                complete = len(seen) >= total * config['min_coverage']
+            if complete or (max_pages and list_requests >= max_pages):
+                return
+            # 분할 범위 밖 매물이 있으면 순차 조회로 보충 (이미 확인한 매물 제외)
+            logger.warning("⚠️ 지역 %s 분할 조회 %d/%d개, 나머지는 순차 조회", cortar_no, len(seen), total,
+                           extra={'area': cortar_no})
+        
+        list_page = 2
+        while not max_pages or list_requests < max_pages:
+            articles = self.fetch_list_page(cortar_no, list_page, order)
+            sweep['list_requests'] += 1
+            list_requests += 1
+            if articles is None:
+                return
+            list_page += 1
+            if seen:
+                articles = [article for article in articles if str(article['articleNo']) not in seen]
+                if not articles:
+                    continue
+                seen.update(str(article['articleNo']) for article in articles)
+            yield page, articles
             page += 1
+    
+    def _expand_address_groups(self, cortar_no: str, articles: List[Dict], sweep: Dict[str, Any]) -> List[Dict]:
+        """동일주소 묶음 조회시 구성원 확인이 필요한 묶음의 구성원 행을 페이지에 추가"""
+        if not self.address_groups:
+            return articles
+        result = self.address_groups.expand(cortar_no, articles, self._get_list_filters())
+        sweep['list_requests'] += result['list_requests']
+        self._count('group_members_skipped', result['members_skipped'])
+        return articles + result['rows']
+    
+    def _fetch_partitioned_rows(self, cortar_no: str, order: str, first_page: List[Dict], total: int,
+                                max_pages: Optional[int]) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        면적/가격 구간 또는 위경도 타일 분할 조회 (결과, 설정), 켜져 있지 않거나 지역이 작으면 None
+        max_pages가 있으면 분할 조회 요청 합계를 1페이지 포함 max_pages회로 제한
+        """
+        rows_per_page = settings.scheduler_settings['rows_per_page']
+        seen = {str(article['articleNo']) for article in first_page}
+        filters = self._get_list_filters()
+        max_requests = max_pages - 1 if max_pages else None  # 1페이지 요청은 이미 사용
+        
+        config = settings.band_settings
+        if self.banded_listing and total > config['min_pages'] * rows_per_page \
+                and (not max_pages or max_pages > config['min_pages']):
+            partitioner = BandPartitioner(self.api_client, self.listing_state)
+            return partitioner.fetch(cortar_no, order, filters, seen, total, max_requests), config
+        
+        config = settings.tiling_settings
+        bounds = get_area_bounds(cortar_no)
+        if self.tiled_listing and bounds and total > config['min_pages'] * rows_per_page \
+                and (not max_pages or max_pages > config['min_pages']):
+            return TiledListFetcher(self.api_client).fetch(cortar_no, bounds, order, filters, seen, max_requests), config
+        return None
+    
+    def fetch_list_page(self, cortar_no: str, page: int, order: str = 'rank') -> Optional[List[Dict]]:
+        """목록 한 페이지 조회, 더 이상 매물이 없으면 None"""
+        logger.debug("🔍 수집 중: 지역 %s, 페이지 %d", cortar_no, page)
+        
+        response = self.api_client.get_area_articles(cortar_no, page, filters=self._get_list_filters(), order=order)  # 설정된 매물 유형만 (기본: 사무실)
+        if not response or 'articleList' not in response:
+            logger.info("❌ No more articles found for area %s", cortar_no)
+            return None
+        
+        if page == 1:
+            self.progress.set_area_total(cortar_no, list_total_count(response))
         
+        articles = [article for article in response['articleList'] if article.get('articleNo')]
+        if not articles:
+            logger.info("✅ No more articles on page %d", page)
+            return None
+        
+        return articles
+    
+    def apply_list_prefilter(self, articles: List[Dict], page: int, cortar_no: str = None) -> List[Dict]:
+        """목록 단계 사전 필터: 조건 밖의 매물은 상세 요청 전에 제외"""
+        if not self.list_prefilter:
+            return articles
+        
+        accepted = self.list_prefilter.filter_rows(articles)
+        avoided = len(articles) - len(accepted)
+        self._count('detail_requests_avoided', avoided)
+        ARTICLES.inc(cortar_no, 'skipped_prefilter', amount=avoided)
+        if avoided:
+            logger.info("🧹 페이지 %d: 목록 필터로 %d개 매물 상세 요청 생략", page, avoided)
+        return accepted
+    
+    def _remember_list_rows(self, cortar_no: str, articles: List[Dict]) -> Tuple[Dict[str, str], int]:
+        """목록 행 fingerprint 계산 및 신규/변경 행 수 반환, 필터로 제외될 행은 바로 '확인됨'으로 기록"""
+        fingerprints = {str(article['articleNo']): compute_list_fingerprint(article) for article in articles}
+        known = self.listing_state.get_fingerprints(fingerprints.keys())
+        changed_count = sum(1 for article_no, fingerprint in fingerprints.items() if known.get(article_no) != fingerprint)
+        if self.list_prefilter:
+            rejected = [str(article['articleNo']) for article in articles
+                        if self.list_prefilter.get_rejection_reason(article)]
+            self.listing_state.mark_seen_many(cortar_no, {article_no: fingerprints[article_no] for article_no in rejected})
+        return fingerprints, changed_count
+    
+    def _select_due_for_refresh(self, articles: List[Dict], fingerprints: Dict[str, str],
+                                cortar_no: str, page: int) -> List[Dict]:
+        """신규/목록 변경 매물과 TTL이 지난 매물만 남김 (나머지는 '확인됨'으로만 기록)"""
+        now = time.time()
+        states = self.listing_state.get_refresh_states(fingerprints.keys())
+        
+        due = []
+        not_due = {}
+        for article in articles:
+            article_no = str(article['articleNo'])
+            state = states.get(article_no)
+            if (not state or state['fingerprint'] != fingerprints[article_no]
+                    or not state['next_refresh_at'] or state['next_refresh_at'] <= now):
+                due.append(article)
+            else:
+                not_due[article_no] = fingerprints[article_no]
+        self.listing_state.mark_seen_many(cortar_no, not_due)
+        
+        skipped = len(articles) - len(due)
+        self._count('refresh_skipped', skipped)
+        ARTICLES.inc(cortar_no, 'skipped_refresh', amount=skipped)
+        if skipped:
+            logger.info("⏭️ 페이지 %d: 재수집 주기 전 매물 %d개 상세 요청 생략", page, skipped)
+        return due
+    
+    def _schedule_next_refresh(self, article_no: str, article: ArticleRecord):
+        """저장 결과의 변경 여부로 매물 변경 이력을 갱신하고 다음 재수집 시각 계산"""
+        try:
+            now = time.time()
+            listing = self.listing_state.get_listing(article_no) or {}
+            changed = article.change_detected
+            
+            change_count = (listing.get('change_count') or 0) + (1 if changed else 0)
+            last_changed_at = now if changed else listing.get('last_changed_at')
+            expose_start_at = parse_expose_start(article.expose_start_date) or listing.get('expose_start_at')
+            
+            next_refresh_at = compute_next_refresh(
+                now=now,
+                first_seen_at=listing.get('first_seen_at'),
+                last_changed_at=last_changed_at,
+                change_count=change_count,
+                expose_start_at=expose_start_at
+            )
+            self.listing_state.set_refresh_schedule(article_no, last_changed_at, change_count, expose_start_at, next_refresh_at)
+        except Exception as e:
+            logger.warning("⚠️ 재수집 주기 계산 실패 (%s): %s", article_no, e)
+    
+    def _new_sweep_counters(self) -> Dict[str, Any]:
+        return {
+            'started_at': time.time(),
+            'rows_seen': 0,
+            'rows_changed': 0,
+            'list_requests': 0,
+            'detail_requests': 0
+        }
+    
+    def _record_sweep(self, cortar_no: str, mode: str, sweep: Dict[str, Any]):
+        """지역 수집 결과를 상태 저장소에 기록 (스케줄러 변경률 추정용)"""
+        self._count('articles_seen', sweep['rows_seen'])
+        self.areas_collected.append(cortar_no)
+        try:
+            self.listing_state.record_area_sweep(
+                cortar_no, mode, sweep['started_at'], sweep['rows_seen'], sweep['rows_changed'],
+                sweep['list_requests'], sweep['detail_requests']
+            )
+        except Exception as e:
+            logger.warning("⚠️ 지역 수집 기록 실패: %s", e)
+    
+    def _build_area_result(self, cortar_no: str, total_processed: int, successful_collections: int,
+                           sweep: Dict[str, Any] = None) -> Dict[str, Any]:
         return {
             'area_code': cortar_no,
             'total_found': total_processed,
             'successful_collections': successful_collections,
             'success_rate': f"{(successful_collections / total_processed * 100):.2f}%" if total_processed else "0%",
+            'sweep_stats': sweep or {},
             'api_stats': self.api_client.get_request_stats(),
             'parsing_stats': self.parser.get_parsing_stats(),
             'save_stats': self.repository.get_save_stats()
         }
     
-    def _enrich_with_address_data(self, parsed_data: Dict):
-        article_detail = parsed_data.get('sections', {}).get('articleDetail', {})
-        latitude = article_detail.get('latitude')
-        longitude = article_detail.get('longitude')
+    def _get_list_filters(self) -> Optional[Dict]:
+        """목록 쿼리에 적용할 필터 파라미터 (사전 필터/동일주소 묶음 모두 꺼져 있으면 None)"""
+        filters = self.list_prefilter.build_query_params() if self.list_prefilter else {}
+        if self.address_groups:
+            filters['sameAddressGroup'] = True
+        return filters or None
+    
+    def _enrich_with_address_data(self, article: ArticleRecord):
+        latitude = article.latitude
+        longitude = article.longitude
         
         if latitude and longitude:
             try:
                 address_info = self.address_service.convert_coordinates_to_address(latitude, longitude)
                 if address_info:
-                    if 'address_info' not in article_detail:
-                        article_detail['address_info'] = {}
-                    article_detail['address_info'].update(address_info)
-                    print(f"✅ 주소 정보 추가됨: {address_info.get('primary_address', 'N/A')}")
+                    if article.address_info is None:
+                        article.address_info = {}
+                    article.address_info.update(address_info)
+                    logger.debug("✅ 주소 정보 추가됨: %s", address_info.get('primary_address', 'N/A'))
             except Exception as e:
-                print(f"⚠️ 주소 변환 실패: {e}")
+                logger.warning("⚠️ 주소 변환 실패: %s", e)
     
-    def _validate_and_set_active_status(self, parsed_data: Dict, quiet: bool = False):
-        """매물 데이터 검증 후 is_active 상태 설정"""
+    def _validate_and_set_active_status(self, article: ArticleRecord, quiet: bool = False):
+        """매물 데이터 검증 후 is_active 상태 설정 (매물 유형별 규칙, 가격이 없으면 0원으로 보고 하한에서 제외)"""
         if not settings.validation_rules['validation_enabled']:
             if not quiet:
-                print("🔧 매물 검증 비활성화됨")
+                logger.debug("🔧 매물 검증 비활성화됨")
             return
         
-        is_active = True
+        rules = rules_for_type(article.real_estate_type_code)
         rejection_reasons = []
         
-        # articleDetail, articlePrice 섹션 가져오기
-        sections = parsed_data.get('sections', {})
-        article_detail = sections.get('articleDetail', {})
-        article_price = sections.get('articlePrice', {})
+        # 1. 거래유형 검증 (매매/전세/단기임대 제외)
+        if article.trade_type_code in rules['excluded_trade_types']:
+            rejection_reasons.append(f"제외된 거래유형: {article.trade_type_code}")
         
-        # 1. 거래유형 검증 (전세/매매/단기임대 제외)
-        trade_type = article_detail.get('tradeTypeCd')
-        if trade_type in settings.validation_rules['excluded_trade_types']:
-            is_active = False
-            rejection_reasons.append(f"제외된 거래유형: {trade_type}")
-        
-        # 2. 보증금 검증
-        deposit = article_price.get('dealOrWarrantPrc', 0)
-        if isinstance(deposit, str):
-            deposit = int(deposit) if deposit.isdigit() else 0
-        
-        deposit_limits = settings.validation_rules['deposit_limits']
+        # 2. 보증금 검증 (매매는 매매가, 상세 API 가격은 만원 단위 -> 원 단위 기준과 비교)
+        deposit = article.warrant_price if article.warrant_price is not None else article.deal_price
+        deposit = (deposit or 0) * PRICE_UNIT
+        deposit_limits = rules['deposit_limits']
         if deposit < deposit_limits['min'] or deposit > deposit_limits['max']:
-            is_active = False
             rejection_reasons.append(f"보증금 범위 벗어남: {deposit:,}원")
         
-        # 3. 월세 검증
-        rent = article_price.get('rentPrc', 0)
-        if isinstance(rent, str):
-            rent = int(rent) if rent.isdigit() else 0
-        
-        rent_limits = settings.validation_rules['monthly_rent_limits']
+        # 3. 월세 검증 (만원 단위)
+        rent = (article.rent_price or 0) * PRICE_UNIT
+        rent_limits = rules['monthly_rent_limits']
         if rent < rent_limits['min'] or rent > rent_limits['max']:
-            is_active = False
             rejection_reasons.append(f"월세 범위 벗어남: {rent:,}원")
         
-        # 4. 엘리베이터 검증
-        if settings.validation_rules['elevator_required']:
-            elevator_count = article_detail.get('elevatorNum')
-            if elevator_count is None or elevator_count == 0:
-                is_active = False
+        # 4. 엘리베이터 검증 (시설 정보가 없으면 건축물대장 승강기 수)
+        if rules['elevator_required']:
+            elevator_count = article.elevator_count or article.total_elevator_count
+            if not elevator_count:
                 rejection_reasons.append("엘리베이터 없음")
         
         # is_active 설정
-        if 'metadata' not in parsed_data:
-            parsed_data['metadata'] = {}
-        parsed_data['metadata']['is_active'] = is_active
+        article.is_active = not rejection_reasons
         
         # 로그 출력
-        if not quiet:
-            if not is_active:
-                print(f"⚠️ 매물 비활성화: {', '.join(rejection_reasons)}")
-            else:
-                print(f"✅ 매물 검증 통과")
+        if rejection_reasons:
+            logger.info("⚠️ 매물 비활성화: %s", ', '.join(rejection_reasons),
+                        extra={'article_no': article.article_no, 'sampled': quiet})
+        elif not quiet:
+            logger.debug("✅ 매물 검증 통과")
     
-    def _collect_articles_parallel(self, article_nos: List[str], start_idx: int, max_articles: Optional[int]) -> int:
-        """병렬로 매물들을 수집하여 성공한 개수 반환"""
+    def _collect_articles_parallel(self, article_nos: List[str], start_idx: int, max_articles: Optional[int],
+                                   cortar_no: str = None, fingerprints: Optional[Dict[str, str]] = None) -> int:
+        """병렬로 매물들을 수집하여 성공한 개수 반환 (성공한 매물은 목록 fingerprint 기록)"""
         max_workers = settings.collection_settings['parallel_workers']
         successful_count = 0
         
@@ -265,18 +605,20 @@ class CollectionService:
         
         for i in range(0, len(article_nos), batch_size):
             batch_articles = article_nos[i:i + batch_size]
-            batch_successful = self._process_batch(batch_articles, max_workers)
+            batch_successful = self._process_batch(batch_articles, max_workers, cortar_no, fingerprints)
             successful_count += batch_successful
             
             # 배치 간 짧은 휴식 (연결 풀 안정화)
             if i + batch_size < len(article_nos):
-                time.sleep(1)
+                time.sleep(settings.collection_settings['batch_pause'])
         
         return successful_count
     
-    def _process_batch(self, article_nos: List[str], max_workers: int) -> int:
+    def _process_batch(self, article_nos: List[str], max_workers: int,
+                       cortar_no: str = None, fingerprints: Optional[Dict[str, str]] = None) -> int:
         """단일 배치를 병렬 처리"""
         successful_count = 0
+        saved_fingerprints = {}  # 배치가 끝나면 한 번에 '저장됨'으로 기록
         
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # 병렬 작업 제출
@@ -284,63 +626,47 @@ class CollectionService:
                 executor.submit(self.collect_single_article, article_no, quiet=True): article_no 
                 for article_no in article_nos
             }
+            DETAIL_QUEUE_DEPTH.inc(amount=len(future_to_article))
             
             # 완료된 작업들 처리
             for future in as_completed(future_to_article):
                 article_no = future_to_article[future]
+                DETAIL_QUEUE_DEPTH.dec()
                 try:
                     success = future.result()
+                    ARTICLES.inc(cortar_no, 'saved' if success else 'failed')
                     if success:
                         successful_count += 1
-                        print(f"✅ {article_no} 완료")
+                        if fingerprints and article_no in fingerprints:
+                            saved_fingerprints[article_no] = fingerprints[article_no]
+                        logger.info("✅ %s 완료", article_no,
+                                    extra={'article_no': article_no, 'area': cortar_no, 'sampled': True})
                     else:
-                        print(f"❌ {article_no} 실패")
+                        logger.warning("❌ %s 실패", article_no, extra={'article_no': article_no, 'area': cortar_no})
                 except Exception as e:
                     # 연결 풀 에러 특별 처리
                     if "Resource temporarily unavailable" in str(e) or "Errno 35" in str(e):
-                        print(f"⚠️ {article_no} 연결풀 에러: 재시도 권장")
+                        logger.warning("⚠️ %s 연결풀 에러: 재시도 권장", article_no, extra={'article_no': article_no})
                     else:
-                        print(f"❌ {article_no} 예외: {e}")
+                        logger.error("❌ %s 예외: %s", article_no, e, extra={'article_no': article_no})
         
+        self.listing_state.mark_seen_many(cortar_no, saved_fingerprints, saved=True)
         return successful_count
     
-    def _print_progress_with_eta(self, processed: int, successful: int, total: Optional[int]):
-        """진행률과 예상 완료 시간 출력"""
-        if not self.collection_stats['start_time']:
-            return
-        
-        elapsed_time = time.time() - self.collection_stats['start_time']
-        
-        print(f"\n📈 진행 현황:")
-        print(f"   처리완료: {processed}개")
-        print(f"   성공: {successful}개")
-        print(f"   성공률: {(successful/processed*100):.1f}%" if processed > 0 else "0%")
-        print(f"   경과시간: {elapsed_time/60:.1f}분")
-        
-        # ETA 계산
-        if total and processed > 0:
-            remaining = total - processed
-            avg_time_per_item = elapsed_time / processed
-            eta_seconds = remaining * avg_time_per_item
-            eta_minutes = eta_seconds / 60
-            
-            print(f"   남은 매물: {remaining}개")
-            print(f"   예상 완료: {eta_minutes:.1f}분 후")
-            
-            # 완료 예정 시각
-            completion_time = datetime.fromtimestamp(time.time() + eta_seconds)
-            print(f"   완료 예정: {completion_time.strftime('%H:%M')}")
-            
-        print("=" * 50)
-    
     def get_comprehensive_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            collection_stats = dict(self.collection_stats, saved_by_type=dict(self.collection_stats['saved_by_type']))
         stats = {
-            'collection_stats': self.collection_stats,
+            'collection_stats': collection_stats,
             'api_stats': self.api_client.get_request_stats(),
             'parsing_stats': self.parser.get_parsing_stats(),
-            'save_stats': self.repository.get_save_stats()
+            'save_stats': self.repository.get_save_stats(),
+            'stage_timings': stage_spans.get_stats()
         }
         
+        if self.list_prefilter:
+            stats['prefilter_stats'] = self.list_prefilter.get_stats()
+        
         if self.address_enabled:
             stats['address_stats'] = self.address_service.get_usage_stats()
         
@@ -362,13 +688,31 @@ class CollectionService:
         if collection['total_processed'] > 0:
             success_rate = (collection['successful_collections'] / collection['total_processed']) * 100
             print(f"성공률: {success_rate:.2f}%")
+        if len(settings.collection_settings['real_estate_types']) > 1:
+            type_names = settings.real_estate_type_settings
+            print("유형별 저장: " + ', '.join(f"{type_names.get(code, {}).get('name', code)} {count}개"
+                                            for code, count in sorted(collection['saved_by_type'].items())))
         
         api = stats['api_stats']
         print(f"\nAPI 호출: {api['total_requests']}회")
         
+        if 'prefilter_stats' in stats:
+            print(f"목록 필터로 생략된 상세 요청: {collection['detail_requests_avoided']}회")
+        if self.smart_refresh:
+            print(f"재수집 주기 전이라 생략된 상세 요청: {collection['refresh_skipped']}회")
+        if self.address_groups:
+            print(f"동일주소 묶음 구성원 확인을 미룬 매물: {collection['group_members_skipped']}개")
+        
         if self.address_enabled and 'address_stats' in stats:
             addr = stats['address_stats']
             print(f"\n주소 변환: {addr['total_requests']}회")
-            print(f"캐시 히트: {addr['cache_hits']}개")
+            print(f"캐시 히트: {addr['cache_hits']}개 ({addr['cache_hit_rate']})")
+        
+        if stats['stage_timings']:
+            print(f"\n⏱️ 단계별 시간 (ms, 자체 시간은 하위 단계 제외):")
+            print(f"   {'단계':<24}{'횟수':>7}{'평균':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'자체(초)':>10}")
+            for stage, timing in stats['stage_timings'].items():
+                print(f"   {stage:<24}{timing['count']:>7}{timing['mean_ms']:>9.1f}{timing['p50_ms']:>9.1f}"
+                      f"{timing['p95_ms']:>9.1f}{timing['p99_ms']:>9.1f}{timing['self_seconds']:>10.1f}")
         
         print("="*50)
\ No newline at end of file
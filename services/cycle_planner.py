@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+마감 시각/요청 예산 안에서 수집 사이클 계획 - main.py --deadline / --request-budget
+  - 작업 단위: 지역 신규 매물 탐색 (AreaScheduler의 기대 변경 건수/예상 요청 수)
+               + 재수집 시각이 지난 저장 매물의 상세 재수집 (매물당 요청 1회)
+  - 가치: 신규/변경 매물 기대 건수 x new_listing_value, 재수집은 마지막 저장 이후 변경 확률, 모두 우선순위 가중치 곱
+  - 요청당 가치가 큰 순서로 남은 요청 수(예산과 마감까지 시간 중 작은 쪽)를 채우고 나머지는 다음 사이클로 미룸
+  - 실행 중에도 단위마다 실제 경과 시간/요청 수로 남은 용량을 다시 계산해 넘칠 작업은 미룸
+"""
+
+import logging
+import math
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from config.settings import settings
+from services.area_scheduler import AreaScheduler
+
+logger = logging.getLogger(__name__)
+
+# 이번 실행 관측값으로 요청당 소요 시간을 바꾸기 전 필요한 최소 요청 수
+MIN_OBSERVED_REQUESTS = 20
+
+
+def parse_deadline(value: str, now: float = None) -> float:
+    """'3600'(지금부터 초) 또는 'HH:MM'(오늘, 지났으면 내일) -> epoch"""
+    now = now or time.time()
+    if ':' not in value:
+        return now + float(value)
+    hour, minute = (int(part) for part in value.split(':', 1))
+    base = datetime.fromtimestamp(now)
+    target = base.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if target.timestamp() <= now:
+        target += timedelta(days=1)
+    return target.timestamp()
+
+
+class CyclePlanner:
+    def __init__(self, service, areas: List[Dict], deadline: float = None, request_budget: int = None, ledger=None):
+        """
+        service: CollectionService
+        areas: [{'name': ..., 'code': ..., 'priority': ...}]
+        deadline: 사이클 종료 시각 (epoch), request_budget: 이번 사이클 최대 API 요청 수
+        ledger: 요청당 소요 시간 추정용 RunLedger (없으면 기본 경로)
+        """
+        self.service = service
+        self.areas = areas
+        self.deadline = deadline
+        self.request_budget = request_budget
+        self.config = settings.budget_settings
+        self.scheduler = AreaScheduler(service, areas)
+        self.started_at = time.time()
+        self.requests_at_start = service.api_client.request_count
+        self.prior_seconds_per_request = self._estimate_seconds_per_request(ledger)
+
+    def _estimate_seconds_per_request(self, ledger=None) -> float:
+        """
+        최근 완료된 실행들의 (소요 시간 / API 요청 수) 중앙값, 기록이 없으면 요청 간격과 워커 수로 계산
+        요청 간격 설정이 바뀌었을 수 있으므로 현재 설정의 최소값(평균 간격 / 워커 수)보다 작게 잡지 않음
+        """
+        collection = settings.collection_settings
+        workers = max(collection['parallel_workers'], 1)
+        delay = (collection['request_delay_min'] + collection['request_delay_max']) / 2
+        try:
+            if ledger is None:
+                from database.run_ledger import RunLedger
+                ledger = RunLedger()
+            samples = [run['duration'] / run['api_calls'] for run in ledger.recent_runs(self.config['ledger_runs'])
+                       if run['status'] == 'completed' and run['api_calls']]
+            if samples:
+                return max(statistics.median(samples), delay / workers)
+        except Exception as e:
+            logger.warning("⚠️ 실행 기록 조회 실패, 요청 간격으로 추정: %s", e)
+        return (delay + self.config['request_latency']) / workers
+
+    def requests_used(self) -> int:
+        return self.service.api_client.request_count - self.requests_at_start
+
+    def seconds_per_request(self) -> float:
+        """이번 실행에서 충분히 요청했으면 관측값, 아니면 실행 기록 추정값"""
+        used = self.requests_used()
+        if used >= MIN_OBSERVED_REQUESTS:
+            return (time.time() - self.started_at) / used
+        return self.prior_seconds_per_request
+
+    def remaining_requests(self) -> Optional[float]:
+        """남은 요청 수 용량 (요청 예산과 마감까지 남은 시간 중 작은 쪽), 제한이 없으면 None"""
+        limits = []
+        if self.request_budget is not None:
+            limits.append(self.request_budget - self.requests_used())
+        if self.deadline is not None:
+            seconds_left = (self.deadline - time.time()) * self.config['safety_margin']
+            limits.append(seconds_left / self.seconds_per_request())
+        return max(min(limits), 0.0) if limits else None
+
+    def _discovery_units(self, now: float) -> List[Dict[str, Any]]:
+        units = []
+        for area in self.areas:
+            entry = self.scheduler.score(area, now)
+            requests = self.scheduler.estimate_requests(area, entry['expected_changes'])
+            units.append({
+                'kind': 'discover',
+                'area': area,
+                'requests': requests,
+                'list_requests': requests - entry['expected_changes'],
+                'value': self.config['new_listing_value'] * self.scheduler._priority_weight(area) * entry['expected_changes']
+            })
+        return units
+
+    def _refresh_items(self, now: float) -> List[Dict[str, Any]]:
+        """재수집 시각이 지난 매물별 가치 = 우선순위 가중치 x 마지막 저장 이후 변경 확률"""
+        refresh = settings.refresh_settings
+        areas_by_code = {area['code']: area for area in self.areas}
+        candidates = self.service.listing_state.get_refresh_candidates(
+            areas_by_code.keys(), now, refresh['max_ttl'], self.config['refresh_candidate_limit'])
+
+        items = []
+        for candidate in candidates:
+            # TTL은 변경 확률이 change_probability가 되는 시간 -> 경과 시간에 따라 1 - (1-p)^(경과/TTL)
+            ttl = max(candidate['due_at'] - candidate['last_saved_at'], 1.0)
+            elapsed = max(now - candidate['last_saved_at'], ttl)
+            probability = 1 - (1 - refresh['change_probability']) ** (elapsed / ttl)
+            area = areas_by_code[candidate['cortar_no']]
+            items.append({
+                'kind': 'refresh',
+                'area': area,
+                'article_no': candidate['article_no'],
+                'requests': 1,
+                'value': self.scheduler._priority_weight(area) * probability
+            })
+        return items
+
+    def plan(self) -> Dict[str, Any]:
+        """요청당 가치 순으로 용량을 채운 작업 단위 (재수집은 지역별로 묶음)와 미룬 작업"""
+        now = time.time()
+        capacity = self.remaining_requests()
+        items = self._discovery_units(now) + self._refresh_items(now)
+        items.sort(key=lambda item: item['value'] / item['requests'] if item['requests'] else 0.0, reverse=True)
+
+        selected, deferred = [], []
+        remaining = capacity
+        for item in items:
+            if remaining is None or item['requests'] <= remaining:
+                selected.append(item)
+                if remaining is not None:
+                    remaining -= item['requests']
+            else:
+                deferred.append(item)
+
+        return {
+            'capacity': capacity,
+            'units': self._group_refresh(selected),
+            'deferred': deferred,
+            'seconds_per_request': self.seconds_per_request()
+        }
+
+    def _group_refresh(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """같은 지역 재수집 매물을 하나의 단위로 묶고 요청당 가치 순으로 정렬"""
+        units = []
+        refresh_units: Dict[str, Dict[str, Any]] = {}
+        for item in items:
+            if item['kind'] != 'refresh':
+                units.append(item)
+                continue
+            unit = refresh_units.get(item['area']['code'])
+            if not unit:
+                unit = {'kind': 'refresh', 'area': item['area'], 'article_nos': [], 'requests': 0, 'value': 0.0}
+                refresh_units[item['area']['code']] = unit
+                units.append(unit)
+            unit['article_nos'].append(item['article_no'])
+            unit['requests'] += 1
+            unit['value'] += item['value']
+        units.sort(key=lambda unit: unit['value'] / unit['requests'] if unit['requests'] else 0.0, reverse=True)
+        return units
+
+    def print_plan(self, plan: Dict[str, Any]):
+        capacity = plan['capacity']
+        limits = []
+        if self.deadline is not None:
+            limits.append(f"마감 {datetime.fromtimestamp(self.deadline).strftime('%H:%M:%S')}")
+        if self.request_budget is not None:
+            limits.append(f"요청 예산 {self.request_budget}회")
+        print(f"\n🧮 사이클 계획 ({', '.join(limits)}): 가용 요청 "
+              f"{'무제한' if capacity is None else f'{capacity:.0f}회'}, 요청당 {plan['seconds_per_request']:.2f}초")
+        for unit in plan['units']:
+            label = '신규 탐색' if unit['kind'] == 'discover' else f"재수집 {len(unit['article_nos'])}건"
+            print(f"   {unit['area']['name']} ({unit['area'].get('priority', 0)}점) {label}: "
+                  f"예상 요청 {unit['requests']:.0f}회, 가치 {unit['value']:.2f}")
+        if plan['deferred']:
+            deferred_refresh = sum(1 for item in plan['deferred'] if item['kind'] == 'refresh')
+            deferred_areas = [item['area']['name'] for item in plan['deferred'] if item['kind'] == 'discover']
+            print(f"   ⏭️ 다음 사이클로 미룸: 신규 탐색 {len(deferred_areas)}개 지역"
+                  f"{' (' + ', '.join(deferred_areas) + ')' if deferred_areas else ''}, 재수집 {deferred_refresh}건 "
+                  f"(가치 {sum(item['value'] for item in plan['deferred']):.2f})")
+        print("=" * 50)
+
+    def run(self, max_pages: int = None) -> Dict[str, Any]:
+        """계획을 세우고 요청당 가치 순으로 실행, 실행 직전 남은 용량을 넘는 작업은 미룸"""
+        plan = self.plan()
+        self.print_plan(plan)
+        self.service.progress.plan([unit['area']['code'] for unit in plan['units'] if unit['kind'] == 'discover'],
+                                   'discovery', max_pages)
+
+        done, deferred = 0, 0
+        for index, unit in enumerate(plan['units']):
+            capacity = self.remaining_requests()
+            # 뒤에 계획된 작업 몫은 남겨 두고, 신규 탐색이 예상보다 많이 찾으면 남는 용량까지만 상세 수집
+            reserved = sum(later['requests'] for later in plan['units'][index + 1:])
+            area = unit['area']
+            if unit['kind'] == 'discover':
+                if capacity is not None and capacity < unit['requests']:
+                    logger.info("⏭️ %s 신규 탐색 미룸 (예상 요청 %.0f회 > 남은 용량 %.0f회)",
+                                area['name'], unit['requests'], capacity, extra={'area': area['code']})
+                    deferred += 1
+                    continue
+                max_articles = None
+                if capacity is not None:
+                    planned_articles = math.ceil(unit['requests'] - unit['list_requests'])
+                    max_articles = max(int(capacity - reserved - unit['list_requests']), planned_articles, 1)
+                logger.info("🆕 %s 신규 탐색 (남은 용량 %s)", area['name'],
+                            '무제한' if capacity is None else f"{capacity:.0f}회", extra={'area': area['code']})
+                self.service.discover_and_save_area(area['code'], max_pages=max_pages, max_articles=max_articles)
+            else:
+                article_nos = unit['article_nos'] if capacity is None else unit['article_nos'][:int(capacity)]
+                if not article_nos:
+                    logger.info("⏭️ %s 재수집 %d건 미룸 (남은 용량 없음)", area['name'], len(unit['article_nos']),
+                                extra={'area': area['code']})
+                    deferred += 1
+                    continue
+                self.service.refresh_known_articles(area['code'], article_nos)
+            done += 1
+
+        elapsed = time.time() - self.started_at
+        summary = {
+            'units_done': done,
+            'units_deferred': deferred + len(self._group_refresh(plan['deferred'])),
+            'requests_used': self.requests_used(),
+            'elapsed_seconds': round(elapsed, 1),
+            'deadline_slack_seconds': round(self.deadline - time.time(), 1) if self.deadline is not None else None
+        }
+        logger.info("🧮 사이클 완료: 작업 %d개 수행, %d개 미룸, 요청 %d회, %.1f분",
+                    done, summary['units_deferred'], summary['requests_used'], elapsed / 60,
+                    extra={'event': 'cycle_finished', **summary})
+        return summary
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+위경도 타일 분할 목록 조회
+큰 지역(역삼동 등)은 cortarNo 한 개의 목록 페이지를 순서대로 따라가야 해서 페이지 응답 지연이 그대로 누적됨
+-> 지역 범위를 grid x grid 타일로 나눠 웹 지도 화면처럼 범위(bottomLat/leftLon/topLat/rightLon) 목록을 조회하고
+   타일별 페이지 체인을 병렬 워커(parallel_workers, 요청 간격은 워커마다 그대로 적용)로 동시에 따라감
+타일 경계에 걸친 매물은 여러 타일에 나올 수 있으므로 article_no로 중복 제거
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from config.settings import settings
+from services.request_budget import RequestBudget
+
+logger = logging.getLogger(__name__)
+
+Bounds = Tuple[float, float, float, float]  # (남, 서, 북, 동)
+
+
+def split_bounds(bounds: Bounds, grid: int) -> List[Bounds]:
+    """범위를 grid x grid 타일로 분할 (북서쪽부터 행 우선)"""
+    south, west, north, east = bounds
+    lat_step = (north - south) / grid
+    lon_step = (east - west) / grid
+    tiles = []
+    for row in range(grid):
+        tile_north = north - row * lat_step
+        for col in range(grid):
+            tile_west = west + col * lon_step
+            tiles.append((round(tile_north - lat_step, 7), round(tile_west, 7),
+                          round(tile_north, 7), round(tile_west + lon_step, 7)))
+    return tiles
+
+
+class TiledListFetcher:
+    def __init__(self, api_client, max_workers: int = None):
+        self.api_client = api_client
+        self.config = settings.tiling_settings
+        self.max_workers = max_workers or settings.collection_settings['parallel_workers']
+
+    def _fetch_tile(self, cortar_no: str, tile: Bounds, order: str, filters: Optional[Dict],
+                    budget: RequestBudget) -> Tuple[List[Dict], int]:
+        """타일 1개의 목록 페이지를 끝까지(또는 요청 예산까지) 조회, (목록 행, 요청 수) 반환"""
+        rows: List[Dict] = []
+        requests = 0
+        for page in range(1, self.config['max_pages_per_tile'] + 1):
+            if not budget.take():
+                break
+            response = self.api_client.get_area_articles(cortar_no, page, filters=filters, order=order, bounds=tile)
+            requests += 1
+            articles = [article for article in (response or {}).get('articleList') or [] if article.get('articleNo')]
+            rows.extend(articles)
+            if not articles or not response.get('isMoreData'):
+                break
+        else:
+            logger.warning("⚠️ 타일 %s 페이지 상한 %d 도달", tile, self.config['max_pages_per_tile'],
+                           extra={'area': cortar_no})
+        return rows, requests
+
+    def fetch(self, cortar_no: str, bounds: Bounds, order: str = 'rank', filters: Optional[Dict] = None,
+              seen: Iterable[str] = (), max_requests: Optional[int] = None) -> Dict[str, Any]:
+        """
+        지역 범위의 모든 타일을 병렬 조회
+        seen: 이미 확인한 article_no (결과에서 제외), max_requests: 목록 요청 수 상한 (타일 전체 합계)
+        반환: {'rows': 중복 제거된 새 목록 행, 'seen': 확인한 전체 article_no, 'tiles', 'list_requests', 'duplicates'}
+        """
+        tiles = split_bounds(bounds, self.config['grid'])
+        budget = RequestBudget(max_requests)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tiles))) as executor:
+            results = list(executor.map(lambda tile: self._fetch_tile(cortar_no, tile, order, filters, budget), tiles))
+
+        seen_nos: Set[str] = set(seen)
+        rows = []
+        duplicates = 0
+        for tile_rows, _ in results:
+            for article in tile_rows:
+                article_no = str(article['articleNo'])
+                if article_no in seen_nos:
+                    duplicates += 1
+                    continue
+                seen_nos.add(article_no)
+                rows.append(article)
+
+        list_requests = sum(requests for _, requests in results)
+        logger.info("🗺️ 지역 %s 타일 %d개 목록 조회: 요청 %d회, 새 매물 %d개 (중복 %d개)",
+                    cortar_no, len(tiles), list_requests, len(rows), duplicates, extra={'area': cortar_no})
+        if budget.exhausted:
+            logger.info("✂️ 지역 %s 타일 조회 요청 상한 %d회 도달", cortar_no, max_requests, extra={'area': cortar_no})
+        return {
+            'rows': rows,
+            'seen': seen_nos,
+            'tiles': len(tiles),
+            'list_requests': list_requests,
+            'duplicates': duplicates
+        }
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+목록 단계 사전 필터 - validation_rules를 목록 쿼리/목록 행 검증으로 내려보냄
+상세정보 요청, 카카오 주소 변환, DB 저장 전에 조건 밖의 매물을 걸러냄
+여러 매물 유형을 한 쿼리로 조회할 때 쿼리는 유형별 규칙을 모두 포함하는 범위로, 행은 행의 유형 규칙으로 검증
+"""
+
+import re
+from typing import Dict, List, Optional, Any
+from config.settings import settings
+
+# 네이버 부동산 거래유형 코드 (settings.validation_rules의 excluded_trade_types와 같은 체계)
+TRADE_TYPE_CODES = ['A1', 'B1', 'B2', 'B3']    # 매매, 전세, 월세, 단기임대
+
+# 목록 API의 가격 파라미터/가격 문자열은 만원 단위
+PRICE_UNIT = 10_000
+EOK_UNIT = 100_000_000
+
+_EOK_PATTERN = re.compile(r'([\d,]+)\s*억')
+
+
+def rules_for_type(type_code: Optional[str], rules: Dict[str, Any] = None) -> Dict[str, Any]:
+    """매물 유형(SMS/SG 등)의 검증 규칙 - 기본 규칙에 real_estate_type_settings의 유형별 항목을 덮어씀"""
+    rules = rules or settings.validation_rules
+    overrides = settings.real_estate_type_settings.get(type_code or '', {}).get('rules')
+    return dict(rules, **overrides) if overrides else rules
+
+
+def parse_list_price(value: Any) -> Optional[int]:
+    """목록 행의 가격 문자열을 원 단위 정수로 변환 ("1억 5,000" -> 150000000, "300" -> 3000000)"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)):
+        return int(value) * PRICE_UNIT
+
+    text = str(value).strip()
+    total = 0
+
+    eok_match = _EOK_PATTERN.search(text)
+    if eok_match:
+        total += int(eok_match.group(1).replace(',', '')) * EOK_UNIT
+        text = text[eok_match.end():]
+
+    remainder = text.replace(',', '').replace('만', '').replace('원', '').strip()
+    if remainder:
+        if not remainder.isdigit():
+            return None
+        total += int(remainder) * PRICE_UNIT
+    elif not eok_match:
+        return None
+
+    return total
+
+
+class ListPrefilter:
+    """validation_rules 기반 목록 쿼리 파라미터 생성 및 목록 행 사전 필터링"""
+
+    def __init__(self, rules: Dict[str, Any] = None):
+        self.rules = rules or settings.validation_rules
+        self.type_rules = {code: rules_for_type(code, self.rules)
+                           for code in settings.collection_settings['real_estate_types']}
+        self.stats = {
+            'rows_checked': 0,
+            'rows_rejected': 0,
+            'rejections_by_reason': {}
+        }
+
+    def build_query_params(self) -> Dict[str, Any]:
+        """get_area_articles 쿼리에 덮어쓸 필터 파라미터 (만원 단위, 조회하는 유형들의 규칙을 모두 포함하는 범위)"""
+        type_rules = list(self.type_rules.values()) or [self.rules]
+        deposit_limits = [rules['deposit_limits'] for rules in type_rules]
+        rent_limits = [rules['monthly_rent_limits'] for rules in type_rules]
+
+        params = {
+            'priceMin': min(limits['min'] for limits in deposit_limits) // PRICE_UNIT,
+            'priceMax': max(limits['max'] for limits in deposit_limits) // PRICE_UNIT,
+            'rentPriceMin': min(limits['min'] for limits in rent_limits) // PRICE_UNIT,
+            'rentPriceMax': max(limits['max'] for limits in rent_limits) // PRICE_UNIT,
+        }
+
+        allowed_trade_types = self.get_allowed_trade_types()
+        if allowed_trade_types:
+            params['tradeType'] = ':'.join(allowed_trade_types)
+
+        return params
+
+    def get_allowed_trade_types(self) -> List[str]:
+        """조회하는 유형 중 하나라도 허용하는 거래유형"""
+        type_rules = list(self.type_rules.values()) or [self.rules]
+        return [code for code in TRADE_TYPE_CODES
+                if any(code not in rules['excluded_trade_types'] for rules in type_rules)]
+
+    def rules_for_row(self, row: Dict) -> Dict[str, Any]:
+        type_code = row.get('realEstateTypeCode')
+        if type_code not in self.type_rules:
+            self.type_rules[type_code] = rules_for_type(type_code, self.rules)
+        return self.type_rules[type_code]
+
+    def get_rejection_reason(self, row: Dict) -> Optional[str]:
+        """목록 행이 유형별 검증 규칙을 통과하지 못하면 사유 반환 (가격이 없거나 읽을 수 없으면 0원으로 보고 하한에서 제외)"""
+        rules = self.rules_for_row(row)
+        trade_type = row.get('tradeTypeCode')
+        if trade_type and trade_type in rules['excluded_trade_types']:
+            return 'trade_type'
+
+        deposit = parse_list_price(row.get('dealOrWarrantPrc')) or 0
+        deposit_limits = rules['deposit_limits']
+        if deposit < deposit_limits['min'] or deposit > deposit_limits['max']:
+            return 'deposit'
+
+        rent = parse_list_price(row.get('rentPrc')) or 0
+        rent_limits = rules['monthly_rent_limits']
+        if rent < rent_limits['min'] or rent > rent_limits['max']:
+            return 'monthly_rent'
+
+        return None
+
+    def filter_rows(self, rows: List[Dict]) -> List[Dict]:
+        """검증 규칙을 통과한 목록 행만 반환"""
+        accepted = []
+        for row in rows:
+            self.stats['rows_checked'] += 1
+            reason = self.get_rejection_reason(row)
+            if reason:
+                self.stats['rows_rejected'] += 1
+                self.stats['rejections_by_reason'][reason] = self.stats['rejections_by_reason'].get(reason, 0) + 1
+            else:
+                accepted.append(row)
+        return accepted
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+신규 매물 감시 서비스 - 우선순위 높은 지역의 최신순 1페이지만 짧은 주기로 확인
+처음 보는 매물은 즉시 상세 수집/저장하고 발견→저장 지연시간을 기록
+"""
+
+import logging
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Any
+from config.settings import settings
+from database.listing_state import compute_list_fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """선형 보간 백분위수 (값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+class ListingWatcher:
+    def __init__(self, service, areas: List[Dict], poll_interval: float = None):
+        """
+        service: CollectionService (목록 조회/상세 수집/상태 저장소 공유)
+        areas: [{'name': ..., 'code': ...}] 감시할 지역
+        """
+        self.service = service
+        self.areas = areas
+        self.poll_interval = self._get_paced_interval(poll_interval or settings.watcher_settings['poll_interval'])
+        self.latencies = []
+        self.watch_stats = {
+            'cycles': 0,
+            'list_requests': 0,
+            'new_listings': 0,
+            'saved': 0,
+            'failed': 0
+        }
+
+    def _get_paced_interval(self, requested: float) -> float:
+        """한 주기의 목록 요청이 설정된 요청 간격보다 촘촘해지지 않도록 주기 하한 적용"""
+        min_interval = len(self.areas) * settings.collection_settings['request_delay_max']
+        if requested < min_interval:
+            print(f"⚠️ 감시 주기 {requested:.0f}초는 요청 간격 설정보다 짧아 {min_interval:.0f}초로 조정")
+            return min_interval
+        return requested
+
+    def run(self, max_cycles: int = None):
+        area_names = ', '.join(area['name'] for area in self.areas)
+        print(f"👀 신규 매물 감시 시작: {area_names} (주기 {self.poll_interval:.0f}초)")
+
+        report_every = settings.watcher_settings['latency_report_every']
+        try:
+            while max_cycles is None or self.watch_stats['cycles'] < max_cycles:
+                cycle_start = time.time()
+                self.poll_once()
+
+                if self.watch_stats['cycles'] % report_every == 0:
+                    self.print_latency_summary()
+
+                remaining = self.poll_interval - (time.time() - cycle_start)
+                if remaining > 0 and (max_cycles is None or self.watch_stats['cycles'] < max_cycles):
+                    time.sleep(remaining)
+        except KeyboardInterrupt:
+            print("\n⚠️ 감시 중단")
+
+        self.print_latency_summary()
+
+    def poll_once(self) -> int:
+        """모든 감시 지역의 1페이지를 확인하고 새로 저장한 매물 수 반환"""
+        self.watch_stats['cycles'] += 1
+        saved_count = 0
+
+        for area in self.areas:
+            cortar_no = area['code']
+            articles = self.service.fetch_list_page(cortar_no, 1, settings.discovery_settings['order'])
+            self.watch_stats['list_requests'] += 1
+            if not articles:
+                continue
+
+            discovered_at = time.time()
+            fingerprints = {str(article['articleNo']): compute_list_fingerprint(article) for article in articles}
+            known = self.service.listing_state.get_fingerprints(fingerprints.keys())
+            unseen = [article for article in articles if str(article['articleNo']) not in known]
+            if not unseen:
+                continue
+
+            accepted = self.service.apply_list_prefilter(unseen, 1, cortar_no)
+            accepted_nos = {str(article['articleNo']) for article in accepted}
+            self.service.listing_state.mark_seen_many(
+                cortar_no, {str(article['articleNo']): fingerprints[str(article['articleNo'])]
+                            for article in unseen if str(article['articleNo']) not in accepted_nos})
+
+            self.watch_stats['new_listings'] += len(accepted)
+            logger.info("🆕 %s: 신규 매물 %d개 발견", area['name'], len(accepted), extra={'area': cortar_no})
+
+            saved_fingerprints = {}
+            for article in accepted:
+                article_no = str(article['articleNo'])
+                if self.service.collect_single_article(article_no, quiet=True):
+                    latency = time.time() - discovered_at
+                    self.latencies.append(latency)
+                    saved_fingerprints[article_no] = fingerprints[article_no]
+                    self.watch_stats['saved'] += 1
+                    saved_count += 1
+                    logger.debug("✅ %s 저장 (발견 후 %.1f초)", article_no, latency,
+                                 extra={'area': cortar_no, 'article_no': article_no})
+                else:
+                    self.watch_stats['failed'] += 1
+            self.service.listing_state.mark_seen_many(cortar_no, saved_fingerprints, saved=True)
+
+        return saved_count
+
+    def get_latency_stats(self) -> Dict[str, Any]:
+        return {
+            **self.watch_stats,
+            'latency_p50': percentile(self.latencies, 50),
+            'latency_p90': percentile(self.latencies, 90),
+            'latency_p99': percentile(self.latencies, 99),
+            'latency_max': max(self.latencies) if self.latencies else None
+        }
+
+    def print_latency_summary(self):
+        stats = self.get_latency_stats()
+        print(f"\n📈 감시 현황 ({datetime.now().strftime('%H:%M:%S')}):")
+        print(f"   주기: {stats['cycles']}회, 목록 요청: {stats['list_requests']}회")
+        print(f"   신규 매물: {stats['new_listings']}개, 저장: {stats['saved']}개, 실패: {stats['failed']}개")
+        if self.latencies:
+            print(f"   발견→저장 지연: p50 {stats['latency_p50']:.1f}초, "
+                  f"p90 {stats['latency_p90']:.1f}초, p99 {stats['latency_p99']:.1f}초")
+        print("=" * 50)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+실행 전체 진행률 / ETA 추적
+  - 작업량 단위는 목록 행 (상세 수집/생략 모두 포함)
+  - 지역별 총량: 이번 실행 목록 API의 totalCount(mapExposedCount) > 같은 모드 직전 수집의 확인 행 수 > 기본값
+  - 속도: 페이지 처리마다 갱신하는 행/초 EWMA (실행 초반에는 최근 지역 수집 기록의 평균 속도)
+  - 진행 상황은 event=progress 구조화 로그로 출력 (JSON 로그 파일에서 eta_seconds 등 필드로 조회)
+
+스케줄러도 estimate_seconds()로 지역 수집이 남은 시간 안에 끝날지 판단
+"""
+
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def list_total_count(response: Dict) -> Optional[int]:
+    """목록 응답의 지역 전체 매물 수 (없으면 None)"""
+    for field in ('totalCount', 'mapExposedCount'):
+        value = response.get(field)
+        if isinstance(value, int) and value >= 0:
+            return value
+    return None
+
+
+class ProgressTracker:
+    def __init__(self, listing_state=None):
+        """listing_state: 직전 지역 수집 기록 조회용 ListingStateStore (없으면 이번 실행 정보만 사용)"""
+        self.listing_state = listing_state
+        self.config = settings.progress_settings
+        self.mode = 'full'
+        self.max_rows: Optional[int] = None
+        self.planned: List[str] = []
+        self.area_totals: Dict[str, int] = {}
+        self.area_done: Dict[str, int] = {}
+        self.finished: set = set()
+        self.current: Optional[str] = None
+        self.rate: Optional[float] = None   # 행/초 EWMA
+        self.started_at: Optional[float] = None
+        self._last_sample_at: Optional[float] = None
+        self._prior_rows_cache: Dict[tuple, Optional[int]] = {}
+        self._prior_rate_cache: Dict[str, Optional[float]] = {}
+
+    def plan(self, area_codes: Iterable[str], mode: str = 'full', max_pages: int = None):
+        """이번 실행에서 수집할 지역 목록 (수집 순서대로)"""
+        self.planned = list(area_codes)
+        self.mode = mode
+        self.max_rows = max_pages * settings.scheduler_settings['rows_per_page'] if max_pages else None
+        self.started_at = self.started_at or time.time()
+
+    def start_area(self, cortar_no: str, mode: str = None):
+        if mode:
+            self.mode = mode
+        if cortar_no not in self.planned:
+            self.planned.append(cortar_no)
+        self.current = cortar_no
+        now = time.time()
+        self.started_at = self.started_at or now
+        self._last_sample_at = now
+
+    def set_area_total(self, cortar_no: str, total: Optional[int]):
+        if total is not None:
+            self.area_totals[cortar_no] = total
+
+    def advance(self, cortar_no: str, rows: int):
+        """목록 행 rows개 처리 완료 (상세 수집/생략 포함) - 마지막 갱신 이후 속도로 EWMA 갱신"""
+        self.area_done[cortar_no] = self.area_done.get(cortar_no, 0) + rows
+        now = time.time()
+        elapsed = now - (self._last_sample_at or now)
+        self._last_sample_at = now
+        if rows <= 0 or elapsed <= 0:
+            return
+        sample = rows / elapsed
+        alpha = self.config['ewma_alpha']
+        self.rate = sample if self.rate is None else alpha * sample + (1 - alpha) * self.rate
+
+    def finish_area(self, cortar_no: str):
+        self.finished.add(cortar_no)
+        self.emit('area_finished')
+        if self.current == cortar_no:
+            self.current = None
+
+    def _prior_rows(self, cortar_no: str, mode: str) -> Optional[int]:
+        """같은 모드 직전 지역 수집의 확인 행 수"""
+        key = (cortar_no, mode)
+        if key not in self._prior_rows_cache:
+            rows = None
+            if self.listing_state:
+                sweeps = [sweep for sweep in self.listing_state.get_area_sweeps(cortar_no, limit=5)
+                          if sweep['mode'] == mode and sweep['rows_seen']]
+                rows = sweeps[-1]['rows_seen'] if sweeps else None
+            self._prior_rows_cache[key] = rows
+        return self._prior_rows_cache[key]
+
+    def expected_rows(self, cortar_no: str, mode: str = None) -> int:
+        """지역 1회 수집의 예상 목록 행 수"""
+        mode = mode or self.mode
+        if mode == 'full' and cortar_no in self.area_totals:
+            rows = self.area_totals[cortar_no]
+        else:
+            prior = self._prior_rows(cortar_no, mode)
+            rows = prior if prior is not None else self.config['default_area_rows']
+        return min(rows, self.max_rows) if self.max_rows else rows
+
+    def remaining_rows(self) -> int:
+        remaining = 0
+        for cortar_no in self.planned:
+            if cortar_no in self.finished:
+                continue
+            remaining += max(self.expected_rows(cortar_no) - self.area_done.get(cortar_no, 0), 0)
+        return remaining
+
+    def current_rate(self, mode: str = None) -> float:
+        """행/초 - 이번 실행 EWMA, 아직 없으면 최근 지역 수집 기록 평균, 그것도 없으면 기본값"""
+        if self.rate:
+            return self.rate
+        mode = mode or self.mode
+        if mode not in self._prior_rate_cache:
+            self._prior_rate_cache[mode] = self.listing_state.get_sweep_throughput(mode) if self.listing_state else None
+        return self._prior_rate_cache[mode] or self.config['default_rows_per_second']
+
+    def estimate_seconds(self, area_codes: Iterable[str], mode: str = None) -> float:
+        """지역들을 한 번씩 수집하는 데 걸릴 예상 시간 (초)"""
+        rows = sum(self.expected_rows(cortar_no, mode) for cortar_no in area_codes)
+        return rows / self.current_rate(mode)
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = time.time()
+        done = sum(self.area_done.values())
+        remaining = self.remaining_rows()
+        eta_seconds = remaining / self.current_rate()
+        area = self.current
+        return {
+            'mode': self.mode,
+            'area': area,
+            'area_done': self.area_done.get(area, 0) if area else None,
+            'area_total': self.expected_rows(area) if area else None,
+            'areas_finished': len(self.finished),
+            'areas_planned': len(self.planned),
+            'rows_done': done,
+            'rows_remaining': remaining,
+            'rows_per_second': round(self.current_rate(), 3),
+            'elapsed_seconds': round(now - self.started_at, 1) if self.started_at else 0.0,
+            'eta_seconds': round(eta_seconds, 1),
+            'eta_at': datetime.fromtimestamp(now + eta_seconds).isoformat(timespec='seconds')
+        }
+
+    def emit(self, event: str = 'progress') -> Dict[str, Any]:
+        """진행 상황 구조화 로그 (콘솔은 한 줄 요약)"""
+        snapshot = self.snapshot()
+        done, remaining = snapshot['rows_done'], snapshot['rows_remaining']
+        percent = done / (done + remaining) * 100 if done + remaining else 100.0
+        logger.info("📈 진행 %.1f%% (지역 %d/%d, 목록 행 %d/%d), %.2f행/초, 남은 시간 %.1f분 (완료 예정 %s)",
+                    percent, snapshot['areas_finished'], snapshot['areas_planned'], done, done + remaining,
+                    snapshot['rows_per_second'], snapshot['eta_seconds'] / 60, snapshot['eta_at'][11:16],
+                    extra={'event': event, **snapshot})
+        return snapshot
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+매물별 상세정보 재수집 시점(TTL) 계산
+매물 자체의 변경 이력(마지막 변경 이후 시간, 누적 변경 횟수, 노출 시작 이후 기간)으로
+다음 변경까지의 시간을 추정
+"""
+
+import math
+import time
+from datetime import datetime
+from typing import Optional
+from config.settings import settings
+
+
+def parse_expose_start(date_str: Optional[str]) -> Optional[float]:
+    """exposeStartYMD (YYYYMMDD 또는 YYYY-MM-DD) -> timestamp"""
+    if not date_str or not isinstance(date_str, str):
+        return None
+    digits = date_str.replace('-', '')
+    if len(digits) != 8 or not digits.isdigit():
+        return None
+    try:
+        return datetime.strptime(digits, '%Y%m%d').timestamp()
+    except ValueError:
+        return None
+
+
+def compute_next_refresh(now: float = None, first_seen_at: float = None, last_changed_at: float = None,
+                         change_count: int = 0, expose_start_at: float = None) -> float:
+    """
+    다음 상세 재수집 시각 (timestamp)
+
+    변경을 포아송 과정으로 보고 변경률 = (변경 횟수 + 1) / 매물 나이로 추정한 뒤,
+    TTL 안에 변경이 일어날 확률이 change_probability가 되도록 TTL을 정함.
+    최근에 바뀐 매물은 변경률을 두 배로 보고, TTL은 [min_ttl, max_ttl]로 제한해 최대 지연을 보장.
+    """
+    config = settings.refresh_settings
+    now = now or time.time()
+
+    born_at = min(ts for ts in (expose_start_at, first_seen_at, now) if ts)
+    age = max(now - born_at, config['min_ttl'])
+    change_rate = (change_count + 1) / age
+
+    mean_interval = 1 / change_rate
+    if last_changed_at and now - last_changed_at < mean_interval:
+        change_rate *= 2
+
+    ttl = -math.log(1 - config['change_probability']) / change_rate
+    ttl = min(max(ttl, config['min_ttl']), config['max_ttl'])
+    return now + ttl
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+지역 트리(시 -> 구 -> 동) 조회 - 네이버 부동산 지역 목록 JSON API(/api/regions/list)
+브라우저 없이 구 이름만으로 동 코드(cortarNo)를 찾고, 하위 지역 목록을 디스크에 TTL 캐시
+수집 대상 구는 --districts 또는 settings.region_settings['districts'] (NAVER_DISTRICTS=강남구,서초구)
+구를 지정하지 않으면 기존처럼 config/area_codes.py의 강남구 동 목록을 사용 (지역 트리 조회 없음)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from config.settings import settings
+from config.area_codes import GANGNAM_AREAS, get_all_priority_areas
+
+logger = logging.getLogger(__name__)
+
+# 최상위 지역(시/도 목록) 조회용 코드
+ROOT_CORTAR_NO = '0000000000'
+
+# config/area_codes.py에 동 목록이 있는 구 (지역 트리 조회 실패시 대체 목록으로 사용 가능)
+DEFAULT_DISTRICT = '강남구'
+
+# 기존 우선순위 점수 (동 이름은 구마다 겹칠 수 있으므로 코드 기준)
+PRIORITY_BY_CODE = {area['code']: area['priority'] for area in GANGNAM_AREAS}
+
+
+class RegionLookupError(RuntimeError):
+    """요청한 구의 동 목록을 지역 트리에서 찾지 못함"""
+
+
+def _normalize_name(name: str) -> str:
+    """'서울특별시'/'서울시'처럼 표기가 다른 이름 비교용"""
+    return name.replace('특별시', '시').replace('광역시', '시').replace(' ', '')
+
+
+class RegionService:
+    def __init__(self, api_client=None, cache_path: str = None, ttl_days: float = None):
+        """api_client: NaverAPIClient (없으면 캐시가 부족할 때 생성)"""
+        config = settings.region_settings
+        self._api_client = api_client
+        self.cache_path = Path(cache_path or config['cache_path'])
+        self.ttl = (config['ttl_days'] if ttl_days is None else ttl_days) * 24 * 3600
+        self._lock = threading.Lock()
+        self._nodes = self._load_cache()
+        self.stats = {'cache_hits': 0, 'api_calls': 0, 'stale_used': 0}
+
+    @property
+    def api_client(self):
+        if self._api_client is None:
+            from collectors.naver_api_client import NaverAPIClient
+            self._api_client = NaverAPIClient()
+        return self._api_client
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        try:
+            with open(self.cache_path, encoding='utf-8') as f:
+                return json.load(f).get('nodes', {})
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("⚠️ 지역 캐시 읽기 실패, 새로 조회: %s", e)
+            return {}
+
+    def _save_cache(self):
+        """임시 파일에 쓴 뒤 교체 (중간에 중단돼도 기존 캐시 유지)"""
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.cache_path.with_suffix(self.cache_path.suffix + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'nodes': self._nodes}, f, ensure_ascii=False, indent=1)
+        os.replace(temp_path, self.cache_path)
+
+    def get_children(self, cortar_no: str = ROOT_CORTAR_NO, refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        하위 지역 목록 [{'code', 'name', 'type', 'center_lat', 'center_lon'}]
+        캐시가 TTL 안이면 캐시, 아니면 API 조회 (조회 실패시 만료된 캐시라도 사용)
+        """
+        with self._lock:
+            node = self._nodes.get(cortar_no)
+            if node and not refresh and time.time() - node['fetched_at'] < self.ttl:
+                self.stats['cache_hits'] += 1
+                return node['children']
+
+        response = self.api_client.get_region_list(cortar_no)
+        self.stats['api_calls'] += 1
+        if not response or 'regionList' not in response:
+            if node:
+                self.stats['stale_used'] += 1
+                logger.warning("⚠️ 지역 %s 하위 목록 조회 실패, 캐시 사용 (%.1f일 전)",
+                               cortar_no, (time.time() - node['fetched_at']) / 86400)
+                return node['children']
+            logger.warning("❌ 지역 %s 하위 목록 조회 실패", cortar_no)
+            return []
+
+        children = [{
+            'code': str(region['cortarNo']),
+            'name': region.get('cortarName', ''),
+            'type': region.get('cortarType'),
+            'center_lat': region.get('centerLat'),
+            'center_lon': region.get('centerLon')
+        } for region in response['regionList'] if region.get('cortarNo')]
+
+        with self._lock:
+            self._nodes[cortar_no] = {'fetched_at': time.time(), 'children': children}
+            try:
+                self._save_cache()
+            except OSError as e:
+                logger.warning("⚠️ 지역 캐시 저장 실패: %s", e)
+        return children
+
+    def find_child(self, parent_code: str, name: str, refresh: bool = False) -> Optional[Dict[str, Any]]:
+        """하위 지역 중 이름이 같은 지역 (서울시/서울특별시처럼 표기 차이는 무시)"""
+        target = _normalize_name(name)
+        for child in self.get_children(parent_code, refresh):
+            if _normalize_name(child['name']) == target:
+                return child
+        return None
+
+    def get_district_dongs(self, district: str, city: str = None, refresh: bool = False) -> List[Dict[str, Any]]:
+        """시 -> 구 이름으로 동 목록 조회, 찾지 못하면 빈 목록"""
+        city = city or settings.region_settings['city']
+        city_node = self.find_child(ROOT_CORTAR_NO, city, refresh)
+        if not city_node:
+            logger.warning("❌ 지역 트리에서 %s를 찾지 못함", city)
+            return []
+        district_node = self.find_child(city_node['code'], district, refresh)
+        if not district_node:
+            logger.warning("❌ %s에서 %s를 찾지 못함", city, district)
+            return []
+        return [dict(dong, district=district_node['name'], district_code=district_node['code'])
+                for dong in self.get_children(district_node['code'], refresh)]
+
+    def get_areas(self, districts: List[str] = None, refresh: bool = False) -> List[Dict[str, Any]]:
+        """수집 대상 구들의 동을 스케줄러/수집 루프 형식 [{'name', 'code', 'priority', 'district'}]으로 (우선순위 순)"""
+        districts = districts or settings.region_settings['districts'] or [DEFAULT_DISTRICT]
+        default_priority = settings.region_settings['default_priority']
+        areas = []
+        for district in districts:
+            for dong in self.get_district_dongs(district, refresh=refresh):
+                areas.append({
+                    'name': dong['name'],
+                    'code': dong['code'],
+                    'priority': PRIORITY_BY_CODE.get(dong['code'], default_priority),
+                    'district': dong['district']
+                })
+        return sorted(areas, key=lambda area: area['priority'], reverse=True)
+
+    def print_tree(self, districts: List[str] = None, refresh: bool = False):
+        districts = districts or settings.region_settings['districts'] or [DEFAULT_DISTRICT]
+        started = time.time()
+        for district in districts:
+            dongs = self.get_district_dongs(district, refresh=refresh)
+            print(f"\n🗺️ {district}: 동 {len(dongs)}개")
+            for dong in dongs:
+                priority = PRIORITY_BY_CODE.get(dong['code'])
+                print(f"   {dong['code']}  {dong['name']}" + (f" ({priority}점)" if priority is not None else ''))
+        print(f"\n⏱️ {time.time() - started:.2f}초 (API {self.stats['api_calls']}회, 캐시 {self.stats['cache_hits']}회, "
+              f"캐시 파일 {self.cache_path})")
+
+
+def get_collection_areas(districts: List[str] = None, refresh: bool = False, api_client=None) -> List[Dict[str, Any]]:
+    """
+    수집 대상 동 (우선순위 순)
+    구를 지정하지 않으면(--districts, NAVER_DISTRICTS 모두 없음) 기존 강남구 동 목록, 지정하면 지역 트리 조회
+    지역 트리에서 구를 찾지 못하면 강남구는 기존 목록으로 대체하고 다른 구는 RegionLookupError
+    api_client: 지역 목록 조회에 쓸 NaverAPIClient (수집 서비스의 클라이언트를 넘기면 토큰 수집기를 새로 만들지 않음)
+    """
+    districts = districts or settings.region_settings['districts']
+    if not districts:
+        return get_all_priority_areas()
+
+    service = RegionService(api_client)
+    areas = []
+    for district in districts:
+        try:
+            district_areas = service.get_areas([district], refresh)
+        except Exception as e:
+            logger.warning("⚠️ %s 지역 트리 조회 실패: %s", district, e)
+            district_areas = []
+        if not district_areas:
+            if _normalize_name(district) != DEFAULT_DISTRICT:
+                raise RegionLookupError(f"지역 목록 API에서 {district} 동 목록을 찾지 못함")
+            logger.warning("⚠️ 지역 트리에서 %s를 찾지 못해 기본 목록(config/area_codes.py) 사용", district)
+            district_areas = get_all_priority_areas()
+        areas.extend(district_areas)
+    return sorted(areas, key=lambda area: area['priority'], reverse=True)
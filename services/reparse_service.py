@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+아카이브 재파싱 서비스 - 저장해 둔 상세 응답으로 naver_properties 컬럼을 다시 만들어 일괄 반영
+필드 추가/매핑 수정 후 네이버 API를 다시 호출하지 않고 로컬 CPU 작업으로 백필
+"""
+
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+from config.settings import settings
+from database.response_archive import ResponseArchive, read_frame
+from database.property_rows import ADDRESS_COLUMNS, BUILDING_COLUMNS, build_property_row
+from parsers.article_parser import ArticleParser
+from parsers.records import ArticleRecord
+
+logger = logging.getLogger(__name__)
+
+# 재파싱으로 다시 만들 수 있는 컬럼 (주소 변환 결과와 활성 상태는 아카이브에 없어 제외)
+REPARSE_COLUMNS = tuple(
+    column for column in build_property_row(ArticleRecord())
+    if column not in ADDRESS_COLUMNS and column != 'is_active'
+)
+
+
+def get_reparse_columns() -> tuple:
+    """현재 설정에서 재파싱할 수 있는 컬럼 - 건물 테이블을 쓰면 건축물대장 컬럼은 naver_buildings에만 있어 제외"""
+    if settings.building_settings['enabled']:
+        return tuple(column for column in REPARSE_COLUMNS if column not in BUILDING_COLUMNS)
+    return REPARSE_COLUMNS
+
+
+def _reparse_chunk(archive_dir: str, locations: List[Tuple[str, str, int, int]],
+                   columns: Sequence[str]) -> Tuple[List[Dict], int]:
+    """프로세스 작업 단위: 응답 프레임 읽기 -> 파싱 -> 행 생성 (행 목록, 실패 수)"""
+    parser = ArticleParser()
+    rows = []
+    failed = 0
+    for article_no, segment, offset, length in locations:
+        try:
+            body = read_frame(archive_dir, segment, offset, length)['body']
+        except Exception as e:
+            logger.warning("⚠️ 아카이브 읽기 실패: %s", e, extra={'article_no': article_no})
+            failed += 1
+            continue
+
+        article = parser.parse_article_record(body, article_no)
+        if not article:
+            failed += 1
+            continue
+        row = build_property_row(article)
+        rows.append({column: row[column] for column in columns})
+    return rows, failed
+
+
+class ReparseService:
+    def __init__(self, archive: ResponseArchive = None, repository=None, workers: int = None):
+        self.config = settings.archive_settings
+        self.archive = archive or ResponseArchive()
+        self.repository = repository
+        self.workers = workers or self.config['reparse_workers']
+
+    def _get_repository(self):
+        if self.repository is None:
+            from database.optimized_repository import OptimizedPropertyRepository
+            self.repository = OptimizedPropertyRepository()
+        return self.repository
+
+    def _resolve_columns(self, columns: Optional[Sequence[str]]) -> List[str]:
+        available = get_reparse_columns()
+        if not columns:
+            return ['article_no', *[column for column in available if column != 'article_no']]
+        unknown = [column for column in columns if column not in available]
+        if unknown:
+            raise ValueError(f"재파싱할 수 없는 컬럼: {', '.join(unknown)} (가능: {', '.join(available)})")
+        return ['article_no', *[column for column in columns if column != 'article_no']]
+
+    def run(self, since: datetime = None, columns: Sequence[str] = None, dry_run: bool = False,
+            limit: int = None) -> Dict:
+        """
+        since: 이 시각 이후에 받은 응답만 사용 (매물별 최신 응답 1건)
+        columns: 갱신할 컬럼 (기본: 재파싱 가능한 전체 컬럼)
+        dry_run: 파싱만 하고 DB에 쓰지 않음
+        """
+        columns = self._resolve_columns(columns)
+        locations = self.archive.get_latest_locations('detail', since.timestamp() if since else None)
+        if limit:
+            locations = locations[:limit]
+
+        chunk_size = self.config['reparse_chunk_size']
+        chunks = [locations[i:i + chunk_size] for i in range(0, len(locations), chunk_size)]
+        logger.info("♻️ 아카이브 재파싱: 매물 %d개, %d개 작업, 프로세스 %d개, 컬럼 %d개%s",
+                    len(locations), len(chunks), self.workers, len(columns) - 1, ' (dry-run)' if dry_run else '')
+
+        stats = {'articles': len(locations), 'parsed': 0, 'parse_failed': 0,
+                 'updated': 0, 'skipped': 0, 'write_failed': 0}
+        pending_rows = []
+        start_time = time.time()
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(_reparse_chunk, str(self.archive.archive_dir), chunk, columns)
+                       for chunk in chunks]
+            for done, future in enumerate(as_completed(futures), 1):
+                rows, failed = future.result()
+                stats['parsed'] += len(rows)
+                stats['parse_failed'] += failed
+                pending_rows.extend(rows)
+
+                if not dry_run and len(pending_rows) >= self.config['bulk_write_size']:
+                    self._flush(pending_rows, stats)
+                    pending_rows = []
+
+                if done % 10 == 0 or done == len(futures):
+                    rate = stats['parsed'] / max(time.time() - start_time, 1e-9)
+                    logger.info("   %d/%d 작업 완료 - 파싱 %d개 (%.0f개/초)", done, len(futures), stats['parsed'], rate)
+
+        if not dry_run and pending_rows:
+            self._flush(pending_rows, stats)
+
+        stats['elapsed_seconds'] = round(time.time() - start_time, 2)
+        logger.info("✅ 재파싱 완료: 파싱 %d개 (실패 %d개), 갱신 %d개, DB에 없음 %d개, 쓰기 실패 %d개, %s초",
+                    stats['parsed'], stats['parse_failed'], stats['updated'], stats['skipped'],
+                    stats['write_failed'], stats['elapsed_seconds'])
+        return stats
+
+    def _flush(self, rows: List[Dict], stats: Dict):
+        result = self._get_repository().bulk_update_properties(rows, batch_size=self.config['bulk_write_size'])
+        stats['updated'] += result['updated']
+        stats['skipped'] += result['skipped']
+        stats['write_failed'] += result['failed']
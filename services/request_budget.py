@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+분할 목록 조회(타일/구간)의 요청 수 상한
+병렬 워커가 하나의 예산을 나눠 쓰고, 예산을 다 쓰면 남은 요청은 보내지 않음 (--max-pages를 요청 수로 적용)
+"""
+
+import threading
+from typing import Optional
+
+
+class RequestBudget:
+    def __init__(self, limit: Optional[int] = None):
+        """limit: 최대 요청 수 (None이면 무제한)"""
+        self.limit = limit
+        self.used = 0
+        self.denied = 0
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        """요청 1회 사용, 예산이 없으면 False"""
+        with self._lock:
+            if self.limit is not None and self.used >= self.limit:
+                self.denied += 1
+                return False
+            self.used += 1
+            return True
+
+    @property
+    def exhausted(self) -> bool:
+        """예산이 모자라 보내지 못한 요청이 있었는지"""
+        return self.denied > 0
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+실행 기록(collection_runs) 추이 보고서 - main.py --report
+같은 모드의 직전 실행들 중앙값보다 매물/초가 크게 떨어진 실행을 표시 (네이버 쪽 변경으로 생긴 성능 저하 확인용)
+"""
+
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+from config.settings import settings
+from database.run_ledger import RunLedger
+
+
+def compare_to_baseline(runs: List[Dict[str, Any]], baseline_runs: int, drop_threshold: float,
+                        min_articles: int) -> List[Dict[str, Any]]:
+    """
+    실행마다 같은 모드의 직전 baseline_runs회 매물/초 중앙값과 비교
+    반환: 실행별 {'baseline': 중앙값 또는 None, 'change': 변화율 또는 None, 'regressed': bool}
+    """
+    history: Dict[str, List[float]] = {}
+    results = []
+    for run in runs:
+        previous = history.get(run['mode'], [])[-baseline_runs:]
+        baseline = statistics.median(previous) if previous else None
+        comparable = run['articles_fetched'] >= min_articles and run['status'] == 'completed'
+        change = (run['articles_per_sec'] / baseline - 1) if baseline and comparable else None
+        results.append({
+            'baseline': baseline,
+            'change': change,
+            'regressed': change is not None and change < -drop_threshold
+        })
+        if comparable:
+            history.setdefault(run['mode'], []).append(run['articles_per_sec'])
+    return results
+
+
+def _per_article(value: int, articles: int) -> str:
+    return f"{value / articles:.2f}" if articles else '-'
+
+
+def _stage_trend(runs: List[Dict[str, Any]], baseline_runs: int) -> List[Dict[str, Any]]:
+    """마지막 실행의 단계별 평균 시간과 같은 모드 직전 실행 중앙값"""
+    latest = runs[-1]
+    previous = [run for run in runs[:-1] if run['mode'] == latest['mode']][-baseline_runs:]
+    trend = []
+    for stage, timing in sorted(latest['stage_timings'].items()):
+        history = [run['stage_timings'][stage]['mean_ms'] for run in previous if stage in run['stage_timings']]
+        trend.append({
+            'stage': stage,
+            'mean_ms': timing['mean_ms'],
+            'baseline_ms': statistics.median(history) if history else None
+        })
+    return trend
+
+
+def print_run_report(limit: int = None, mode: Optional[str] = None, ledger: RunLedger = None) -> int:
+    """최근 실행 추이 출력, 성능 저하로 표시된 실행 수 반환"""
+    config = settings.monitoring_settings
+    ledger = ledger or RunLedger()
+    runs = ledger.recent_runs(limit or config['report_runs'], mode)
+    if not runs:
+        print(f"📭 실행 기록이 없습니다 ({ledger.db_path})")
+        return 0
+
+    comparisons = compare_to_baseline(runs, config['report_baseline_runs'], config['report_drop_threshold'],
+                                      config['report_min_articles'])
+
+    print(f"📒 최근 실행 {len(runs)}회 ({ledger.db_path})")
+    print(f"   {'id':>5} {'시작':<12} {'모드':<20} {'분':>6} {'목록':>6} {'상세':>6} {'생략':>6} {'저장':>6}"
+          f" {'API/매물':>9} {'429':>5} {'카카오/매물':>10} {'DB/매물':>8} {'매물/초':>8} {'기준 대비':>10}")
+    for run, comparison in zip(runs, comparisons):
+        started = time.strftime('%m-%d %H:%M', time.localtime(run['started_at']))
+        mode_label = run['mode'] if run['status'] == 'completed' else f"{run['mode']} ({run['status']})"
+        if comparison['change'] is None:
+            change = '-'
+        else:
+            change = f"{comparison['change'] * 100:+.0f}%" + (' ⚠️' if comparison['regressed'] else '')
+        fetched = run['articles_fetched']
+        print(f"   {run['id']:>5} {started:<12} {mode_label:<20} {run['duration'] / 60:>6.1f}"
+              f" {run['articles_seen']:>6} {fetched:>6} {run['articles_skipped']:>6} {run['articles_saved']:>6}"
+              f" {_per_article(run['api_calls'], fetched):>9} {run['rate_limited']:>5}"
+              f" {_per_article(run['geocode_calls'], fetched):>10} {_per_article(run['db_round_trips'], fetched):>8}"
+              f" {run['articles_per_sec']:>8.2f} {change:>10}")
+
+    trend = _stage_trend(runs, config['report_baseline_runs'])
+    if trend:
+        print(f"\n⏱️ 마지막 실행 단계별 평균 (ms, 같은 모드 직전 {config['report_baseline_runs']}회 중앙값 대비):")
+        for item in trend:
+            baseline = f"{item['baseline_ms']:.1f}" if item['baseline_ms'] is not None else '-'
+            print(f"   {item['stage']:<24}{item['mean_ms']:>9.1f}{baseline:>9}")
+
+    regressed = [run for run, comparison in zip(runs, comparisons) if comparison['regressed']]
+    if regressed:
+        print(f"\n⚠️ 매물/초가 직전 실행 중앙값보다 {config['report_drop_threshold'] * 100:.0f}% 넘게 떨어진 실행: "
+              + ', '.join(f"#{run['id']}" for run in regressed))
+    else:
+        print("\n✅ 성능 저하로 표시된 실행 없음")
+    return len(regressed)
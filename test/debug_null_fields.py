@@ -19,11 +19,12 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from collectors.naver_api_client import NaverAPIClient
 from parsers.article_parser import ArticleParser
+from parsers.field_spec import get_api_keys
 from database.optimized_repository import OptimizedPropertyRepository
 
 class NullFieldDebugger:
     def __init__(self):
-        self.api_client = NaverAPIClient()
+        self.api_client = NaverAPIClient(decoder='json')  # 원본 응답 전체를 분석/저장하므로 dict로 디코딩
         self.parser = ArticleParser()
         self.repository = OptimizedPropertyRepository()
         self.debug_results = {
@@ -267,18 +268,8 @@ class NullFieldDebugger:
             print(f"      {status} {field}")
     
     def _get_important_fields_by_section(self, section_name: str) -> list:
-        """섹션별 중요 필드 목록"""
-        important_fields = {
-            'articleDetail': ['articleNo', 'realestateTypeName', 'tradeTypeName', 'buildingTypeName', 
-                            'latitude', 'longitude', 'exposureAddress', 'detailAddress'],
-            'articlePrice': ['dealPrice', 'warrantPrice', 'rentPrice', 'priceBySpace'],
-            'articleSpace': ['supplySpace', 'exclusiveSpace', 'totalSpace'],
-            'articleFloor': ['totalFloorCount', 'correspondingFloorCount'],
-            'articleRealtor': ['address', 'realtorName', 'representativeTelNo'],
-            'articleFacility': ['subwayList', 'directionTypeName', 'etcFacilities'],
-            'articleTax': ['acquisitionTax', 'brokerFee']
-        }
-        return important_fields.get(section_name, [])
+        """섹션별 중요 필드 목록 (파서 필드 명세 기준)"""
+        return get_api_keys(section_name)
     
     def _save_api_response(self, article_no: str, raw_response: Dict):
         """API 응답을 JSON 파일로 저장"""
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """
 수정된 파서로 실제 수집 테스트
+
+네트워크 없이 반복 실행하려면 한 번 녹화 후 재생:
+  NAVER_CASSETTE_MODE=record python test/final_test_collection.py
+  NAVER_CASSETTE_MODE=replay NAVER_CASSETTE_LATENCY=original python test/final_test_collection.py
 """
 
 import sys
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+동일주소 묶음 구성원 조회 검증 - 새 묶음/요약 변경/TTL 만료일 때만 구성원 목록 조회
+python -m pytest test/test_address_groups.py
+"""
+
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.listing_state import ListingStateStore
+from services.address_groups import AddressGroupExpander
+
+AREA = '1168010100'
+
+
+class MemberClient:
+    """대표 좌표에 구성원 2개 + 다른 좌표 매물 1개를 돌려주는 목록 API"""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_area_articles(self, cortar_no, page, filters=None, bounds=None):
+        self.calls.append(filters)
+        return {'articleList': [
+            {'articleNo': '100', 'latitude': '37.5', 'longitude': '127.0'},
+            {'articleNo': '101', 'latitude': '37.5', 'longitude': '127.0'},
+            {'articleNo': '102', 'latitude': '37.5', 'longitude': '127.0'},
+            {'articleNo': '200', 'latitude': '37.50001', 'longitude': '127.0'}
+        ], 'isMoreData': False}
+
+
+def _group_row(count=3, min_price='3,000'):
+    return {'articleNo': '100', 'sameAddrCnt': count, 'sameAddrMinPrc': min_price, 'sameAddrMaxPrc': '5,000',
+            'latitude': '37.5', 'longitude': '127.0'}
+
+
+def _expander(tmp_path, client):
+    return AddressGroupExpander(client, ListingStateStore(str(tmp_path / 'state.db')), max_workers=1)
+
+
+def test_new_group_members_fetched(tmp_path):
+    client = MemberClient()
+    result = _expander(tmp_path, client).expand(AREA, [_group_row(), {'articleNo': '300', 'sameAddrCnt': 1}])
+    assert [row['articleNo'] for row in result['rows']] == ['101', '102']
+    assert result['groups_checked'] == 1
+    assert result['list_requests'] == 1
+    assert client.calls[0]['sameAddressGroup'] is False
+
+
+def test_unchanged_group_skipped_within_ttl(tmp_path):
+    client = MemberClient()
+    expander = _expander(tmp_path, client)
+    expander.expand(AREA, [_group_row()])
+
+    result = expander.expand(AREA, [_group_row()])
+    assert result['rows'] == []
+    assert result['groups_checked'] == 0
+    assert result['members_skipped'] == 2
+    assert len(client.calls) == 1
+
+
+def test_changed_summary_refetches(tmp_path):
+    client = MemberClient()
+    expander = _expander(tmp_path, client)
+    expander.expand(AREA, [_group_row()])
+
+    result = expander.expand(AREA, [_group_row(min_price='2,500')])
+    assert result['groups_checked'] == 1
+    assert len(client.calls) == 2
+
+
+def test_expired_ttl_refetches(tmp_path, monkeypatch):
+    client = MemberClient()
+    expander = _expander(tmp_path, client)
+    expander.expand(AREA, [_group_row()])
+
+    monkeypatch.setitem(expander.config, 'member_ttl_hours', 0)
+    result = expander.expand(AREA, [_group_row()])
+    assert result['groups_checked'] == 1
+    assert len(client.calls) == 2
+    assert expander.listing_state.get_address_groups(['100'])['100']['member_nos'] == ['101', '102']
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+응답 아카이브 검증 - 목록 아카이브 키 구분, 상세 응답 아카이브 -> 재파싱 -> naver_properties 갱신 왕복
+python -m pytest test/test_archive_reparse.py
+"""
+
+import sys
+import os
+import json
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.synthetic import make_article_detail
+from collectors.naver_api_client import NaverAPIClient
+from database.fake_supabase import FakeSupabaseClient
+from database.optimized_repository import OptimizedPropertyRepository
+from database.property_rows import BUILDING_COLUMNS, build_property_row
+from database.response_archive import ResponseArchive
+from parsers.article_parser import ArticleParser
+from services.reparse_service import REPARSE_COLUMNS, ReparseService, get_reparse_columns
+
+ARTICLE_NOS = [str(2400000000 + index) for index in range(6)]
+
+
+@pytest.fixture
+def list_keys():
+    """get_area_articles가 요청 없이 (쿼리 파라미터, 아카이브 키)를 돌려주는 클라이언트"""
+    client = NaverAPIClient(token_source='mock', api_base_url='http://127.0.0.1:1/api')
+    client._make_request = lambda url, params, kind, archive_key: (params, archive_key)
+    return client.get_area_articles
+
+
+def _json_copy(values):
+    return json.loads(json.dumps(values, ensure_ascii=False, default=str))
+
+
+def test_list_key_separates_queries(list_keys):
+    _, plain = list_keys('1168010100', 1)
+    assert plain.startswith('1168010100:1:rank:')
+    assert list_keys('1168010100', 1)[1] == plain
+    assert list_keys('1168010100', 2)[1] != plain
+    assert list_keys('1168010100', 1, order='dateDesc')[1] != plain
+    assert list_keys('1168010100', 1, filters={'tradeType': 'B2'})[1] != plain
+    assert list_keys('1168010100', 1, filters={'sameAddressGroup': True})[1] != plain
+
+
+def test_list_key_band_intersects_filters(list_keys):
+    params, key = list_keys('1168010100', 1, filters={'priceMin': 1000, 'priceMax': 5000},
+                            band=('price', 3000, 9999))
+    assert (params['priceMin'], params['priceMax']) == (3000, 5000)
+    assert ':price=3000-9999:' in key
+
+
+def test_archive_reparse_round_trip(tmp_path):
+    archive = ResponseArchive(str(tmp_path / 'archive'))
+    raws = {article_no: make_article_detail(article_no) for article_no in ARTICLE_NOS}
+    for article_no, raw in raws.items():
+        archive.append('detail', article_no, json.dumps({'stale': True}).encode('utf-8'), fetched_at=1.0)
+        archive.append('detail', article_no, json.dumps(raw, ensure_ascii=False).encode('utf-8'))
+    archive.flush()
+    assert archive.get_latest('detail', ARTICLE_NOS[0]) == raws[ARTICLE_NOS[0]]
+
+    client = FakeSupabaseClient()
+    repository = OptimizedPropertyRepository(client=client)
+    stored = ARTICLE_NOS[:4]
+    for article_no in stored:
+        client.table('naver_properties').insert({'article_no': article_no, 'building_use': 'stale',
+                                                 'is_active': False}).execute()
+
+    stats = ReparseService(archive=archive, repository=repository, workers=1).run()
+    assert stats['articles'] == len(ARTICLE_NOS)
+    assert stats['parsed'] == len(ARTICLE_NOS)
+    assert (stats['updated'], stats['skipped'], stats['write_failed']) == (len(stored), 2, 0)
+
+    rows = {row['article_no']: row for row in client.tables['naver_properties'].values()}
+    assert sorted(rows) == stored
+    parser = ArticleParser()
+    for article_no in stored:
+        expected = build_property_row(parser.parse_article_record(raws[article_no], article_no))
+        assert _json_copy({column: rows[article_no][column] for column in REPARSE_COLUMNS}) == \
+            _json_copy({column: expected[column] for column in REPARSE_COLUMNS})
+        assert rows[article_no]['is_active'] is False
+
+
+def test_reparse_columns_without_building_table(monkeypatch):
+    monkeypatch.setenv('NAVER_BUILDING_TABLE', 'true')
+    columns = get_reparse_columns()
+    assert not set(BUILDING_COLUMNS) & set(columns)
+    with pytest.raises(ValueError):
+        ReparseService(archive=object())._resolve_columns(['building_structure'])
+
+    monkeypatch.setenv('NAVER_BUILDING_TABLE', 'false')
+    assert set(BUILDING_COLUMNS) <= set(get_reparse_columns())
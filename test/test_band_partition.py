@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+면적/가격 구간 분할 검증 - [하한, 상한) 구간 나누기, 기본 경계/직전 구간 구성, API 파라미터 상한
+python -m pytest test/test_band_partition.py
+"""
+
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.listing_state import ListingStateStore
+from services.band_partition import BandPartitioner, band_value, split_band
+
+
+def test_split_at_sample_median():
+    halves = split_band({'min': 0, 'max': 1000, 'total': 400}, [100, 200, 300])
+    assert halves == [{'min': 0, 'max': 200, 'total': None}, {'min': 200, 'max': 1000, 'total': None}]
+
+
+def test_split_falls_back_to_geometric_mean():
+    # 표본이 모두 하한이면 넓은 범위는 기하 평균에서 나눔
+    halves = split_band({'min': 0, 'max': 100, 'total': 400}, [0, 0, 0])
+    assert [(half['min'], half['max']) for half in halves] == [(0, 10), (10, 100)]
+
+
+def test_split_fractional_bounds():
+    halves = split_band({'min': 49.5, 'max': 50, 'total': 400}, [], resolution=0.01)
+    assert [(half['min'], half['max']) for half in halves] == [(49.5, 49.75), (49.75, 50)]
+
+
+def test_split_below_resolution_is_none():
+    assert split_band({'min': 10, 'max': 10.01, 'total': 400}, [10, 10], resolution=0.01) is None
+    assert split_band({'min': 5, 'max': 6, 'total': 400}, [5], resolution=1) is None
+
+
+def test_band_value():
+    assert band_value({'area1': 49.5}, 'area') == 49.5
+    assert band_value({'area1': None}, 'area') is None
+    assert band_value({'dealOrWarrantPrc': '1억 5,000'}, 'price') == 15000
+
+
+def test_default_bands_are_contiguous():
+    bands = BandPartitioner(None, dimension='area').initial_bands('1168010100')
+    assert bands[0]['min'] == 0
+    assert bands[-1]['max'] == 900000000
+    assert all(before['max'] == current['min'] for before, current in zip(bands, bands[1:]))
+
+
+def test_default_bands_clipped_to_filter_range():
+    bands = BandPartitioner(None, dimension='price').initial_bands('1168010100', {'priceMin': 1000, 'priceMax': 5000})
+    assert [(band['min'], band['max']) for band in bands] == [(1000, 3000), (3000, 5000)]
+
+
+def test_query_bounds_exclude_band_max():
+    partitioner = BandPartitioner(None, dimension='area')
+    assert partitioner.query_bounds({'min': 49.5, 'max': 100}) == (49.5, 99.99)
+    assert partitioner.query_bounds({'min': 800, 'max': 900000000}) == (800, 900000000)
+
+    partitioner = BandPartitioner(None, dimension='price')
+    filters = {'priceMin': 1000, 'priceMax': 5000}
+    assert partitioner.query_bounds({'min': 1000, 'max': 3000}, filters) == (1000, 2999)
+    assert partitioner.query_bounds({'min': 3000, 'max': 5000}, filters) == (3000, 5000)
+
+
+def test_previous_layout_merges_sparse_bands(tmp_path):
+    state = ListingStateStore(str(tmp_path / 'state.db'))
+    state.save_area_bands('1168010100', 'area', [
+        {'min': 0, 'max': 49.5, 'total': 5},
+        {'min': 49.5, 'max': 50, 'total': 5},
+        {'min': 50, 'max': 900000000, 'total': 100}
+    ])
+    bands = BandPartitioner(None, listing_state=state, dimension='area').initial_bands('1168010100')
+    assert [(band['min'], band['max'], band['total']) for band in bands] == [(0, 50, 10), (50, 900000000, 100)]
+
+
+def test_previous_layout_with_other_range_ignored(tmp_path):
+    state = ListingStateStore(str(tmp_path / 'state.db'))
+    state.save_area_bands('1168010100', 'price', [
+        {'min': 0, 'max': 3000, 'total': 50},
+        {'min': 3000, 'max': 900000000, 'total': 50}
+    ])
+    partitioner = BandPartitioner(None, listing_state=state, dimension='price')
+    bands = partitioner.initial_bands('1168010100', {'priceMin': 1000, 'priceMax': 5000})
+    assert bands[0]['min'] == 1000 and bands[-1]['max'] == 5000
+    assert all(band['total'] is None for band in bands)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+사이클 계획 검증 - 실행 기록 기반 요청당 소요 시간, 마감/요청 예산 용량, 요청당 가치 순 선택
+python -m pytest test/test_cycle_planner.py
+"""
+
+import sys
+import os
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.listing_state import ListingStateStore
+from database.run_ledger import RunLedger, build_run_record
+from services.cycle_planner import CyclePlanner, parse_deadline
+
+AREAS = [
+    {'name': '역삼동', 'code': '1168010100', 'priority': 100},
+    {'name': '개포동', 'code': '1168010300', 'priority': 10}
+]
+
+
+class FakeAPIClient:
+    request_count = 0
+
+
+class FakeRepository:
+    def count_recent_changes(self, article_nos, since):
+        return None  # 변경 이력 조회 실패 -> 기본 변경률
+
+
+class FakeProgress:
+    def estimate_seconds(self, area_codes, mode=None):
+        return 0.0
+
+
+class FakeService:
+    def __init__(self, state_path: str):
+        self.api_client = FakeAPIClient()
+        self.listing_state = ListingStateStore(state_path)
+        self.progress = FakeProgress()
+        self.repository = FakeRepository()
+
+    def discover_and_save_area(self, cortar_no, max_pages=None, max_articles=None):
+        pass
+
+    def collect_and_save_area(self, cortar_no, max_pages=None, max_articles=None):
+        pass
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setenv('NAVER_REQUEST_DELAY_MIN', '1.0')
+    monkeypatch.setenv('NAVER_REQUEST_DELAY_MAX', '1.0')
+    monkeypatch.setenv('NAVER_PARALLEL_WORKERS', '2')
+    return FakeService(str(tmp_path / 'state.db'))
+
+
+def _ledger(tmp_path, runs):
+    ledger = RunLedger(str(tmp_path / 'runs.db'))
+    for index, (duration, api_calls, status) in enumerate(runs):
+        ledger.record_run({'started_at': index, 'finished_at': index + duration, 'duration': duration,
+                           'mode': 'full', 'status': status, 'api_calls': api_calls})
+    return ledger
+
+
+def test_seconds_per_request_from_ledger(service, tmp_path):
+    ledger = _ledger(tmp_path, [(100, 50, 'completed'), (30, 10, 'completed'), (10, 10, 'completed'),
+                                (500, 10, 'failed'), (10, 0, 'completed')])
+    assert CyclePlanner(service, AREAS, ledger=ledger).prior_seconds_per_request == 2.0
+
+
+def test_seconds_per_request_floor_is_current_delay(service, tmp_path):
+    ledger = _ledger(tmp_path, [(1, 10, 'completed')])
+    # 평균 요청 간격 1초 / 워커 2개
+    assert CyclePlanner(service, AREAS, ledger=ledger).prior_seconds_per_request == 0.5
+
+
+def test_seconds_per_request_without_history(service, tmp_path):
+    planner = CyclePlanner(service, AREAS, ledger=_ledger(tmp_path, []))
+    assert planner.prior_seconds_per_request == pytest.approx((1.0 + planner.config['request_latency']) / 2)
+
+
+def test_remaining_requests(service, tmp_path):
+    ledger = _ledger(tmp_path, [(20, 10, 'completed')])
+    assert CyclePlanner(service, AREAS, ledger=ledger).remaining_requests() is None
+
+    planner = CyclePlanner(service, AREAS, request_budget=10, ledger=ledger)
+    service.api_client.request_count += 3
+    assert planner.remaining_requests() == 7
+
+    deadline = time.time() + 100
+    planner = CyclePlanner(service, AREAS, deadline=deadline, request_budget=1000, ledger=ledger)
+    expected = 100 * planner.config['safety_margin'] / 2.0
+    assert planner.remaining_requests() == pytest.approx(expected, rel=0.01)
+
+    service.api_client.request_count += 2000
+    assert planner.remaining_requests() == 0.0
+
+
+def test_plan_fills_capacity_by_value_per_request(service, tmp_path):
+    state = service.listing_state
+    state.mark_seen_many(AREAS[1]['code'], {'1': 'a', '2': 'b'}, saved=True)
+    state.set_refresh_schedule('1', None, 0, None, time.time() - 10)
+    state.set_refresh_schedule('2', None, 0, None, time.time() - 10)
+
+    ledger = _ledger(tmp_path, [(20, 10, 'completed')])
+    unlimited = CyclePlanner(service, AREAS, ledger=ledger).plan()
+    assert unlimited['capacity'] is None and unlimited['deferred'] == []
+    assert sum(unit['requests'] for unit in unlimited['units']) == pytest.approx(2 * 7 + 2)
+    refresh = [unit for unit in unlimited['units'] if unit['kind'] == 'refresh']
+    assert len(refresh) == 1 and sorted(refresh[0]['article_nos']) == ['1', '2']
+
+    # 신규 탐색 1회 = 목록 1페이지 + 기대 변경 6건 (기본 변경률 1건/시간 x 최대 주기 6시간)
+    plan = CyclePlanner(service, AREAS, request_budget=9, ledger=ledger).plan()
+    assert sum(unit['requests'] for unit in plan['units']) <= 9
+    assert [unit['kind'] for unit in plan['units']] == ['discover', 'refresh']
+    assert plan['units'][0]['area']['code'] == AREAS[0]['code']
+    assert [item['kind'] for item in plan['deferred']] == ['discover']
+
+    values = [unit['value'] / unit['requests'] for unit in plan['units']]
+    assert values == sorted(values, reverse=True)
+
+
+def test_run_record_rates():
+    stats = {'collection_stats': {'total_processed': 30, 'successful_collections': 28, 'parsing_failures': 1,
+                                  'save_failures': 1, 'detail_requests_avoided': 5, 'refresh_skipped': 2},
+             'api_stats': {'total_requests': 40}}
+    record = build_run_record(stats, 'full', ['1', '1', '2'], started_at=100.0, finished_at=160.0)
+    assert record['duration'] == 60.0
+    assert record['articles_per_sec'] == 0.5
+    assert record['articles_skipped'] == 7
+    assert record['areas'] == ['1', '2']
+
+
+def test_parse_deadline():
+    now = time.mktime((2026, 1, 1, 12, 0, 0, 0, 0, -1))
+    assert parse_deadline('3600', now) == now + 3600
+    assert parse_deadline('13:30', now) == now + 5400
+    assert parse_deadline('11:00', now) == now + 23 * 3600
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+위경도 타일 분할 검증 - 타일 경계, 타일 간 중복 제거, 요청 수 상한
+python -m pytest test/test_geo_tiles.py
+"""
+
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.geo_tiles import TiledListFetcher, split_bounds
+
+BOUNDS = (37.49, 127.02, 37.51, 127.05)
+
+
+class PagedClient:
+    """타일마다 같은 매물 2개를 돌려주고 pages 페이지까지 isMoreData=True"""
+
+    def __init__(self, pages: int = 1):
+        self.pages = pages
+        self.calls = []
+
+    def get_area_articles(self, cortar_no, page, filters=None, order='rank', bounds=None):
+        self.calls.append((bounds, page))
+        return {'articleList': [{'articleNo': '1'}, {'articleNo': f"{bounds}:{page}"}],
+                'isMoreData': page < self.pages}
+
+
+def test_split_bounds_grid():
+    tiles = split_bounds(BOUNDS, 2)
+    assert len(tiles) == 4
+    # 북서쪽부터 행 우선
+    assert tiles[0] == (37.5, 127.02, 37.51, 127.035)
+    assert tiles[-1] == (37.49, 127.035, 37.5, 127.05)
+
+
+def test_split_bounds_cover_area():
+    tiles = split_bounds(BOUNDS, 3)
+    assert min(tile[0] for tile in tiles) == BOUNDS[0]
+    assert min(tile[1] for tile in tiles) == BOUNDS[1]
+    assert max(tile[2] for tile in tiles) == BOUNDS[2]
+    assert max(tile[3] for tile in tiles) == BOUNDS[3]
+    area = (BOUNDS[2] - BOUNDS[0]) * (BOUNDS[3] - BOUNDS[1])
+    assert abs(sum((n - s) * (e - w) for s, w, n, e in tiles) - area) < 1e-9
+
+
+def test_single_tile_is_whole_area():
+    assert split_bounds(BOUNDS, 1) == [BOUNDS]
+
+
+def test_fetch_deduplicates_across_tiles(monkeypatch):
+    monkeypatch.setenv('NAVER_TILE_GRID', '2')
+    result = TiledListFetcher(PagedClient(), max_workers=2).fetch('1168010100', BOUNDS, seen=['x'])
+    assert result['tiles'] == 4
+    assert result['list_requests'] == 4
+    assert result['duplicates'] == 3
+    assert len(result['rows']) == 5
+    assert result['seen'] == {'x'} | {str(row['articleNo']) for row in result['rows']}
+
+
+def test_fetch_respects_request_budget(monkeypatch):
+    monkeypatch.setenv('NAVER_TILE_GRID', '2')
+    client = PagedClient(pages=10)
+    result = TiledListFetcher(client, max_workers=2).fetch('1168010100', BOUNDS, max_requests=5)
+    assert result['list_requests'] == 5
+    assert len(client.calls) == 5
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+목록 사전 필터 검증 - 거래유형 코드(A1 매매, B1 전세, B2 월세, B3 단기임대)와 가격 조건
+python -m pytest test/test_list_filter.py
+"""
+
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.list_filter import ListPrefilter
+
+
+def _row(trade_type='B2', deposit='3,000', rent='300', **extra):
+    row = {'articleNo': '1', 'realEstateTypeCode': 'SMS', 'tradeTypeCode': trade_type,
+           'dealOrWarrantPrc': deposit, 'rentPrc': rent}
+    row.update(extra)
+    return row
+
+
+def test_monthly_rent_row_survives():
+    prefilter = ListPrefilter()
+    assert prefilter.get_rejection_reason(_row()) is None
+    assert prefilter.filter_rows([_row()]) == [_row()]
+
+
+def test_excluded_trade_types_rejected():
+    prefilter = ListPrefilter()
+    for trade_type in ('A1', 'B1', 'B3'):
+        assert prefilter.get_rejection_reason(_row(trade_type)) == 'trade_type'
+
+
+def test_query_requests_monthly_rent_only():
+    assert ListPrefilter().build_query_params()['tradeType'] == 'B2'
+
+
+def test_missing_price_rejected_by_min():
+    prefilter = ListPrefilter()
+    assert prefilter.get_rejection_reason(_row(deposit=None)) == 'deposit'
+    assert prefilter.get_rejection_reason(_row(rent='')) == 'monthly_rent'
+    assert prefilter.get_rejection_reason(_row(rent='협의')) == 'monthly_rent'
+
+
+def test_price_limits():
+    prefilter = ListPrefilter()
+    assert prefilter.get_rejection_reason(_row(deposit='500')) == 'deposit'
+    assert prefilter.get_rejection_reason(_row(deposit='6억')) == 'deposit'
+    assert prefilter.get_rejection_reason(_row(rent='150')) == 'monthly_rent'
+    assert prefilter.get_rejection_reason(_row(deposit='1억 5,000', rent='1,200')) is None
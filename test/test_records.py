@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+ArticleRecord 변환 검증 - 섹션 dict 파서 결과와 레코드 필드, typed 디코더 경로 비교
+python -m pytest test/test_records.py
+"""
+
+import sys
+import os
+import json
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.synthetic import make_article_detail
+from parsers.article_parser import ArticleParser
+from parsers.records import ArticleRecord
+from parsers.response_decoder import HAS_MSGSPEC, decode_response
+
+ARTICLE_NOS = [str(2400000000 + index) for index in range(20)]
+
+
+def _without_timestamp(record: ArticleRecord) -> dict:
+    values = record.to_dict()
+    values.pop('parsed_at')
+    return values
+
+
+def test_record_matches_dict_parser():
+    parser = ArticleParser()
+    for article_no in ARTICLE_NOS:
+        raw = make_article_detail(article_no)
+        parsed = parser.parse_article_detail(raw, article_no)
+        record = parser.parse_article_record(raw, article_no)
+        assert _without_timestamp(record) == _without_timestamp(ArticleRecord.from_parsed(parsed))
+
+
+def test_record_fields_from_sections():
+    parser = ArticleParser()
+    for article_no in ARTICLE_NOS:
+        sections = parser.parse_article_detail(make_article_detail(article_no), article_no)['sections']
+        record = ArticleRecord.from_sections(article_no, sections)
+        detail, space = sections['articleDetail'], sections['articleSpace']
+
+        assert record.article_no == article_no
+        assert record.trade_type == detail.get('trade_type')
+        assert record.building_use == detail.get('building_name')
+        assert record.exclusive_area == space.get('exclusive_area')
+        assert record.monthly_management_cost == detail.get('manage_cost')
+        assert len(record.photos) == len(sections['articlePhotos']['photos'])
+        if record.trade_type_code == 'B2':
+            assert record.warrant_price == sections['articlePrice'].get('warrant_price')
+            assert record.rent_price == sections['articlePrice'].get('rent_price')
+        else:
+            assert record.rent_price is None
+
+
+@pytest.mark.skipif(not HAS_MSGSPEC, reason='msgspec 미설치')
+def test_typed_decoder_builds_same_record():
+    parser = ArticleParser()
+    for article_no in ARTICLE_NOS:
+        raw = make_article_detail(article_no)
+        typed = decode_response(json.dumps(raw, ensure_ascii=False).encode('utf-8'), 'detail', 'typed')
+        assert _without_timestamp(parser.parse_article_record(typed, article_no)) == \
+            _without_timestamp(parser.parse_article_record(raw, article_no))
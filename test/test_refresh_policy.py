@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+매물별 재수집 주기(TTL) 검증 - 변경 이력에 따른 TTL, listing_state 재수집 대상 조회
+python -m pytest test/test_refresh_policy.py
+"""
+
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+from database.listing_state import ListingStateStore
+from services.refresh_policy import compute_next_refresh, parse_expose_start
+
+NOW = 1760000000.0
+DAY = 24 * 3600
+AREA = '1168010100'
+
+
+def _ttl(**history) -> float:
+    return compute_next_refresh(now=NOW, **history) - NOW
+
+
+def test_ttl_shrinks_with_change_count():
+    first_seen_at = NOW - 30 * DAY
+    quiet = _ttl(first_seen_at=first_seen_at, change_count=0)
+    busy = _ttl(first_seen_at=first_seen_at, change_count=20)
+    assert busy < quiet
+
+
+def test_recent_change_halves_ttl():
+    first_seen_at = NOW - 30 * DAY
+    old = _ttl(first_seen_at=first_seen_at, change_count=20, last_changed_at=first_seen_at)
+    recent = _ttl(first_seen_at=first_seen_at, change_count=20, last_changed_at=NOW - 60)
+    assert abs(recent - old / 2) < 1e-6
+
+
+def test_ttl_clamped():
+    config = settings.refresh_settings
+    assert _ttl() == config['min_ttl']
+    assert _ttl(first_seen_at=NOW - 365 * DAY, expose_start_at=NOW - 365 * DAY) == config['max_ttl']
+    assert _ttl(first_seen_at=NOW - DAY, change_count=1000) == config['min_ttl']
+
+
+def test_expose_start_parsing():
+    assert parse_expose_start('20250101') == parse_expose_start('2025-01-01')
+    assert parse_expose_start('2025') is None
+    assert parse_expose_start(None) is None
+
+
+def test_refresh_candidates_follow_schedule(tmp_path):
+    state = ListingStateStore(str(tmp_path / 'state.db'))
+    state.mark_seen_many(AREA, {'overdue': 'a', 'scheduled': 'b', 'unscheduled': 'c'}, saved=True)
+    state.mark_seen_many(AREA, {'unsaved': 'd'})
+    now = state.get_listing('overdue')['last_saved_at']
+
+    state.set_refresh_schedule('overdue', None, 0, None, now - 10)
+    state.set_refresh_schedule('scheduled', now - 60, 3, None, now + 3600)
+
+    due = [candidate['article_no'] for candidate in state.get_refresh_candidates([AREA], now, default_ttl=DAY)]
+    assert due == ['overdue']
+
+    # 재수집 시각이 없으면 마지막 저장 + default_ttl
+    later = now + DAY
+    due = [candidate['article_no'] for candidate in state.get_refresh_candidates([AREA], later, default_ttl=DAY)]
+    assert due == ['overdue', 'scheduled', 'unscheduled']
+    assert state.get_refresh_candidates(['1168010200'], later, default_ttl=DAY) == []
+
+
+def test_refresh_schedule_keeps_change_history(tmp_path):
+    state = ListingStateStore(str(tmp_path / 'state.db'))
+    state.mark_seen_many(AREA, {'1': 'a'}, saved=True)
+    state.set_refresh_schedule('1', NOW - 60, 2, NOW - 10 * DAY, NOW + 3600)
+    state.set_refresh_schedule('1', NOW, 3, None, NOW + 7200)
+
+    listing = state.get_listing('1')
+    assert listing['change_count'] == 3
+    assert listing['last_changed_at'] == NOW
+    assert listing['expose_start_at'] == NOW - 10 * DAY
+    assert state.get_refresh_states(['1', '2']) == {'1': {'fingerprint': 'a', 'next_refresh_at': NOW + 7200}}